@@ -9,6 +9,7 @@ import os
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 
@@ -29,6 +30,8 @@ class Config:
         self.supabase_url = self._get_required("SUPABASE_URL")
         self.supabase_anon_key = self._get_required("SUPABASE_ANON_KEY")
         self.supabase_service_role_key = self._get_required("SUPABASE_SERVICE_ROLE_KEY")
+        # Optional: lets storage sign URLs locally instead of via the API
+        self.supabase_jwt_secret = os.getenv("SUPABASE_JWT_SECRET", "")
 
         # API Keys
         self.elevenlabs_api_key = self._get_required("ELEVENLABS_API_KEY")
@@ -78,6 +81,11 @@ class Config:
             "DEFAULT_VOICE_MODEL", "eleven_multilingual_v2"
         )
         self.audio_streaming_latency = int(os.getenv("AUDIO_STREAMING_LATENCY", "2"))
+        # Stream LLM text into ElevenLabs over its input WebSocket (Vocode's
+        # experimental synthesizer, so opt-in)
+        self.elevenlabs_websocket = (
+            os.getenv("ELEVENLABS_WEBSOCKET", "false").lower() == "true"
+        )
 
         # Storage Configuration
         self.storage_bucket_name = os.getenv("STORAGE_BUCKET_NAME", "newsletter-audio")
@@ -85,10 +93,19 @@ class Config:
             "AUDIO_BASE_URL",
             f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket_name}/",
         )
+        self.storage_skip_bucket_check = (
+            os.getenv("STORAGE_SKIP_BUCKET_CHECK", "false").lower() == "true"
+        )
 
         # Rate Limiting Configuration
         self.gmail_api_rate_limit = int(os.getenv("GMAIL_API_RATE_LIMIT", "100"))
         self.elevenlabs_rate_limit = int(os.getenv("ELEVENLABS_RATE_LIMIT", "20"))
+        # Requests per minute
+        self.openai_rate_limit = int(os.getenv("OPENAI_RATE_LIMIT", "500"))
+        self.openai_max_concurrency = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+        self.openai_prewarm_followups = (
+            os.getenv("OPENAI_PREWARM_FOLLOWUPS", "false").lower() == "true"
+        )
 
         # Frontend Configuration
         self.frontend_api_base_url = os.getenv(
@@ -273,6 +290,26 @@ async def get_database_session():
             await session.close()
 
 
+@asynccontextmanager
+async def get_readonly_database_session():
+    """
+    Get async database session context manager for read-only work.
+
+    Autoflush is disabled and, on PostgreSQL, the transaction is marked
+    READ ONLY. Nothing is committed; the transaction is simply discarded
+    when the session closes.
+    """
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        session.autoflush = False
+        if get_database_engine().dialect.name == "postgresql":
+            await session.execute(text("SET TRANSACTION READ ONLY"))
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 # Create a settings alias for convenience (matches PRP pseudocode)
 settings = config
 
@@ -27,8 +27,10 @@ from backend.models.schemas import (
 )
 from backend.routes.auth import auth_bp
 from backend.services.session_manager import BriefingSessionManager
-from backend.utils.auth import require_auth
+from backend.services.storage_service import get_storage_service
+from backend.utils.auth import close_http_client, require_auth
 from backend.voice.conversation_manager import conversation_pool
+from backend.voice.openai_client import close_openai_client
 
 # Configure logging
 logging.basicConfig(
@@ -175,6 +177,11 @@ async def shutdown():
     # Cleanup all active conversations
     await conversation_pool.cleanup_all()
 
+    # Release pooled HTTP connections
+    await get_storage_service().aclose()
+    await close_http_client()
+    await close_openai_client()
+
     logger.info("✅ Application shutdown complete")
 
 
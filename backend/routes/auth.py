@@ -21,6 +21,7 @@ from backend.utils.auth import (
     create_refresh_token,
     generate_state_token,
     get_google_user_info,
+    invalidate_cached_user,
     require_auth,
     verify_token,
 )
@@ -129,7 +130,7 @@ async def google_callback():
         credentials = flow.credentials
 
         # Get user information from Google
-        user_info = get_google_user_info(credentials)
+        user_info = await get_google_user_info(credentials)
 
         # Create or update user in database
         async with get_database_session() as db:
@@ -291,24 +292,30 @@ async def update_profile():
         Updated user profile
     """
     try:
-        user = g.current_user
         data = await request.get_json()
 
-        # Update allowed fields
-        if "name" in data:
-            user.name = data["name"]
-        if "default_voice_type" in data:
-            user.default_voice_type = data["default_voice_type"]
-        if "default_playback_speed" in data:
-            user.default_playback_speed = float(data["default_playback_speed"])
-        if "summarization_depth" in data:
-            user.summarization_depth = data["summarization_depth"]
-
+        # Reason: g.current_user is a shared read-only snapshot, so the
+        # update is applied to a fresh instance owned by this session
         async with get_database_session() as db:
-            db.add(user)
+            user = await db.get(User, g.current_user.id)
+            if not user:
+                return jsonify({"error": "User not found"}), 404
+
+            # Update allowed fields
+            if "name" in data:
+                user.name = data["name"]
+            if "default_voice_type" in data:
+                user.default_voice_type = data["default_voice_type"]
+            if "default_playback_speed" in data:
+                user.default_playback_speed = float(data["default_playback_speed"])
+            if "summarization_depth" in data:
+                user.summarization_depth = data["summarization_depth"]
+
             await db.commit()
             await db.refresh(user)
 
+        invalidate_cached_user(str(user.id))
+
         return jsonify(
             {
                 "id": str(user.id),
@@ -367,4 +374,5 @@ async def get_or_create_user(
 
     await db.commit()
     await db.refresh(user)
+    invalidate_cached_user(str(user.id))
     return user
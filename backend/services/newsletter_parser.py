@@ -9,6 +9,7 @@ import logging
 import re
 from datetime import datetime
 
+import orjson
 from bs4 import BeautifulSoup
 from openai import AsyncOpenAI
 
@@ -300,9 +301,7 @@ class NewsletterParser:
             )
 
             # Parse JSON response
-            import json
-
-            stories = json.loads(response.choices[0].message.content)
+            stories = orjson.loads(response.choices[0].message.content)
 
             # Validate stories
             valid_stories = []
@@ -436,9 +435,7 @@ class NewsletterParser:
             )
 
             # Parse response
-            import json
-
-            summaries = json.loads(response.choices[0].message.content)
+            summaries = orjson.loads(response.choices[0].message.content)
 
             # Extract URLs if present
             url_match = re.search(r'https?://[^\s<>"]+', story_text)
@@ -6,10 +6,13 @@ story, managing story progression, and providing detailed summaries on request.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from backend.models.database import (
     Issue,
@@ -21,6 +24,66 @@ from backend.models.database import (
 
 logger = logging.getLogger(__name__)
 
+# Loaded stories shared across briefing sessions. Story content is fixed once
+# ingested, so the story after the current one is prefetched alongside it and
+# skip/tell-me-more turns are served without another round trip. Cached
+# stories are detached from the session that loaded them (with their issue
+# and newsletter already loaded) and must be treated as read-only.
+STORY_CACHE_MAX_SIZE = 1024
+STORY_CACHE_TTL_SECONDS = 300
+_story_cache: OrderedDict[str, tuple[Story, float]] = OrderedDict()
+
+
+def _get_cached_story(story_id: UUID | str) -> Story | None:
+    """
+    Get a cached story if the entry has not expired.
+
+    Args:
+        story_id: ID of the story
+
+    Returns:
+        Cached story or None on a miss
+    """
+    key = str(story_id)
+    entry = _story_cache.get(key)
+    if entry is None:
+        return None
+
+    story, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _story_cache[key]
+        return None
+
+    _story_cache.move_to_end(key)
+    return story
+
+
+def _cache_story(db: AsyncSession, story: Story) -> None:
+    """
+    Cache a loaded story for other sessions.
+
+    Stories whose audio is still being generated are skipped so the audio
+    URL filled in later by the audio job is not hidden by a stale entry.
+    Cached stories are expunged, along with their issue and newsletter, so
+    the loading session's refreshes, expiry or lazy loads never reach
+    objects other sessions are reading.
+
+    Args:
+        db: Session the story was loaded in
+        story: Story to cache, with its issue and newsletter loaded
+    """
+    if not story.summary_audio_url:
+        return
+
+    issue = story.issue
+    for instance in (story, issue, issue.newsletter if issue else None):
+        if instance is not None and instance in db:
+            db.expunge(instance)
+
+    _story_cache[str(story.id)] = (story, time.monotonic() + STORY_CACHE_TTL_SECONDS)
+    if len(_story_cache) > STORY_CACHE_MAX_SIZE:
+        _story_cache.popitem(last=False)
+
 
 class BriefingSessionManager:
     """
@@ -88,8 +151,11 @@ class BriefingSessionManager:
             logger.warning(f"Session {session_id} not found or has no current story")
             return None
 
-        # Get current story
-        current_story = await self.db.get(Story, session.current_story_id)
+        # Get current story, prefetching the one after it
+        current_story = await self._get_story(
+            session.current_story_id,
+            self._story_id_at(session, session.current_story_index + 1),
+        )
         if not current_story:
             logger.error(
                 f"Current story {session.current_story_id} not found for session {session_id}"
@@ -98,6 +164,61 @@ class BriefingSessionManager:
 
         return current_story
 
+    @staticmethod
+    def _story_id_at(session: ListeningSession, index: int) -> UUID | None:
+        """
+        Get the story ID at a position in the session's story order.
+
+        Args:
+            session: Listening session
+            index: Position in the story order
+
+        Returns:
+            Story ID or None if the index is past the end
+        """
+        if 0 <= index < len(session.story_order):
+            return session.story_order[index]
+        return None
+
+    async def _get_story(
+        self, story_id: UUID, prefetch_id: UUID | None = None
+    ) -> Story | None:
+        """
+        Load a story from the shared cache or the database.
+
+        On a cache miss, the story at ``prefetch_id`` is loaded in the same
+        query so the next skip or follow-up finds it cached. Returned stories
+        may be shared with other sessions and must not be modified.
+
+        Args:
+            story_id: ID of the story to load
+            prefetch_id: ID of a story to prefetch alongside it
+
+        Returns:
+            Story or None if not found
+        """
+        story = _get_cached_story(story_id)
+        if story is not None:
+            return story
+
+        story_ids = [story_id]
+        if prefetch_id is not None and _get_cached_story(prefetch_id) is None:
+            story_ids.append(prefetch_id)
+
+        # Reason: load the issue and newsletter up front; a cached story is
+        # detached, so they could not be lazy-loaded later
+        result = await self.db.execute(
+            select(Story)
+            .where(Story.id.in_(story_ids))
+            .options(joinedload(Story.issue).joinedload(Issue.newsletter))
+        )
+        for loaded in result.scalars():
+            _cache_story(self.db, loaded)
+            if str(loaded.id) == str(story_id):
+                story = loaded
+
+        return story
+
     async def advance_story(self, session_id: UUID) -> Story | None:
         """
         Move to next story in the session.
@@ -130,8 +251,10 @@ class BriefingSessionManager:
 
         await self.db.commit()
 
-        # Get next story
-        next_story = await self.db.get(Story, next_story_id)
+        # Get next story (usually prefetched), prefetching the one after it
+        next_story = await self._get_story(
+            next_story_id, self._story_id_at(session, next_index + 1)
+        )
         if not next_story:
             logger.error(
                 f"Next story {next_story_id} not found for session {session_id}"
@@ -159,33 +282,56 @@ class BriefingSessionManager:
 
         return current_story.full_text_summary
 
-    async def get_story_metadata(self, session_id: UUID) -> dict | None:
+    async def get_story_metadata(
+        self, session_id: UUID, current_story: Story | None = None
+    ) -> dict | None:
         """
         Get metadata for the current story.
 
         Args:
             session_id: ID of the listening session
+            current_story: Current story if the caller already loaded it
 
         Returns:
             Dictionary with story metadata or None if not available
         """
-        current_story = await self.get_current_story(session_id)
-        if not current_story:
-            return None
-
-        # Get issue and newsletter information
-        issue = await self.db.get(Issue, current_story.issue_id)
-        if not issue:
-            return None
-
-        newsletter_query = select(Newsletter).where(
-            Newsletter.id == issue.newsletter_id
-        )
-        result = await self.db.execute(newsletter_query)
-        newsletter = result.scalar_one_or_none()
-
-        if not newsletter:
-            return None
+        if current_story is None:
+            current_story = await self.get_current_story(session_id)
+            if not current_story:
+                return None
+
+        # Stories from _get_story arrive with issue and newsletter eager-loaded;
+        # only a story loaded elsewhere needs the extra round trip
+        issue = newsletter = None
+        if "issue" not in inspect(current_story).unloaded:
+            issue = current_story.issue
+            if issue is not None and "newsletter" not in inspect(issue).unloaded:
+                newsletter = issue.newsletter
+
+        if newsletter is None:
+            metadata_query = (
+                select(Issue, Newsletter)
+                .join(Newsletter, Newsletter.id == Issue.newsletter_id)
+                .where(Issue.id == current_story.issue_id)
+            )
+            result = await self.db.execute(metadata_query)
+            row = result.one_or_none()
+
+            if not row:
+                return None
+            issue, newsletter = row
+
+        # Spoken phrasings are rendered here, once per lookup, so voice actions
+        # only do dict reads instead of re-parsing the ISO date per question
+        formatted_date = issue.date.strftime("%B %d, %Y") if issue.date else None
+        source_line = f"This story is from {newsletter.name}"
+        if newsletter.publisher:
+            source_line += f", published by {newsletter.publisher}"
+        summary_line = source_line
+        if formatted_date:
+            summary_line += f", from {formatted_date}"
+        if issue.subject:
+            summary_line += f". The issue was titled: {issue.subject}"
 
         return {
             "headline": current_story.headline,
@@ -194,6 +340,9 @@ class BriefingSessionManager:
             "issue_date": issue.date.isoformat() if issue.date else None,
             "issue_subject": issue.subject,
             "story_url": current_story.url,
+            "formatted_date": formatted_date,
+            "source_line": source_line,
+            "summary_line": f"{summary_line}.",
         }
 
     async def get_session_progress(self, session_id: UUID) -> dict | None:
@@ -6,18 +6,57 @@ newsletter audio files with proper error handling and optimization.
 """
 
 import asyncio
+import base64
 import logging
+import random
+import time
 import uuid
-from datetime import datetime, timedelta
-from pathlib import Path
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+from typing import BinaryIO
+from urllib.parse import quote
 
-from supabase import AsyncClient, create_async_client
+import httpx
+import jwt
+import orjson
+from supabase import AsyncClient, AsyncClientOptions, create_async_client
 
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
 config = get_config()
 
+# Audio payloads may be raw bytes, a seekable file object, or a factory that
+# returns a fresh async byte iterator (called once per upload attempt).
+AudioSource = bytes | BinaryIO | Callable[[], AsyncIterator[bytes]]
+
+# Shared stand-in for entries without metadata, avoids a {} per lookup
+_EMPTY_METADATA: dict = {}
+
+# Buckets confirmed to exist in this process; bucket existence doesn't change
+# while the service is running, so each bucket is probed at most once.
+_bucket_verified: set[str] = set()
+
+
+def _list_options(limit: int, offset: int, sort_by: str) -> dict:
+    """
+    Build storage3 list options for one page of a directory listing.
+
+    Args:
+        limit: Maximum number of entries in the page.
+        offset: Number of entries to skip.
+        sort_by: Column to sort the listing by, ascending.
+
+    Returns:
+        Options dict for ``bucket.list(path, options)``.
+    """
+    return {
+        "limit": limit,
+        "offset": offset,
+        "sortBy": {"column": sort_by, "order": "asc"},
+    }
+
 
 class StorageService:
     """
@@ -27,27 +66,101 @@ class StorageService:
     with proper error handling, optimization, and cleanup.
     """
 
+    # Reason: long-lived singleton touched on every storage call; slots give
+    # fixed-offset attribute access and drop the per-instance __dict__.
+    __slots__ = (
+        "supabase_client",
+        "http_client",
+        "bucket_name",
+        "base_url",
+        "max_file_size",
+        "supported_formats",
+        "_supported_suffixes",
+        "_supported_formats_set",
+        "cleanup_threshold_days",
+        "list_page_size",
+        "delete_batch_size",
+        "max_concurrent_deletes",
+        "max_retries",
+        "retry_base_delay",
+        "retry_max_delay",
+        "upload_chunk_size",
+        "metadata_cache_size",
+        "metadata_cache_ttl",
+        "_listing_cache",
+        "_listing_locks",
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+        "request_timeout",
+        "transfer_timeout",
+    )
+
     def __init__(self):
         """Initialize storage service with Supabase client."""
         self.supabase_client: AsyncClient | None = None
+        self.http_client: httpx.AsyncClient | None = None
         self.bucket_name = config.storage_bucket_name
         self.base_url = config.audio_base_url
 
         # File management settings
         self.max_file_size = 50 * 1024 * 1024  # 50MB max file size
         self.supported_formats = [".mp3", ".wav", ".m4a", ".ogg"]
+        self._supported_suffixes: tuple[str, ...] = tuple(self.supported_formats)
+        self._supported_formats_set: frozenset[str] = frozenset(self.supported_formats)
         self.cleanup_threshold_days = 30  # Clean up old files after 30 days
+        self.list_page_size = 1000  # Entries per storage listing request
+        self.delete_batch_size = 100  # Paths per remove request
+        self.max_concurrent_deletes = 8
 
         # Upload retry settings
         self.max_retries = 3
-        self.retry_delay = 1  # seconds
+        self.retry_base_delay = 0.25  # seconds
+        self.retry_max_delay = 10.0  # seconds
+        self.upload_chunk_size = 512 * 1024  # 512KB streaming buffer
+
+        # Directory listing cache: (bucket, path, limit, sort_by) -> (expiry, files)
+        self.metadata_cache_size = 512
+        self.metadata_cache_ttl = 60  # seconds
+        self._listing_cache: OrderedDict[tuple, tuple[float, dict[str, dict]]] = (
+            OrderedDict()
+        )
+        self._listing_locks: dict[tuple, asyncio.Lock] = {}
+
+        # HTTP connection pool settings
+        self.max_connections = 64
+        self.max_keepalive_connections = 32
+        self.keepalive_expiry = 30  # seconds
+        self.request_timeout = 20  # seconds, storage3's default
+        self.transfer_timeout = 300  # seconds per read/write, for 50MB uploads
 
     async def initialize(self) -> None:
         """Initialize Supabase client and ensure bucket exists."""
         try:
+            # Reason: the default httpx limits throttle concurrent uploads and
+            # leak sockets when clients are never closed, so we own the pool.
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+            # Reason: a custom client replaces storage3's timeout with httpx's
+            # 5s default, which would cut off large uploads and slow listings
+            timeout = httpx.Timeout(
+                self.request_timeout,
+                read=self.transfer_timeout,
+                write=self.transfer_timeout,
+            )
+            self.http_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(limits=limits),
+                timeout=timeout,
+            )
+
             # Create Supabase client
             self.supabase_client = await create_async_client(
-                config.supabase_url, config.supabase_service_role_key
+                config.supabase_url,
+                config.supabase_service_role_key,
+                options=AsyncClientOptions(httpx_client=self.http_client),
             )
 
             # Ensure bucket exists
@@ -59,9 +172,16 @@ class StorageService:
             logger.error(f"Failed to initialize storage service: {e}")
             raise
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+        self.supabase_client = None
+
     async def upload_audio_file(
         self,
-        audio_data: bytes,
+        audio_source: AudioSource,
         story_id: uuid.UUID,
         file_format: str = "mp3",
         metadata: dict | None = None,
@@ -69,79 +189,86 @@ class StorageService:
         """
         Upload audio file to cloud storage.
 
+        The payload is streamed in fixed-size chunks so memory use stays
+        bounded by the upload buffer rather than the file size.
+
         Args:
-            audio_data: Audio file data as bytes.
+            audio_source: Audio bytes, a seekable binary file object, or a
+                factory returning a fresh async iterator of byte chunks.
             story_id: UUID of the story this audio belongs to.
             file_format: Audio file format (mp3, wav, etc.).
             metadata: Optional metadata to store with file.
 
         Returns:
-            Public URL of uploaded file.
+            Public URL of uploaded file. The storage path is the URL minus
+            base_url and uniquely identifies this upload.
         """
-        if not self.supabase_client:
+        if not self.supabase_client or not self.http_client:
             raise RuntimeError("Storage service not initialized")
 
         try:
-            # Validate file size
-            if len(audio_data) > self.max_file_size:
+            # Validate file size (unknown for iterator factories until streamed)
+            file_size = self._get_source_size(audio_source)
+            if file_size is not None and file_size > self.max_file_size:
                 raise ValueError(
-                    f"File size {len(audio_data)} exceeds maximum {self.max_file_size}"
+                    f"File size {file_size} exceeds maximum {self.max_file_size}"
                 )
 
             # Validate format
-            if f".{file_format.lower()}" not in self.supported_formats:
+            fmt = file_format.lower()
+            if f".{fmt}" not in self._supported_formats_set:
                 raise ValueError(f"Unsupported format: {file_format}")
+            content_type = f"audio/{fmt}"
 
             # Generate file path
-            file_path = await self._generate_file_path(story_id, file_format)
+            file_path = await self._generate_file_path(story_id, fmt)
 
             # Create file metadata
             file_metadata = {
                 "story_id": str(story_id),
-                "upload_timestamp": datetime.utcnow().isoformat(),
-                "file_size": len(audio_data),
+                "upload_timestamp": datetime.now(UTC).isoformat(),
+                "file_size": file_size,
                 "format": file_format,
             }
 
             if metadata:
                 file_metadata.update(metadata)
 
+            # Storage expects user metadata as base64-encoded JSON
+            encoded_metadata = base64.b64encode(orjson.dumps(file_metadata)).decode()
+
             # Upload file with retries
             success = False
             last_error = None
 
             for attempt in range(self.max_retries):
                 try:
-                    # Upload to Supabase Storage
-                    response = await self.supabase_client.storage.from_(
-                        self.bucket_name
-                    ).upload(
-                        path=file_path,
-                        file=audio_data,
-                        file_options={
-                            "content-type": f"audio/{file_format}",
-                            "cache-control": "3600",  # 1 hour cache
-                            "upsert": True,  # Overwrite if exists
-                        },
+                    # Stream to Supabase Storage; each attempt restarts the source
+                    await self._stream_upload(
+                        file_path, audio_source, content_type, encoded_metadata
                     )
-
-                    if response:
-                        success = True
-                        break
+                    success = True
+                    break
 
                 except Exception as e:
+                    # Client errors (bad payload, auth, oversized) won't succeed on retry
+                    if not self._is_retryable_error(e):
+                        raise
+
                     last_error = e
                     if attempt < self.max_retries - 1:
-                        await asyncio.sleep(self.retry_delay * (attempt + 1))
                         logger.warning(
                             f"Upload attempt {attempt + 1} failed, retrying: {e}"
                         )
+                        await asyncio.sleep(self._compute_backoff(attempt))
                     else:
                         logger.error(f"All upload attempts failed: {e}")
 
             if not success:
                 raise last_error or Exception("Upload failed after all retries")
 
+            self._invalidate_listing(file_path)
+
             # Generate public URL
             public_url = f"{self.base_url}{file_path}"
 
@@ -152,6 +279,91 @@ class StorageService:
             logger.error(f"Failed to upload audio file for story {story_id}: {e}")
             raise
 
+    async def _stream_upload(
+        self,
+        file_path: str,
+        audio_source: AudioSource,
+        content_type: str,
+        encoded_metadata: str,
+    ) -> None:
+        """Stream an audio source to the Supabase Storage object endpoint."""
+        # Reason: the supabase-py upload helper needs the whole payload up
+        # front, so we post a chunked body through the pooled client instead.
+        response = await self.http_client.post(
+            f"{config.supabase_url}/storage/v1/object/{self.bucket_name}/{file_path}",
+            content=self._iter_upload_chunks(audio_source),
+            headers={
+                "Authorization": f"Bearer {config.supabase_service_role_key}",
+                "apikey": config.supabase_service_role_key,
+                "Content-Type": content_type,
+                "Cache-Control": "max-age=3600",  # 1 hour cache
+                "x-upsert": "true",  # Overwrite if exists
+                "x-metadata": encoded_metadata,
+            },
+        )
+        response.raise_for_status()
+
+    async def _iter_upload_chunks(
+        self, audio_source: AudioSource
+    ) -> AsyncIterator[bytes]:
+        """Yield an audio source in chunks, enforcing max_file_size as it streams."""
+        # Reason: sizes checked up front can be stale (a file object may still
+        # be growing) and are unknown for factories, so every source type is
+        # capped on the bytes actually sent
+        sent = 0
+        async for chunk in self._read_source_chunks(audio_source):
+            sent += len(chunk)
+            if sent > self.max_file_size:
+                raise ValueError(f"File size exceeds maximum {self.max_file_size}")
+            yield chunk
+
+    async def _read_source_chunks(
+        self, audio_source: AudioSource
+    ) -> AsyncIterator[bytes]:
+        """Yield an audio source in upload-buffer sized chunks."""
+        chunk_size = self.upload_chunk_size
+
+        if isinstance(audio_source, (bytes, bytearray, memoryview)):
+            view = memoryview(audio_source)
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size].tobytes()
+        elif callable(audio_source):
+            async for chunk in audio_source():
+                yield chunk
+        else:
+            audio_source.seek(0)
+            while chunk := audio_source.read(chunk_size):
+                yield chunk
+
+    def _compute_backoff(self, attempt: int) -> float:
+        """Return an exponential backoff delay with full jitter for an attempt."""
+        # Reason: full jitter spreads concurrent retries out so uploads that
+        # failed together don't hammer Supabase again in lockstep.
+        return random.uniform(
+            0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+        )
+
+    @staticmethod
+    def _is_retryable_error(error: Exception) -> bool:
+        """Check whether an upload error is transient (connection, 429, or 5xx)."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    @staticmethod
+    def _get_source_size(audio_source: AudioSource) -> int | None:
+        """Return the payload size when it can be known without reading it."""
+        if isinstance(audio_source, (bytes, bytearray, memoryview)):
+            return len(audio_source)
+        if callable(audio_source):
+            return None
+
+        # Seekable file object: measure from the end, then rewind
+        size = audio_source.seek(0, 2)
+        audio_source.seek(0)
+        return size
+
     async def download_audio_file(self, file_path: str) -> bytes:
         """
         Download audio file from cloud storage.
@@ -201,6 +413,7 @@ class StorageService:
             ).remove([file_path])
 
             if response:
+                self._invalidate_listing(file_path)
                 logger.info(f"Successfully deleted audio file: {file_path}")
                 return True
             else:
@@ -225,25 +438,22 @@ class StorageService:
             raise RuntimeError("Storage service not initialized")
 
         try:
-            # List files to get metadata
-            files = await self.supabase_client.storage.from_(self.bucket_name).list(
-                path=str(Path(file_path).parent),
-                limit=100,
-                offset=0,
-                sort_by="name",
-            )
+            # Storage paths are always "/"-separated, so split without pathlib
+            directory, _, file_name = file_path.rpartition("/")
+
+            # List files to get metadata (cached per directory)
+            files = await self._list_directory(directory, limit=100, sort_by="name")
 
             # Find matching file
-            file_name = Path(file_path).name
-            for file_info in files:
-                if file_info.get("name") == file_name:
-                    return {
-                        "name": file_info.get("name"),
-                        "size": file_info.get("metadata", {}).get("size"),
-                        "mimetype": file_info.get("metadata", {}).get("mimetype"),
-                        "created_at": file_info.get("created_at"),
-                        "updated_at": file_info.get("updated_at"),
-                    }
+            file_info = files.get(file_name)
+            if file_info:
+                return {
+                    "name": file_info.get("name"),
+                    "size": file_info.get("metadata", {}).get("size"),
+                    "mimetype": file_info.get("metadata", {}).get("mimetype"),
+                    "created_at": file_info.get("created_at"),
+                    "updated_at": file_info.get("updated_at"),
+                }
 
             return None
 
@@ -268,16 +478,13 @@ class StorageService:
             # List files in user directory
             user_path = f"users/{user_id}/"
 
-            files = await self.supabase_client.storage.from_(self.bucket_name).list(
-                path=user_path,
-                limit=1000,
-                offset=0,
-                sort_by="created_at",
+            files = await self._list_directory(
+                user_path, limit=1000, sort_by="created_at"
             )
 
             file_list = []
-            for file_info in files:
-                if file_info.get("name", "").endswith(tuple(self.supported_formats)):
+            for file_info in files.values():
+                if file_info.get("name", "").endswith(self._supported_suffixes):
                     file_list.append(
                         {
                             "name": file_info.get("name"),
@@ -308,35 +515,40 @@ class StorageService:
             raise RuntimeError("Storage service not initialized")
 
         days_old = days_old or self.cleanup_threshold_days
-        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
+        cutoff_date = datetime.now(UTC) - timedelta(days=days_old)
+        # Reason: storage timestamps are fixed-width UTC ISO-8601 strings, which
+        # sort lexicographically, so comparing strings avoids parsing each one.
+        cutoff_iso = cutoff_date.strftime("%Y-%m-%dT%H:%M:%S")
 
         try:
-            # List all files
-            files = await self.supabase_client.storage.from_(self.bucket_name).list(
-                path="",
-                limit=10000,
-                offset=0,
-                sort_by="created_at",
-            )
-
+            # Walk files oldest-first, stopping at the first one past the cutoff
             files_to_delete = []
-            for file_info in files:
-                created_at = file_info.get("created_at")
-                if created_at:
-                    file_date = datetime.fromisoformat(
-                        created_at.replace("Z", "+00:00")
-                    )
-                    if file_date < cutoff_date:
+            reached_cutoff = False
+            async for page in self._iter_list_pages("", sort_by="created_at"):
+                for file_info in page:
+                    created_at = file_info.get("created_at")
+                    if created_at:
+                        if created_at >= cutoff_iso:
+                            reached_cutoff = True
+                            break
                         files_to_delete.append(file_info.get("name"))
 
-            # Delete old files
+                if reached_cutoff:
+                    break
+
+            # Delete old files in bounded-concurrency batches
             deleted_count = 0
             if files_to_delete:
-                response = await self.supabase_client.storage.from_(
-                    self.bucket_name
-                ).remove(files_to_delete)
-                if response:
-                    deleted_count = len(files_to_delete)
+                semaphore = asyncio.Semaphore(self.max_concurrent_deletes)
+                batch_size = self.delete_batch_size
+                batches = [
+                    files_to_delete[i : i + batch_size]
+                    for i in range(0, len(files_to_delete), batch_size)
+                ]
+                results = await asyncio.gather(
+                    *(self._delete_batch(batch, semaphore) for batch in batches)
+                )
+                deleted_count = sum(results)
 
             logger.info(
                 f"Cleaned up {deleted_count} old files (older than {days_old} days)"
@@ -347,6 +559,29 @@ class StorageService:
             logger.error(f"Failed to cleanup old files: {e}")
             return 0
 
+    async def _delete_batch(
+        self, file_paths: list[str], semaphore: asyncio.Semaphore
+    ) -> int:
+        """
+        Remove one batch of files while holding a concurrency slot.
+
+        Args:
+            file_paths: Paths to remove in a single request.
+            semaphore: Semaphore bounding concurrent remove requests.
+
+        Returns:
+            Number of files deleted (0 if the batch failed).
+        """
+        async with semaphore:
+            try:
+                response = await self.supabase_client.storage.from_(
+                    self.bucket_name
+                ).remove(file_paths)
+                return len(file_paths) if response else 0
+            except Exception as e:
+                logger.error(f"Failed to delete batch of {len(file_paths)} files: {e}")
+                return 0
+
     async def get_storage_usage(self, user_id: uuid.UUID | None = None) -> dict:
         """
         Get storage usage statistics.
@@ -364,21 +599,19 @@ class StorageService:
             # Determine path to check
             path = f"users/{user_id}/" if user_id else ""
 
-            files = await self.supabase_client.storage.from_(self.bucket_name).list(
-                path=path,
-                limit=10000,
-                offset=0,
-                sort_by="created_at",
-            )
-
             total_size = 0
             file_count = 0
-
-            for file_info in files:
-                if file_info.get("name", "").endswith(tuple(self.supported_formats)):
-                    file_count += 1
-                    size = file_info.get("metadata", {}).get("size", 0)
-                    total_size += size
+            suffixes = self._supported_suffixes
+
+            async for page in self._iter_list_pages(path, sort_by="created_at"):
+                # Single pass per page; folders come back with metadata=None
+                sizes = [
+                    (file_info.get("metadata") or _EMPTY_METADATA).get("size") or 0
+                    for file_info in page
+                    if file_info.get("name", "").endswith(suffixes)
+                ]
+                file_count += len(sizes)
+                total_size += sum(sizes)
 
             return {
                 "total_files": file_count,
@@ -398,19 +631,122 @@ class StorageService:
                 "average_file_size_bytes": 0,
             }
 
+    async def _iter_list_pages(
+        self, path: str, sort_by: str
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Page through a storage directory listing.
+
+        Args:
+            path: Directory path in the storage bucket.
+            sort_by: Column to sort the listing by, ascending.
+
+        Yields:
+            Lists of file info dictionaries, at most list_page_size each.
+        """
+        offset = 0
+        while True:
+            page = await self.supabase_client.storage.from_(self.bucket_name).list(
+                path, _list_options(self.list_page_size, offset, sort_by)
+            )
+            if not page:
+                return
+
+            yield page
+
+            if len(page) < self.list_page_size:
+                return
+            offset += self.list_page_size
+
+    async def _list_directory(
+        self, path: str, limit: int, sort_by: str
+    ) -> dict[str, dict]:
+        """
+        List a storage directory through the in-process metadata cache.
+
+        Args:
+            path: Directory path in the storage bucket.
+            limit: Maximum number of entries to list.
+            sort_by: Column to sort the listing by.
+
+        Returns:
+            Mapping of file name to file info, in listing order.
+        """
+        key = (self.bucket_name, path.rstrip("/"), limit, sort_by)
+        cached = self._get_cached_listing(key)
+        if cached is not None:
+            return cached
+
+        # Reason: one lock per key so concurrent misses trigger a single list call
+        lock = self._listing_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._get_cached_listing(key)
+                if cached is not None:
+                    return cached
+
+                files = await self.supabase_client.storage.from_(self.bucket_name).list(
+                    path, _list_options(limit, 0, sort_by)
+                )
+                listing = {file_info.get("name"): file_info for file_info in files}
+
+                self._listing_cache[key] = (
+                    time.monotonic() + self.metadata_cache_ttl,
+                    listing,
+                )
+                while len(self._listing_cache) > self.metadata_cache_size:
+                    self._listing_cache.popitem(last=False)
+        finally:
+            # Reason: the lock only guards the load in flight; callers already
+            # queued on it keep their reference and then hit the cache, so
+            # dropping it here stops locks piling up for keys that expire or
+            # are never requested again
+            if not lock.locked() and self._listing_locks.get(key) is lock:
+                del self._listing_locks[key]
+
+        return listing
+
+    def _get_cached_listing(self, key: tuple) -> dict[str, dict] | None:
+        """Return a fresh cached listing and mark it recently used."""
+        entry = self._listing_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, listing = entry
+        if expires_at <= time.monotonic():
+            del self._listing_cache[key]
+            return None
+
+        self._listing_cache.move_to_end(key)
+        return listing
+
+    def _invalidate_listing(self, file_path: str) -> None:
+        """Drop cached listings for the directory containing a file."""
+        directory = file_path.rpartition("/")[0]
+        stale_keys = [
+            key
+            for key in self._listing_cache
+            if key[0] == self.bucket_name and key[1] == directory
+        ]
+        for key in stale_keys:
+            del self._listing_cache[key]
+
     async def _generate_file_path(self, story_id: uuid.UUID, file_format: str) -> str:
         """Generate unique file path for audio file."""
-        # Use story ID and timestamp for uniqueness
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        file_name = f"{story_id}_{timestamp}.{file_format.lower()}"
+        # Reason: a random suffix can't collide like a per-second timestamp
+        # did, so two uploads for one story never upsert over each other.
+        file_name = f"{story_id}_{uuid.uuid4().hex[:12]}.{file_format.lower()}"
 
         # Organize by date for easier management
-        date_path = datetime.utcnow().strftime("%Y/%m")
+        date_path = datetime.now(UTC).strftime("%Y/%m")
 
         return f"stories/{date_path}/{file_name}"
 
     async def _ensure_bucket_exists(self) -> None:
         """Ensure storage bucket exists."""
+        if config.storage_skip_bucket_check or self.bucket_name in _bucket_verified:
+            return
+
         try:
             # List buckets to check if our bucket exists
             buckets = await self.supabase_client.storage.list_buckets()
@@ -431,6 +767,8 @@ class StorageService:
                 )
                 logger.info(f"Created storage bucket: {self.bucket_name}")
 
+            _bucket_verified.add(self.bucket_name)
+
         except Exception as e:
             logger.warning(f"Could not verify/create bucket: {e}")
             # Continue anyway - bucket might exist but we don't have list permissions
@@ -450,6 +788,9 @@ class StorageService:
         Returns:
             Presigned URL for file access.
         """
+        if config.supabase_jwt_secret:
+            return self._sign_url_locally(file_path, expires_in)
+
         if not self.supabase_client:
             raise RuntimeError("Storage service not initialized")
 
@@ -471,6 +812,37 @@ class StorageService:
             # Fallback to public URL
             return f"{self.base_url}{file_path}"
 
+    def _sign_url_locally(self, file_path: str, expires_in: int) -> str:
+        """
+        Mint a Supabase Storage signed URL without an API round-trip.
+
+        Args:
+            file_path: Path to file in storage.
+            expires_in: URL expiration time in seconds.
+
+        Returns:
+            Signed URL for file access.
+        """
+        # Reason: Storage signed URLs are HS256 JWTs over the object URL,
+        # signed with the project JWT secret, so they can be minted in-process.
+        # Storage checks the claim against the decoded route path, so the claim
+        # holds the raw path while the URL percent-encodes it like storage3.
+        object_path = f"{self.bucket_name}/{file_path}"
+        issued_at = int(time.time())
+        token = jwt.encode(
+            {
+                "url": object_path,
+                "iat": issued_at,
+                "exp": issued_at + expires_in,
+            },
+            config.supabase_jwt_secret,
+            algorithm="HS256",
+        )
+        return (
+            f"{config.supabase_url}/storage/v1/object/sign/"
+            f"{quote(object_path)}?token={token}"
+        )
+
     def get_public_url(self, file_path: str) -> str:
         """
         Get public URL for a stored file.
@@ -2,16 +2,24 @@
 Authentication utilities for JWT token management and OAuth flow.
 """
 
+import asyncio
+import base64
+import hashlib
 import secrets
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime, timedelta
 from functools import wraps
 from typing import Any
 
+import httpx
 import jwt
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 from quart import g, jsonify, request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,10 +34,69 @@ JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 30
 
+# Reason: build the decoder, key bytes and algorithm list once at import
+# instead of re-deriving them on every verify_token call.
+_JWT_KEY = JWT_SECRET_KEY.encode("utf-8")
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+_jwt_decoder = jwt.PyJWT()
+_jws_encoder = jwt.PyJWS()
+
+# Verified token cache: token digest -> (payload, cache expiry timestamp)
+PAYLOAD_CACHE_MAX_SIZE = 4096
+PAYLOAD_CACHE_TTL_SECONDS = 60
+_payload_cache: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """
+    Read-only snapshot of a user's columns, shared between requests.
+
+    The auth cache holds these instead of ``User`` ORM objects, so one
+    request can never see another's unsaved changes or attach the same
+    instance to two database sessions. Routes that modify the user load a
+    fresh ``User`` in their own session.
+    """
+
+    id: uuid.UUID
+    email: str
+    name: str
+    created_at: datetime | None
+    default_voice_type: str | None
+    default_playback_speed: float
+    summarization_depth: str
+    google_access_token: str | None
+    google_refresh_token: str | None
+    google_token_expires_at: datetime | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        """
+        Copy the column values of a loaded user.
+
+        Args:
+            user: User loaded in an open database session
+
+        Returns:
+            Immutable snapshot of the user
+        """
+        return cls(**{field.name: getattr(user, field.name) for field in fields(cls)})
+
+
+# Authenticated user cache: user ID -> (user snapshot, cache expiry monotonic time)
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: OrderedDict[str, tuple[CachedUser, float]] = OrderedDict()
+_user_cache_locks: dict[str, asyncio.Lock] = {}
+
+# Shared HTTP client for Google API calls (created on first use)
+_http_client: httpx.AsyncClient | None = None
+
 # Google OAuth Configuration
 GOOGLE_CLIENT_ID = settings.google_client_id
 GOOGLE_CLIENT_SECRET = settings.google_client_secret
 GOOGLE_REDIRECT_URI = f"{settings.backend_url}/auth/google/callback"
+GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
 SCOPES = [
     "openid",  # Google automatically adds this, so we include it explicitly
@@ -64,8 +131,8 @@ def create_access_token(
     else:
         expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    to_encode.update({"exp": int(expire.timestamp()), "type": "access"})
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(data: dict[str, Any]) -> str:
@@ -80,8 +147,21 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     """
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    to_encode.update({"exp": int(expire.timestamp()), "type": "refresh"})
+    return _encode_token(to_encode)
+
+
+def _encode_token(payload: dict[str, Any]) -> str:
+    """
+    Sign a JWT payload, serializing the claims with orjson.
+
+    Args:
+        payload: Claims to encode (exp must already be a Unix timestamp)
+
+    Returns:
+        JWT token string
+    """
+    return _jws_encoder.encode(orjson.dumps(payload), _JWT_KEY, algorithm=JWT_ALGORITHM)
 
 
 def verify_token(token: str, token_type: str = "access") -> dict[str, Any]:
@@ -98,18 +178,100 @@ def verify_token(token: str, token_type: str = "access") -> dict[str, Any]:
     Raises:
         AuthError: If token is invalid
     """
-    try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-
-        if payload.get("type") != token_type:
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _get_cached_payload(cache_key)
+
+    if payload is None:
+        # Reason: wrong-type tokens (e.g. a refresh token sent as an access
+        # token) are rejected from the unverified claims, before paying for
+        # the HMAC. Nothing read here is trusted; accepted tokens still get
+        # the full verified decode below.
+        if _peek_token_type(token) != token_type:
             raise AuthError(f"Invalid token type. Expected {token_type}")
 
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise AuthError("Token has expired") from None
-    except jwt.InvalidTokenError:
+        try:
+            # Reason: a single verified decode. PyJWS rejects any alg outside
+            # _JWT_ALGORITHMS before checking the signature, and the type
+            # claim is checked below for cached and fresh payloads alike.
+            payload = _jwt_decoder.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+        except jwt.ExpiredSignatureError:
+            raise AuthError("Token has expired") from None
+        except jwt.InvalidTokenError:
+            raise AuthError("Invalid token") from None
+
+        _cache_payload(cache_key, payload)
+
+    if payload.get("type") != token_type:
+        raise AuthError(f"Invalid token type. Expected {token_type}")
+
+    # Reason: callers keep the payload (g.jwt_payload) and may modify it, so
+    # each gets its own copy and the cached one stays as verified
+    return dict(payload)
+
+
+def _peek_token_type(token: str) -> Any:
+    """
+    Read the type claim of a token without verifying its signature.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Unverified type claim
+
+    Raises:
+        AuthError: If the payload segment cannot be decoded
+    """
+    try:
+        segment = token.split(".", 2)[1]
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+        )
+    except (IndexError, ValueError):
         raise AuthError("Invalid token") from None
 
+    return claims.get("type") if isinstance(claims, dict) else None
+
+
+def _get_cached_payload(cache_key: bytes) -> dict[str, Any] | None:
+    """
+    Get a previously verified token payload if it is still valid.
+
+    Args:
+        cache_key: Digest of the raw token
+
+    Returns:
+        Cached payload or None
+    """
+    entry = _payload_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    payload, expires_at = entry
+    if expires_at <= time.time():
+        del _payload_cache[cache_key]
+        return None
+
+    _payload_cache.move_to_end(cache_key)
+    return payload
+
+
+def _cache_payload(cache_key: bytes, payload: dict[str, Any]) -> None:
+    """
+    Cache a verified token payload, never past the token's own expiry.
+
+    Args:
+        cache_key: Digest of the raw token
+        payload: Verified token payload
+    """
+    expires_at = time.time() + PAYLOAD_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        expires_at = min(expires_at, float(payload["exp"]))
+
+    _payload_cache[cache_key] = (payload, expires_at)
+    if len(_payload_cache) > PAYLOAD_CACHE_MAX_SIZE:
+        _payload_cache.popitem(last=False)
+
 
 async def get_user_by_id(user_id: str, db: AsyncSession) -> User | None:
     """
@@ -130,6 +292,86 @@ async def get_user_by_id(user_id: str, db: AsyncSession) -> User | None:
         return None
 
 
+async def get_user_by_id_cached(user_id: str) -> CachedUser | None:
+    """
+    Get user by ID, serving recent lookups from an in-process cache.
+
+    Args:
+        user_id: User UUID
+
+    Returns:
+        Read-only user snapshot or None
+    """
+    user = _get_cached_user(user_id)
+    if user is not None:
+        return user
+
+    # Reason: a per-user lock means a burst of requests for an uncached user
+    # results in a single database query instead of one per request.
+    lock = _user_cache_locks.setdefault(user_id, asyncio.Lock())
+    async with lock:
+        user = _get_cached_user(user_id)
+        if user is not None:
+            return user
+
+        async with get_async_session() as db:
+            db_user = await get_user_by_id(user_id, db)
+            user = CachedUser.from_user(db_user) if db_user is not None else None
+
+        if user is None:
+            _user_cache_locks.pop(user_id, None)
+            return None
+
+        _user_cache[user_id] = (user, time.monotonic() + USER_CACHE_TTL_SECONDS)
+        if len(_user_cache) > USER_CACHE_MAX_SIZE:
+            evicted_id, _ = _user_cache.popitem(last=False)
+            _user_cache_locks.pop(evicted_id, None)
+
+    return user
+
+
+def _get_cached_user(user_id: str) -> CachedUser | None:
+    """
+    Get a cached user if the entry has not expired.
+
+    Args:
+        user_id: User UUID
+
+    Returns:
+        Cached user snapshot or None
+    """
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+
+    user, expires_at = entry
+    if expires_at <= time.monotonic():
+        del _user_cache[user_id]
+        # Reason: drop the load lock with its entry so locks for users who
+        # stop making requests don't accumulate; a held lock stays for the
+        # reload in progress
+        lock = _user_cache_locks.get(user_id)
+        if lock is not None and not lock.locked():
+            del _user_cache_locks[user_id]
+        return None
+
+    _user_cache.move_to_end(user_id)
+    return user
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """
+    Drop a user from the auth cache after their record changes.
+
+    Args:
+        user_id: User UUID
+    """
+    _user_cache.pop(user_id, None)
+    lock = _user_cache_locks.get(user_id)
+    if lock is not None and not lock.locked():
+        del _user_cache_locks[user_id]
+
+
 def create_oauth_flow() -> Flow:
     """
     Create Google OAuth 2.0 flow.
@@ -152,7 +394,28 @@ def create_oauth_flow() -> Flow:
     )
 
 
-def get_google_user_info(credentials: Credentials) -> dict[str, Any]:
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used for Google API requests.
+
+    Returns:
+        Pooled async HTTP client
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=10.0)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Google API HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def get_google_user_info(credentials: Credentials) -> dict[str, Any]:
     """
     Get user information from Google API.
 
@@ -162,9 +425,14 @@ def get_google_user_info(credentials: Credentials) -> dict[str, Any]:
     Returns:
         User information dictionary
     """
-    service = build("oauth2", "v2", credentials=credentials)
-    user_info = service.userinfo().get().execute()
-    return user_info
+    # Reason: the discovery client is synchronous and fetches its discovery
+    # document on first use, blocking the event loop; the REST call is not.
+    response = await _get_http_client().get(
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {credentials.token}"},
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 def require_auth(f):
@@ -199,22 +467,22 @@ def require_auth(f):
             return jsonify({"error": "Missing Authorization header"}), 401
 
         try:
-            # Verify token
-            payload = verify_token(token, "access")
+            # Verify token (reuse the payload if already verified this request)
+            payload = g.get("jwt_payload") or verify_token(token, "access")
+            g.jwt_payload = payload
             user_id = payload.get("sub")
 
             if not user_id:
                 return jsonify({"error": "Invalid token payload"}), 401
 
-            # Get user from database
-            async with get_async_session() as db:
-                user = await get_user_by_id(user_id, db)
-                if not user:
-                    return jsonify({"error": "User not found"}), 401
+            # Get user (cached briefly to avoid a DB round-trip per request)
+            user = await get_user_by_id_cached(user_id)
+            if not user:
+                return jsonify({"error": "User not found"}), 401
 
-                # Store user in request context
-                g.current_user = user
-                g.current_user_id = user_id
+            # Store user in request context
+            g.current_user = user
+            g.current_user_id = user_id
 
         except AuthError as e:
             error_message = str(e)
@@ -246,22 +514,25 @@ def optional_auth(f):
 
     @wraps(f)
     async def decorated_function(*args, **kwargs):
-        token = None
         auth_header = request.headers.get("Authorization")
 
-        if auth_header:
+        # Anonymous requests skip token handling entirely
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return await f(*args, **kwargs)
+
+        token = auth_header[len("Bearer ") :]
+        if token:
             try:
-                token = auth_header.split(" ")[1]
-                payload = verify_token(token, "access")
+                payload = g.get("jwt_payload") or verify_token(token, "access")
+                g.jwt_payload = payload
                 user_id = payload.get("sub")
 
                 if user_id:
-                    async with get_async_session() as db:
-                        user = await get_user_by_id(user_id, db)
-                        if user:
-                            g.current_user = user
-                            g.current_user_id = user_id
-            except (AuthError, IndexError):
+                    user = await get_user_by_id_cached(user_id)
+                    if user:
+                        g.current_user = user
+                        g.current_user_id = user_id
+            except AuthError:
                 # Continue without authentication
                 pass
 
@@ -305,6 +576,7 @@ async def refresh_google_credentials(
                 user.google_refresh_token = credentials.refresh_token
 
             await db.commit()
+            invalidate_cached_user(str(user.id))
 
         return credentials
 
@@ -3,21 +3,65 @@ Logging configuration for My Newsletters Voice Assistant
 Provides structured logging with multiple handlers and formatters
 """
 
+import atexit
+import copy
+import functools
+import inspect
+import locale
 import os
+import queue
 import sys
+import time
 import logging
 import logging.handlers
 from pathlib import Path
 from typing import Optional
-import json
-from datetime import datetime
+
+import orjson
+from quart import request
+
+# LogRecord attributes that are not user-supplied "extra" fields, taken from a
+# real record so new stdlib attributes (msecs, relativeCreated, taskName, ...)
+# never leak into JSON output; message/asctime are added during formatting
+_RESERVED_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {
+    "message", "asctime", "taskName",
+}
+
+
+# Background listeners draining queued records to file handlers, by logger name
+_queue_listeners: dict = {}
+
+
+def _stop_queue_listeners():
+    """Flush and stop all background log listeners (runs at interpreter exit)"""
+    while _queue_listeners:
+        _, listener = _queue_listeners.popitem()
+        listener.stop()
+
+
+atexit.register(_stop_queue_listeners)
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cache the "YYYY-MM-DDTHH:MM:SS" prefix for the current second
+        self._cached_second = None
+        self._cached_prefix = ""
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record's epoch time as a UTC ISO-8601 string"""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._cached_prefix}.{int((created - second) * 1_000_000):06d}"
+    
     def format(self, record):
         log_obj = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -31,14 +75,135 @@ class JSONFormatter(logging.Formatter):
             log_obj["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in ["name", "msg", "args", "created", "filename", "funcName",
-                          "levelname", "levelno", "lineno", "module", "exc_info",
-                          "exc_text", "stack_info", "pathname", "processName",
-                          "process", "threadName", "thread", "getMessage"]:
-                log_obj[key] = value
+        # Reason: the keys-view set difference runs in C, so records without
+        # extras skip the per-attribute Python loop entirely
+        record_dict = record.__dict__
+        extra_keys = record_dict.keys() - _RESERVED_RECORD_ATTRS
+        for key in extra_keys:
+            log_obj[key] = record_dict[key]
         
-        return json.dumps(log_obj)
+        # default=str keeps non-JSON extras (UUIDs, exceptions) from failing the record
+        return orjson.dumps(log_obj, default=str).decode()
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that tracks file size in memory
+    
+    The stdlib handler seeks to the end of the file and calls tell() before
+    every write to decide whether to roll over; this one keeps a running byte
+    count and only rotates once the count crosses maxBytes.
+    
+    With buffered=True records are left in the stream buffer instead of being
+    flushed one by one; the owner (BatchingQueueListener) flushes in batches.
+    """
+    
+    def __init__(self, filename, *args, buffered: bool = False, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self.buffered = buffered
+        # Reason: maxBytes and the size read at startup are bytes, so records
+        # are counted in the stream's encoding, not in characters
+        self._size_encoding = (
+            locale.getpreferredencoding(False)
+            if self.encoding in (None, "locale")
+            else self.encoding
+        )
+        self._size = (
+            os.path.getsize(self.baseFilename)
+            if os.path.exists(self.baseFilename) else 0
+        )
+    
+    def shouldRollover(self, record):
+        return self.maxBytes > 0 and self._size >= self.maxBytes
+    
+    def doRollover(self):
+        super().doRollover()
+        self._size = 0
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            if not self.buffered:
+                self.flush()
+            # ASCII text is one byte per character in any ASCII-compatible
+            # encoding, so only other text pays for an encode
+            self._size += (
+                len(msg)
+                if msg.isascii()
+                else len(msg.encode(self._size_encoding, self.errors or "strict"))
+            )
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers once per drained batch
+    
+    Records that arrive in a burst are written into the handlers' stream
+    buffers back to back and hit the disk in one flush when the queue runs
+    dry, rather than costing a write syscall each.
+    """
+    
+    def dequeue(self, block):
+        if block:
+            try:
+                return self.queue.get_nowait()
+            except queue.Empty:
+                self.flush()
+        return self.queue.get(block)
+    
+    def flush(self):
+        """Flush every handler's buffered output to disk"""
+        for handler in self.handlers:
+            handler.flush()
+    
+    def stop(self):
+        super().stop()
+        self.flush()
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves exception info for the listener's formatters
+    
+    The stdlib prepare() formats the record, folds the traceback into msg and
+    clears exc_info, so JSONFormatter would never emit its "exception" field.
+    Records only cross threads here (never pickled), so exc_info can travel.
+    """
+    
+    def prepare(self, record):
+        # Reason: merge args now, as the stdlib does, so later mutation of
+        # the arguments cannot change the message written by the listener
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class ReusingFormatter(logging.Formatter):
+    """Wraps a formatter and reuses its output for repeat calls on one record
+    
+    Handlers sharing this formatter (main + error log) format each record
+    once; the listener thread hands them the same record object in turn.
+    """
+    
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self._formatter = formatter
+        self._last_record = None
+        self._last_output = ""
+    
+    def format(self, record):
+        if record is not self._last_record:
+            self._last_output = self._formatter.format(record)
+            self._last_record = record
+        return self._last_output
 
 
 class ColoredFormatter(logging.Formatter):
@@ -53,10 +218,22 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names are fixed, so build them once rather than per record
+        self._colored_levelnames = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored_levelnames.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Reason: the same record goes on to the file handlers, which must
+            # not see escape codes in the level name
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -92,6 +269,10 @@ def setup_logging(
     
     # Remove existing handlers
     logger.handlers = []
+    previous_listener = _queue_listeners.pop(app_name, None)
+    if previous_listener:
+        previous_listener.stop()
+    file_handlers = []
     
     # Console handler
     if enable_console:
@@ -114,46 +295,53 @@ def setup_logging(
         
         logger.addHandler(console_handler)
     
-    # File handler
+    # File handlers
     if enable_file:
         # Create log directory if it doesn't exist
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # One formatter shared by both file handlers, so an error record is
+        # formatted once and the cached text reused for the error log
+        if enable_json:
+            file_format = ReusingFormatter(JSONFormatter())
+        else:
+            file_format = ReusingFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+            ))
+        
         # Rotating file handler (10MB max, keep 5 backups)
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file,
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            buffered=True
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setFormatter(file_format)
+        file_handlers.append(file_handler)
         
-        if enable_json:
-            file_handler.setFormatter(JSONFormatter())
-        else:
-            file_format = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-            )
-            file_handler.setFormatter(file_format)
-        
-        logger.addHandler(file_handler)
-    
-    # Error file handler (errors only)
-    error_file = log_file.replace(".log", "_error.log")
-    error_path = Path(error_file)
-    error_path.parent.mkdir(parents=True, exist_ok=True)
+        # Error file handler (errors only)
+        error_handler = FastRotatingFileHandler(
+            log_file.replace(".log", "_error.log"),
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5,
+            buffered=True
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(file_format)
+        file_handlers.append(error_handler)
     
-    error_handler = logging.handlers.RotatingFileHandler(
-        error_file,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s\n%(exc_info)s'
-    )
-    error_handler.setFormatter(error_format)
-    logger.addHandler(error_handler)
+    if file_handlers:
+        # Reason: file writes happen on a listener thread so callers only pay for
+        # an enqueue, not write/flush/rotation checks on the request path
+        log_queue = queue.SimpleQueue()
+        listener = BatchingQueueListener(
+            log_queue, *file_handlers, respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners[app_name] = listener
+        logger.addHandler(StructuredQueueHandler(log_queue))
     
     return logger
 
@@ -175,77 +363,77 @@ def log_performance(logger: logging.Logger):
     """
     Decorator to log function performance
     
+    Success records are only built when the logger has INFO enabled;
+    failures are always logged.
+    
     Args:
         logger: Logger instance to use
     """
-    import functools
-    import time
-    
     def decorator(func):
+        func_name = func.__name__
+        completed_message = f"{func_name} completed"
+        failed_message = f"{func_name} failed"
+        
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.info(
-                    f"{func.__name__} completed",
-                    extra={
-                        "function": func.__name__,
-                        "duration_seconds": elapsed,
-                        "status": "success"
-                    }
-                )
-                return result
             except Exception as e:
-                elapsed = time.time() - start_time
                 logger.error(
-                    f"{func.__name__} failed",
+                    failed_message,
                     extra={
-                        "function": func.__name__,
-                        "duration_seconds": elapsed,
+                        "function": func_name,
+                        "duration_seconds": time.perf_counter() - start_time,
                         "status": "error",
                         "error": str(e)
                     },
                     exc_info=True
                 )
                 raise
-        
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
+            
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"{func.__name__} completed",
+                    completed_message,
                     extra={
-                        "function": func.__name__,
-                        "duration_seconds": elapsed,
+                        "function": func_name,
+                        "duration_seconds": time.perf_counter() - start_time,
                         "status": "success"
                     }
                 )
-                return result
+            return result
+        
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
             except Exception as e:
-                elapsed = time.time() - start_time
                 logger.error(
-                    f"{func.__name__} failed",
+                    failed_message,
                     extra={
-                        "function": func.__name__,
-                        "duration_seconds": elapsed,
+                        "function": func_name,
+                        "duration_seconds": time.perf_counter() - start_time,
                         "status": "error",
                         "error": str(e)
                     },
                     exc_info=True
                 )
                 raise
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    completed_message,
+                    extra={
+                        "function": func_name,
+                        "duration_seconds": time.perf_counter() - start_time,
+                        "status": "success"
+                    }
+                )
+            return result
         
         # Return appropriate wrapper based on function type
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
     
     return decorator
 
@@ -254,61 +442,60 @@ def log_api_request(logger: logging.Logger):
     """
     Decorator to log API requests and responses
     
+    Request/response records are only built when the logger has INFO
+    enabled; errors are always logged.
+    
     Args:
         logger: Logger instance to use
     """
-    import functools
-    import time
-    from quart import request
-    
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            start_time = time.perf_counter()
             
             # Log request
-            logger.info(
-                f"API Request: {request.method} {request.path}",
-                extra={
-                    "method": request.method,
-                    "path": request.path,
-                    "query_params": dict(request.args),
-                    "remote_addr": request.remote_addr,
-                    "user_agent": request.headers.get("User-Agent")
-                }
-            )
-            
-            try:
-                response = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                
-                # Log response
-                status_code = response[1] if isinstance(response, tuple) else 200
+            if info_enabled:
                 logger.info(
-                    f"API Response: {status_code}",
+                    f"API Request: {request.method} {request.path}",
                     extra={
                         "method": request.method,
                         "path": request.path,
-                        "status_code": status_code,
-                        "duration_seconds": elapsed
+                        "query_params": dict(request.args),
+                        "remote_addr": request.remote_addr,
+                        "user_agent": request.headers.get("User-Agent")
                     }
                 )
-                
-                return response
-                
+            
+            try:
+                response = await func(*args, **kwargs)
             except Exception as e:
-                elapsed = time.time() - start_time
                 logger.error(
                     f"API Error: {str(e)}",
                     extra={
                         "method": request.method,
                         "path": request.path,
-                        "duration_seconds": elapsed,
+                        "duration_seconds": time.perf_counter() - start_time,
                         "error": str(e)
                     },
                     exc_info=True
                 )
                 raise
+            
+            # Log response
+            if info_enabled:
+                status_code = response[1] if isinstance(response, tuple) else 200
+                logger.info(
+                    f"API Response: {status_code}",
+                    extra={
+                        "method": request.method,
+                        "path": request.path,
+                        "status_code": status_code,
+                        "duration_seconds": time.perf_counter() - start_time
+                    }
+                )
+            
+            return response
         
         return wrapper
     
@@ -4,14 +4,23 @@ Tracks application performance, usage, and health metrics
 """
 
 import time
+import heapq
 import asyncio
-from typing import Dict, Any, Optional, List
+from array import array
+from typing import Callable, Dict, Any, NamedTuple, Optional, List, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
-import json
 from pathlib import Path
-from dataclasses import dataclass, asdict
 from enum import Enum
+from operator import attrgetter
+
+import orjson
+
+# numpy is optional; timer stats fall back to pure Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class MetricType(Enum):
     """Types of metrics"""
@@ -21,39 +30,121 @@ class MetricType(Enum):
     TIMER = "timer"
 
 
-@dataclass
-class Metric:
+class Metric(NamedTuple):
     """Individual metric data point"""
     name: str
     type: MetricType
     value: float
     timestamp: float
-    tags: Dict[str, str] = None
-    metadata: Dict[str, Any] = None
+    tags: Optional[Dict[str, str]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+
+# Services reported by ApplicationMetrics.get_health_report, in report order
+HEALTH_SERVICES = ("database", "redis", "elevenlabs", "gmail")
+
+# Metric key: (name, frozenset of tag items or None for untagged metrics)
+MetricKey = Tuple[str, Optional[frozenset]]
+
+
+class _MetricTable:
+    """Scalar metric values stored in a flat array, indexed by interned key
+    
+    Keys get a fixed slot on first use. New slots append the value before
+    the key, so a reader that copies the key list first and then the value
+    array always gets a consistent snapshot without taking a lock.
+    """
+    
+    __slots__ = ("index", "keys", "values")
+    
+    def __init__(self):
+        self.index: Dict[MetricKey, int] = {}
+        self.keys: List[MetricKey] = []
+        self.values = array("d")
+    
+    def slot(self, key: MetricKey) -> int:
+        """Return the slot for key, allocating one on first use"""
+        slot = self.index.get(key)
+        if slot is None:
+            slot = len(self.values)
+            self.values.append(0.0)
+            self.keys.append(key)
+            self.index[key] = slot
+        return slot
+    
+    def get(self, key: MetricKey, default: float = 0) -> float:
+        """Return the value stored for key, or default if never set"""
+        slot = self.index.get(key)
+        return default if slot is None else self.values[slot]
+    
+    def snapshot(self) -> List[Tuple[MetricKey, float]]:
+        """Copy out (key, value) pairs"""
+        # Reason: both slices are single C-level copies, so this is safe to run
+        # from a worker thread while the event loop keeps updating values
+        keys = self.keys[:]
+        values = self.values[:len(keys)]
+        return list(zip(keys, values, strict=True))
+    
+    def clear(self):
+        """Drop all keys and values"""
+        self.index = {}
+        self.keys = []
+        self.values = array("d")
 
 
 class MetricsCollector:
     """Collects and manages application metrics"""
     
-    def __init__(self, app_name: str = "my-newsletters", flush_interval: int = 60):
+    def __init__(
+        self,
+        app_name: str = "my-newsletters",
+        flush_interval: int = 60,
+        max_timer_samples: int = 4096,
+        record_history: bool = True,
+    ):
         self.app_name = app_name
         self.flush_interval = flush_interval
+        # Per-event history only feeds recent_metrics; collectors that don't
+        # report it can turn it off so updates skip allocating a Metric each
+        self.record_history = record_history
+        # Timers keep the most recent samples; trimming happens in blocks of
+        # max/4 so the delete cost is amortized across many appends
+        self.max_timer_samples = max_timer_samples
+        self._timer_trim_threshold = max_timer_samples + max(1, max_timer_samples // 4)
         self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.counters: Dict[str, float] = defaultdict(float)
-        self.gauges: Dict[str, float] = {}
-        self.timers: Dict[str, List[float]] = defaultdict(list)
+        self.counters = _MetricTable()
+        self.gauges = _MetricTable()
+        # Timer samples are unboxed doubles so numpy can view them without copying
+        self.timers: Dict[MetricKey, array] = defaultdict(lambda: array("d"))
         self.start_time = time.time()
         
     def increment(self, name: str, value: float = 1, tags: Dict[str, str] = None):
         """Increment a counter metric"""
+        self._increment_key(self._make_key(name, tags), name, value, tags)
+    
+    def counter(self, name: str, tags: Dict[str, str] = None) -> Callable[..., None]:
+        """Get a handle that increments one counter without rebuilding its key
+        
+        Usage: ``requests = collector.counter("api.requests", tags); requests()``
+        """
         key = self._make_key(name, tags)
-        self.counters[key] += value
-        self._record_metric(name, MetricType.COUNTER, self.counters[key], tags)
+        
+        def handle(value: float = 1):
+            self._increment_key(key, name, value, tags)
+        
+        return handle
+    
+    def _increment_key(self, key: MetricKey, name: str, value: float, tags: Dict[str, str] = None):
+        """Increment the counter stored under a prebuilt key"""
+        counters = self.counters
+        slot = counters.slot(key)
+        counters.values[slot] += value
+        self._record_metric(name, MetricType.COUNTER, counters.values[slot], tags)
     
     def gauge(self, name: str, value: float, tags: Dict[str, str] = None):
         """Set a gauge metric"""
-        key = self._make_key(name, tags)
-        self.gauges[key] = value
+        gauges = self.gauges
+        gauges.values[gauges.slot(self._make_key(name, tags))] = value
         self._record_metric(name, MetricType.GAUGE, value, tags)
     
     def histogram(self, name: str, value: float, tags: Dict[str, str] = None):
@@ -66,27 +157,54 @@ class MetricsCollector:
     
     def record_duration(self, name: str, duration: float, tags: Dict[str, str] = None):
         """Record a duration metric"""
+        self._record_duration_key(self._make_key(name, tags), name, duration, tags)
+    
+    def duration_recorder(self, name: str, tags: Dict[str, str] = None) -> Callable[[float], None]:
+        """Get a handle that records durations for one timer without rebuilding its key"""
         key = self._make_key(name, tags)
-        self.timers[key].append(duration)
+        
+        def handle(duration: float):
+            self._record_duration_key(key, name, duration, tags)
+        
+        return handle
+    
+    def _record_duration_key(self, key: MetricKey, name: str, duration: float, tags: Dict[str, str] = None):
+        """Record a duration under a prebuilt key"""
+        samples = self.timers[key]
+        samples.append(duration)
+        if len(samples) > self._timer_trim_threshold:
+            del samples[:-self.max_timer_samples]
         self._record_metric(name, MetricType.TIMER, duration, tags)
     
-    def _make_key(self, name: str, tags: Dict[str, str] = None) -> str:
-        """Create a unique key for a metric"""
+    def get_gauge(self, name: str, tags: Dict[str, str] = None, default: float = 0) -> float:
+        """Get the current value of a gauge metric"""
+        return self.gauges.get(self._make_key(name, tags), default)
+    
+    def get_counter_total(self, name: str) -> float:
+        """Get a counter's value summed across all of its tag sets"""
+        return sum(value for (key_name, _), value in self.counters.snapshot() if key_name == name)
+    
+    def _make_key(self, name: str, tags: Dict[str, str] = None) -> MetricKey:
+        """Create a unique, hashable key for a metric"""
+        # Reason: tuples hash directly, so the hot path skips sorting and
+        # string building; keys are only rendered as text for snapshots
+        return (name, frozenset(tags.items())) if tags else (name, None)
+    
+    @staticmethod
+    def _format_key(key: MetricKey) -> str:
+        """Render a metric key as "name,tag1=a,tag2=b" for export"""
+        name, tags = key
         if tags:
-            tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
+            tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags))
             return f"{name},{tag_str}"
         return name
     
     def _record_metric(self, name: str, metric_type: MetricType, value: float, tags: Dict[str, str] = None):
         """Record a metric data point"""
-        metric = Metric(
-            name=name,
-            type=metric_type,
-            value=value,
-            timestamp=time.time(),
-            tags=tags or {}
-        )
-        self.metrics[name].append(metric)
+        if self.record_history:
+            self.metrics[name].append(
+                Metric(name, metric_type, value, time.time(), tags)
+            )
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics snapshot"""
@@ -94,8 +212,8 @@ class MetricsCollector:
             "app_name": self.app_name,
             "uptime_seconds": time.time() - self.start_time,
             "timestamp": datetime.utcnow().isoformat(),
-            "counters": dict(self.counters),
-            "gauges": dict(self.gauges),
+            "counters": {self._format_key(k): v for k, v in self.counters.snapshot()},
+            "gauges": {self._format_key(k): v for k, v in self.gauges.snapshot()},
             "timers": self._get_timer_stats(),
             "recent_metrics": self._get_recent_metrics()
         }
@@ -103,39 +221,90 @@ class MetricsCollector:
     def _get_timer_stats(self) -> Dict[str, Dict[str, float]]:
         """Calculate timer statistics"""
         stats = {}
-        for key, values in self.timers.items():
+        # Copy the item list and each sample buffer before summarizing so a
+        # snapshot taken off the event loop never sees a buffer mid-trim
+        for key, values in list(self.timers.items()):
             if values:
-                sorted_values = sorted(values)
-                stats[key] = {
-                    "count": len(values),
-                    "mean": sum(values) / len(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "p50": sorted_values[len(sorted_values) // 2],
-                    "p95": sorted_values[int(len(sorted_values) * 0.95)],
-                    "p99": sorted_values[int(len(sorted_values) * 0.99)]
-                }
+                stats[self._format_key(key)] = self._summarize_timer(values[:])
         return stats
     
+    @staticmethod
+    def _summarize_timer(values: array) -> Dict[str, float]:
+        """Summarize one timer's samples (count, mean, min, max, percentiles)"""
+        count = len(values)
+        ranks = (count // 2, int(count * 0.95), int(count * 0.99))
+        
+        if np is None:
+            sorted_values = sorted(values)
+            return {
+                "count": count,
+                "mean": sum(values) / count,
+                "min": sorted_values[0],
+                "max": sorted_values[-1],
+                "p50": sorted_values[ranks[0]],
+                "p95": sorted_values[ranks[1]],
+                "p99": sorted_values[ranks[2]]
+            }
+        
+        # Reason: partition places just the needed ranks in O(n) instead of a
+        # full sort, and all reductions run in C over the unboxed buffer
+        samples = np.frombuffer(values, dtype=np.float64)
+        partitioned = np.partition(samples, ranks)
+        return {
+            "count": count,
+            "mean": float(samples.mean()),
+            "min": float(samples.min()),
+            "max": float(samples.max()),
+            "p50": float(partitioned[ranks[0]]),
+            "p95": float(partitioned[ranks[1]]),
+            "p99": float(partitioned[ranks[2]])
+        }
+    
     def _get_recent_metrics(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent metric events"""
-        all_metrics = []
-        for metric_list in self.metrics.values():
-            all_metrics.extend([asdict(m) for m in metric_list])
-        
-        # Sort by timestamp and return most recent
-        all_metrics.sort(key=lambda x: x["timestamp"], reverse=True)
-        return all_metrics[:limit]
+        # Reason: nlargest keeps only `limit` events instead of sorting every
+        # recorded event, and only the survivors are converted to dicts
+        recent = heapq.nlargest(
+            limit,
+            (m for metric_list in list(self.metrics.values()) for m in list(metric_list)),
+            key=attrgetter("timestamp"),
+        )
+        return [
+            {
+                "name": m.name,
+                "type": m.type.value,
+                "value": m.value,
+                "timestamp": m.timestamp,
+                "tags": m.tags or {},
+                "metadata": m.metadata,
+            }
+            for m in recent
+        ]
     
-    async def export_metrics(self, filepath: str = None):
-        """Export metrics to file"""
+    async def export_metrics(self, filepath: str = None, indent: bool = True):
+        """Export metrics to file
+        
+        Args:
+            filepath: Destination path (defaults to a timestamped file in logs/)
+            indent: Pretty-print the JSON; pass False for machine consumers
+        """
         if not filepath:
             filepath = f"logs/metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        # Reason: building the snapshot (timer percentiles, recent events),
+        # serializing it and writing it are all CPU/IO work, so the whole
+        # export runs on a worker thread and never blocks the event loop
+        await asyncio.to_thread(self._write_export, Path(filepath), indent)
+    
+    def _write_export(self, path: Path, indent: bool):
+        """Snapshot, serialize and write metrics to disk"""
+        options = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        data = orjson.dumps(self.get_metrics(), default=str, option=options)
         
-        with open(filepath, "w") as f:
-            json.dump(self.get_metrics(), f, indent=2, default=str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
     
     def reset(self):
         """Reset all metrics"""
@@ -169,18 +338,39 @@ class ApplicationMetrics:
     
     def __init__(self):
         self.collector = MetricsCollector()
+        # Prebuilt metric handles per (endpoint, method, status_code)
+        self._api_handles: Dict[Tuple[str, str, int], Tuple[Tuple[Callable, ...], Callable]] = {}
         
     # API Metrics
     def track_api_request(self, endpoint: str, method: str, status_code: int, duration: float):
         """Track API request metrics"""
-        self.collector.increment("api.requests.total", tags={"endpoint": endpoint, "method": method})
-        self.collector.increment(f"api.requests.status.{status_code}")
-        self.collector.record_duration("api.request.duration", duration, tags={"endpoint": endpoint})
+        # Reason: handles are resolved once per route/status, so repeat requests
+        # skip building tag dicts and metric keys
+        handles = self._api_handles.get((endpoint, method, status_code))
+        if handles is None:
+            handles = self._build_api_handles(endpoint, method, status_code)
+            self._api_handles[(endpoint, method, status_code)] = handles
         
+        counters, record_duration = handles
+        for increment in counters:
+            increment()
+        record_duration(duration)
+    
+    def _build_api_handles(self, endpoint: str, method: str, status_code: int):
+        """Build the counter and timer handles for one API route/status"""
+        counters = [
+            self.collector.counter("api.requests.total", tags={"endpoint": endpoint, "method": method}),
+            self.collector.counter(f"api.requests.status.{status_code}"),
+        ]
         if status_code >= 500:
-            self.collector.increment("api.errors.5xx", tags={"endpoint": endpoint})
+            counters.append(self.collector.counter("api.errors.5xx", tags={"endpoint": endpoint}))
         elif status_code >= 400:
-            self.collector.increment("api.errors.4xx", tags={"endpoint": endpoint})
+            counters.append(self.collector.counter("api.errors.4xx", tags={"endpoint": endpoint}))
+        
+        record_duration = self.collector.duration_recorder(
+            "api.request.duration", tags={"endpoint": endpoint}
+        )
+        return tuple(counters), record_duration
     
     # Authentication Metrics
     def track_auth_attempt(self, success: bool, provider: str = "gmail"):
@@ -248,39 +438,39 @@ class ApplicationMetrics:
         """Track WebSocket connections"""
         self.collector.increment("websocket.connections", tags={"event": event})
         if event == "connect":
-            current = self.collector.gauges.get("websocket.active", 0)
+            current = self.collector.get_gauge("websocket.active")
             self.collector.gauge("websocket.active", current + 1)
         elif event == "disconnect":
-            current = self.collector.gauges.get("websocket.active", 0)
+            current = self.collector.get_gauge("websocket.active")
             self.collector.gauge("websocket.active", max(0, current - 1))
     
     # Health Metrics
     def update_health_status(self, service: str, healthy: bool):
         """Update service health status"""
-        value = 1 if healthy else 0
-        self.collector.gauge(f"health.{service}", value)
+        self.collector.gauge(f"health.{service}", 1 if healthy else 0)
     
     def get_health_report(self) -> Dict[str, Any]:
         """Get system health report"""
-        metrics = self.collector.get_metrics()
-        
-        # Calculate health scores
-        error_rate = 0
-        if "api.requests.total" in metrics["counters"]:
-            total_requests = metrics["counters"]["api.requests.total"]
-            errors = metrics["counters"].get("api.errors.5xx", 0) + metrics["counters"].get("api.errors.4xx", 0)
-            error_rate = (errors / total_requests * 100) if total_requests > 0 else 0
+        # Reason: read only the values the report needs rather than building
+        # a full metrics snapshot (timer percentiles, recent events) per poll
+        collector = self.collector
+        total_requests = collector.get_counter_total("api.requests.total")
+        errors = (
+            collector.get_counter_total("api.errors.5xx")
+            + collector.get_counter_total("api.errors.4xx")
+        )
+        error_rate = (errors / total_requests * 100) if total_requests > 0 else 0
         
         return {
             "status": "healthy" if error_rate < 5 else "degraded" if error_rate < 10 else "unhealthy",
-            "uptime": metrics["uptime_seconds"],
+            "uptime": time.time() - collector.start_time,
             "error_rate": error_rate,
-            "active_connections": metrics["gauges"].get("websocket.active", 0),
+            "active_connections": collector.get_gauge("websocket.active"),
+            # Reason: flags are read from the health.* gauges themselves, so
+            # the report can never disagree with exports (e.g. after reset())
             "services": {
-                "database": bool(metrics["gauges"].get("health.database", 0)),
-                "redis": bool(metrics["gauges"].get("health.redis", 0)),
-                "elevenlabs": bool(metrics["gauges"].get("health.elevenlabs", 0)),
-                "gmail": bool(metrics["gauges"].get("health.gmail", 0))
+                service: bool(collector.get_gauge(f"health.{service}"))
+                for service in HEALTH_SERVICES
             }
         }
 
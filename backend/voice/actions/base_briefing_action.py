@@ -6,18 +6,36 @@ for all voice actions during newsletter briefings.
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 from vocode.streaming.action.base_action import BaseAction
 from vocode.streaming.models.actions import ActionConfig, ActionInput, ActionOutput
 
-from backend.config import get_database_session
+from backend.config import get_database_session, get_readonly_database_session
 from backend.services.session_manager import BriefingSessionManager
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized since a session reuses one ID per turn."""
+    return UUID(value)
+
+
+# (substrings, spoken message) pairs checked in order against the error text
+_ERROR_PATTERNS = (
+    (("session",), "I'm having trouble accessing your briefing session. Let me try to restart it."),
+    (("story",), "I couldn't find that story. Let me continue with the next one."),
+    (("database", "connection"), "I'm having a temporary connection issue. Please try again in a moment."),
+)
+_DEFAULT_ERROR_MESSAGE = "I encountered an issue processing your request. Let me continue with your briefing."
+
+
 class BriefingActionConfig(ActionConfig, type="action_briefing_base"):
     """Base configuration for briefing actions."""
     
@@ -54,24 +72,27 @@ class BaseBriefingAction(BaseAction[BriefingActionConfig, BriefingActionInput, B
             action_config: Configuration for the action
         """
         super().__init__(action_config=action_config)
-        self._session_managers = {}  # Cache session managers by session
 
-    async def get_session_manager(self, session_id: str) -> BriefingSessionManager:
+    @asynccontextmanager
+    async def session_manager(
+        self, readonly: bool = False
+    ) -> AsyncIterator[BriefingSessionManager]:
         """
-        Get or create session manager for the given session.
+        Open a session manager bound to a fresh database session.
+
+        The manager is only valid inside the ``async with`` block; its
+        database session is closed on exit, so managers are never cached
+        across action invocations.
 
         Args:
-            session_id: ID of the briefing session
+            readonly: Use a read-only session for actions that never write
 
-        Returns:
+        Yields:
             BriefingSessionManager instance
         """
-        if session_id not in self._session_managers:
-            # Create new session manager with database session
-            async with get_database_session() as db_session:
-                self._session_managers[session_id] = BriefingSessionManager(db_session)
-
-        return self._session_managers[session_id]
+        open_session = get_readonly_database_session if readonly else get_database_session
+        async with open_session() as db_session:
+            yield BriefingSessionManager(db_session)
 
     async def run(self, action_input: ActionInput[BriefingActionInput]) -> ActionOutput[BriefingActionResponse]:
         """
@@ -102,26 +123,37 @@ class BaseBriefingAction(BaseAction[BriefingActionConfig, BriefingActionInput, B
             ValueError: If session_id is invalid
         """
         try:
-            return UUID(action_input.session_id)
+            return _parse_uuid(action_input.session_id)
         except (ValueError, TypeError) as e:
             logger.error(
                 f"Invalid session_id in action input: {action_input.session_id}"
             )
             raise ValueError(f"Invalid session ID: {action_input.session_id}") from e
 
-    def _log_action(self, action_name: str, session_id: str, details: str = "") -> None:
+    def _log_action(
+        self, action_name: str, session_id: UUID | str, details: str = "", *args
+    ) -> None:
         """
         Log action execution for debugging and monitoring.
 
+        The message is only formatted when INFO logging is enabled, so
+        callers pass ``details`` as a %-format template plus ``args``.
+
         Args:
             action_name: Name of the action being executed
             session_id: Session ID for the action
-            details: Additional details to log
+            details: Additional details to log (%-format template)
+            *args: Values substituted into ``details``
         """
-        log_msg = f"Action '{action_name}' executed for session {session_id}"
         if details:
-            log_msg += f" - {details}"
-        logger.info(log_msg)
+            logger.info(
+                "Action '%s' executed for session %s - " + details,
+                action_name,
+                session_id,
+                *args,
+            )
+        else:
+            logger.info("Action '%s' executed for session %s", action_name, session_id)
 
     def _handle_action_error(self, error: Exception, session_id: str) -> ActionOutput[BriefingActionResponse]:
         """
@@ -137,14 +169,13 @@ class BaseBriefingAction(BaseAction[BriefingActionConfig, BriefingActionInput, B
         logger.error(f"Action error in session {session_id}: {error}")
 
         # Return user-friendly error messages
-        if "session" in str(error).lower():
-            error_msg = "I'm having trouble accessing your briefing session. Let me try to restart it."
-        elif "story" in str(error).lower():
-            error_msg = "I couldn't find that story. Let me continue with the next one."
-        elif "database" in str(error).lower() or "connection" in str(error).lower():
-            error_msg = "I'm having a temporary connection issue. Please try again in a moment."
-        else:
-            error_msg = "I encountered an issue processing your request. Let me continue with your briefing."
+        # Reason: lowercase the message once rather than once per substring test
+        error_text = str(error).casefold()
+        error_msg = _DEFAULT_ERROR_MESSAGE
+        for substrings, message in _ERROR_PATTERNS:
+            if any(substring in error_text for substring in substrings):
+                error_msg = message
+                break
         
         return ActionOutput(
             action_type="action_briefing_base",
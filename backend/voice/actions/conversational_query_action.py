@@ -5,18 +5,123 @@ Handles complex user questions about stories using AI/LLM processing
 to provide context-aware, intelligent responses during briefings.
 """
 
+import asyncio
 import logging
+import re
+from collections import OrderedDict
 
 import openai
-from openai import AsyncOpenAI
+import orjson
 
-from backend.config import get_database_session, settings
-from backend.services.session_manager import BriefingSessionManager
+from backend.config import settings
+from backend.voice.agent_config import PHRASE_ACTIONS
+from backend.voice.openai_client import get_openai_client
+from backend.voice.openai_parallel import get_openai_coordinator
+from backend.voice.semantic_cache import SemanticQueryCache, normalize
 
 from .base_briefing_action import BaseBriefingAction, BriefingActionInput
+from .metadata_action import MetadataAction
+from .tell_more_action import TellMeMoreAction
 
 logger = logging.getLogger(__name__)
 
+# Small embedding model with reduced dimensions keeps lookups cheap
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 256
+
+# Sentence-ending punctuation; responses without one get a period
+_TERMINATORS = frozenset(".!?")
+
+# Shared across action instances, since actions may be created per turn
+_response_cache = SemanticQueryCache()
+
+# Read-only actions that can answer a query locally, by trigger action type.
+# Skips are never routed here: a question that mentions "next" must not
+# advance the briefing.
+_LOCAL_ACTION_CLASSES = {
+    "action_metadata": MetadataAction,
+    "action_tell_more": TellMeMoreAction,
+}
+_local_actions: dict[str, BaseBriefingAction] = {}
+
+# Whole-word trigger phrases per routable action, longest first, so
+# "expand" never matches inside "expansion"
+_LOCAL_PHRASE_PATTERNS = {
+    action_type: re.compile(
+        r"\b(?:"
+        + "|".join(
+            re.escape(phrase)
+            for phrase in sorted(PHRASE_ACTIONS[action_type], key=len, reverse=True)
+        )
+        + r")\b"
+    )
+    for action_type in _LOCAL_ACTION_CLASSES
+}
+# Reason: most queries contain no local trigger phrase at all; one plain
+# alternation over every phrase rejects them in a single scan instead of a
+# substitution pass per action
+_ANY_LOCAL_PHRASE = re.compile(
+    "|".join(
+        re.escape(phrase)
+        for action_type in _LOCAL_ACTION_CLASSES
+        for phrase in PHRASE_ACTIONS[action_type]
+    )
+)
+
+# Words that may surround a trigger phrase without adding a question of their
+# own ("can you tell me more about it please"); any other leftover word means
+# the user asked something specific, which only the LLM can answer
+_FILLER_WORDS = frozenset(
+    (
+        "a about again and bit can could from give go hey i is it just like "
+        "little me now oh ok okay on one please so some that the this to uh um "
+        "us want was well would yeah you"
+    ).split()
+)
+_WORD = re.compile(r"[a-z']+")
+
+# Common follow-ups answered ahead of time when prewarming is enabled, so
+# the first paraphrase of one is a semantic cache hit
+ANTICIPATED_QUESTIONS = (
+    "What is this story about?",
+    "Why does this matter?",
+    "Who is involved in this story?",
+    "What happened next?",
+    "When did this happen?",
+    "Where did this happen?",
+    "What are the key numbers in this story?",
+    "What is the background to this story?",
+)
+
+# Story IDs already prewarmed (bounded like the response cache), and the
+# in-flight prewarm tasks, referenced so they are not garbage collected
+_prewarmed_stories: OrderedDict[str, None] = OrderedDict()
+_prewarm_tasks: set[asyncio.Task] = set()
+
+# Rendered LLM context per story ID (story content is fixed once ingested)
+STORY_CONTEXT_CACHE_SIZE = 512
+_story_context_cache: OrderedDict[str, str] = OrderedDict()
+
+# Static instructions sent first on every request. OpenAI caches prompt
+# prefixes of 1024+ tokens automatically, so everything that is identical
+# across calls (these instructions, then the story context) goes before the
+# user's question to maximize the cached prefix.
+SYSTEM_PROMPT = """You are an AI assistant helping users understand newsletter stories during an audio briefing.
+
+Your role is to:
+- Answer questions about the current story with accuracy and clarity
+- Provide relevant context and explanations
+- Keep responses concise but informative (ideally 1-3 sentences)
+- Speak naturally as if in a conversation
+- Stay focused on the story content provided
+
+Guidelines:
+- If asked about external context, provide what you know but acknowledge limitations
+- If the question can't be answered from the story content, say so honestly
+- Keep the tone conversational and helpful
+- Don't make up facts not present in the story
+- Answer the user's question based on the story context provided, keeping it conversational and concise"""
+
 
 class ConversationalQueryAction(BaseBriefingAction):
     """
@@ -32,7 +137,7 @@ class ConversationalQueryAction(BaseBriefingAction):
             action_name="conversational_query",
             description="Handle complex questions about stories using AI-powered responses with full context",
         )
-        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.openai_client = get_openai_client()
 
     async def run(self, action_input: BriefingActionInput, conversation_id: str) -> str:
         """
@@ -47,129 +152,337 @@ class ConversationalQueryAction(BaseBriefingAction):
         """
         try:
             session_id = self._extract_session_id(action_input)
-            user_query = action_input.user_query or "Can you tell me more about this?"
+            user_query = (action_input.user_query or "").strip()
+
+            # An empty query is a plain request for more detail, which the stored
+            # summary answers without the metadata query or an LLM call
+            if not user_query:
+                self._log_action("conversational_query", session_id, "Empty query")
+                return await self._shared_local_action("action_tell_more").run(
+                    action_input, conversation_id
+                )
 
             self._log_action(
-                "conversational_query", str(session_id), f"Query: {user_query}"
+                "conversational_query", session_id, "Query: %s", user_query
             )
 
-            # Get session manager with fresh database connection
-            async with get_database_session() as db_session:
-                session_manager = BriefingSessionManager(db_session)
+            # Queries that plainly ask for metadata or more detail are answered
+            # by those actions directly, without an embedding or LLM call
+            local_action = self._get_local_action(user_query)
+            if local_action is not None:
+                logger.info(
+                    "Routing query to %s for session %s",
+                    type(local_action).__name__,
+                    session_id,
+                )
+                return await local_action.run(action_input, conversation_id)
 
+            # Get session manager with a fresh read-only database connection
+            async with self.session_manager(readonly=True) as session_manager:
                 # Get current story and metadata
                 current_story = await session_manager.get_current_story(session_id)
                 if not current_story:
                     return "I don't have a current story to answer questions about. Let me continue with your briefing."
 
-                metadata = await session_manager.get_story_metadata(session_id)
+                # Reuse the loaded story; its issue and newsletter are already loaded
+                metadata = await session_manager.get_story_metadata(
+                    session_id, current_story
+                )
 
                 # Build context for the LLM
-                story_context = self._build_story_context(
-                    current_story, metadata, user_query
-                )
+                story_context = self._build_story_context(current_story, metadata)
+
+                if settings.openai_prewarm_followups:
+                    self._schedule_prewarm(str(current_story.id), story_context)
 
                 # Get AI response
-                ai_response = await self._get_ai_response(story_context, user_query)
+                ai_response = await self._get_ai_response(
+                    story_context, user_query, str(current_story.id)
+                )
 
                 # Format response for voice
                 response = ai_response
-                if not response.endswith(("?", ".", "!")):
+                if response[-1:] not in _TERMINATORS:
                     response += "."
 
                 # Add transition back to briefing if appropriate
                 if len(response) > 200:  # For longer responses, add explicit transition
                     response += " Would you like me to continue with the next story?"
 
-                logger.info(f"Generated AI response for query in session {session_id}")
+                logger.info("Generated AI response for query in session %s", session_id)
                 return response
 
         except Exception as e:
             logger.error(f"Error in conversational query: {e}")
             return "I'm having trouble processing your question right now. Let me continue with your briefing."
 
-    def _build_story_context(
-        self, story, metadata: dict | None, user_query: str
-    ) -> str:
+    @staticmethod
+    def _get_local_action(user_query: str) -> BaseBriefingAction | None:
+        """
+        Find a read-only action that can answer the query without the LLM.
+
+        A query is routed only when the whole utterance is one action's
+        trigger phrase, give or take filler words; specific questions such
+        as "tell me more about the CEO" go to the LLM.
+
+        Args:
+            user_query: User's question
+
+        Returns:
+            Shared action instance, or None to use the LLM
+        """
+        text = user_query.lower()
+        if _ANY_LOCAL_PHRASE.search(text) is None:
+            return None
+
+        for action_type, pattern in _LOCAL_PHRASE_PATTERNS.items():
+            remainder, hits = pattern.subn(" ", text)
+            if hits and _FILLER_WORDS.issuperset(_WORD.findall(remainder)):
+                return ConversationalQueryAction._shared_local_action(action_type)
+        return None
+
+    @staticmethod
+    def _shared_local_action(action_type: str) -> BaseBriefingAction:
+        """
+        Get the shared instance of a local action, creating it on first use.
+
+        Args:
+            action_type: Key into _LOCAL_ACTION_CLASSES
+
+        Returns:
+            Shared action instance
+        """
+        action = _local_actions.get(action_type)
+        if action is None:
+            action = _local_actions[action_type] = _LOCAL_ACTION_CLASSES[action_type]()
+        return action
+
+    def _build_story_context(self, story, metadata: dict | None) -> str:
         """
         Build comprehensive context for the LLM prompt.
 
+        The context depends only on the story and its metadata, so it is
+        rendered once per story and reused for every follow-up question.
+
         Args:
             story: Current story object
             metadata: Story metadata dictionary
-            user_query: User's question
 
         Returns:
             Formatted context string
         """
-        context_parts = []
+        story_key = str(story.id)
+        context = _story_context_cache.get(story_key)
+        if context is not None:
+            _story_context_cache.move_to_end(story_key)
+            return context
 
         # Story content
-        context_parts.append(f"HEADLINE: {story.headline}")
-        context_parts.append(f"BRIEF SUMMARY: {story.one_sentence_summary}")
-
+        context = (
+            f"HEADLINE: {story.headline}\nBRIEF SUMMARY: {story.one_sentence_summary}"
+        )
         if story.full_text_summary:
-            context_parts.append(f"DETAILED SUMMARY: {story.full_text_summary}")
+            context += f"\nDETAILED SUMMARY: {story.full_text_summary}"
 
         # Metadata context
         if metadata:
-            context_parts.append(
-                f"SOURCE: {metadata.get('newsletter_name', 'Unknown Newsletter')}"
+            context += (
+                f"\nSOURCE: {metadata.get('newsletter_name', 'Unknown Newsletter')}"
             )
             if metadata.get("publisher"):
-                context_parts.append(f"PUBLISHER: {metadata['publisher']}")
+                context += f"\nPUBLISHER: {metadata['publisher']}"
             if metadata.get("issue_date"):
-                context_parts.append(f"PUBLISHED: {metadata['issue_date']}")
+                context += f"\nPUBLISHED: {metadata['issue_date']}"
             if metadata.get("issue_subject"):
-                context_parts.append(f"ISSUE TITLE: {metadata['issue_subject']}")
+                context += f"\nISSUE TITLE: {metadata['issue_subject']}"
+
+            # Reason: only cache complete contexts; a missing-metadata render
+            # would otherwise stick for the story
+            _story_context_cache[story_key] = context
+            if len(_story_context_cache) > STORY_CONTEXT_CACHE_SIZE:
+                _story_context_cache.popitem(last=False)
 
-        return "\n".join(context_parts)
+        return context
 
-    async def _get_ai_response(self, story_context: str, user_query: str) -> str:
+    async def _embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
-        Get AI response using OpenAI API.
+        Embed several texts with a single embeddings request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            L2-normalized embeddings, in the same order as ``texts``
+        """
+        async with get_openai_coordinator().slot():
+            result = await self.openai_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts,
+                dimensions=EMBEDDING_DIMENSIONS,
+            )
+        # Reason: the API does not promise response order; index says which input
+        ordered = sorted(result.data, key=lambda item: item.index)
+        return [normalize(item.embedding) for item in ordered]
+
+    async def _embed_query(self, user_query: str) -> list[float] | None:
+        """
+        Embed a user question for semantic cache lookups.
 
         Args:
-            story_context: Full story context
             user_query: User's question
 
         Returns:
-            AI-generated response
+            L2-normalized embedding, or None if embedding failed
         """
-        system_prompt = """You are an AI assistant helping users understand newsletter stories during an audio briefing.
+        try:
+            return (await self._embed_texts([user_query]))[0]
+        except Exception as e:
+            # Reason: the cache is an optimization; fall through to the LLM
+            logger.warning(f"Query embedding failed, skipping response cache: {e}")
+            return None
 
-Your role is to:
-- Answer questions about the current story with accuracy and clarity
-- Provide relevant context and explanations
-- Keep responses concise but informative (ideally 1-3 sentences)
-- Speak naturally as if in a conversation
-- Stay focused on the story content provided
+    def _schedule_prewarm(self, story_id: str, story_context: str) -> None:
+        """
+        Start answering anticipated questions for a story in the background.
 
-Guidelines:
-- If asked about external context, provide what you know but acknowledge limitations
-- If the question can't be answered from the story content, say so honestly
-- Keep the tone conversational and helpful
-- Don't make up facts not present in the story"""
+        Each story is prewarmed at most once per process; the live query is
+        not delayed by it.
+
+        Args:
+            story_id: ID of the story being discussed
+            story_context: Rendered story context for the LLM
+        """
+        if story_id in _prewarmed_stories:
+            return
+        _prewarmed_stories[story_id] = None
+        if len(_prewarmed_stories) > _response_cache.max_stories:
+            _prewarmed_stories.popitem(last=False)
 
-        user_prompt = f"""Story Context:
-{story_context}
+        task = asyncio.create_task(self._prewarm_story(story_id, story_context))
+        _prewarm_tasks.add(task)
+        task.add_done_callback(_prewarm_tasks.discard)
 
-User Question: {user_query}
+    async def _prewarm_story(self, story_id: str, story_context: str) -> None:
+        """
+        Cache answers to ANTICIPATED_QUESTIONS for a story.
 
-Please provide a helpful, accurate response to the user's question based on the story context above. Keep it conversational and concise."""
+        All questions are answered by one chat completion and embedded by one
+        embeddings request, instead of one round-trip of each per question.
 
+        Args:
+            story_id: ID of the story being discussed
+            story_context: Rendered story context for the LLM
+        """
+        questions = "\n".join(
+            f"{i}. {question}" for i, question in enumerate(ANTICIPATED_QUESTIONS, 1)
+        )
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",  # Use cost-effective model for quick responses
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=200,  # Keep responses concise for voice
-                temperature=0.7,  # Balanced creativity and consistency
+            async with get_openai_coordinator().slot():
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {
+                            "role": "system",
+                            "content": f"Story Context:\n{story_context}",
+                        },
+                        {
+                            "role": "user",
+                            "content": (
+                                "Answer each of these questions about the story. "
+                                'Return a JSON object {"answers": [...]} with one '
+                                f"answer string per question, in order:\n{questions}"
+                            ),
+                        },
+                    ],
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                )
+            answers = orjson.loads(response.choices[0].message.content)["answers"]
+            if len(answers) != len(ANTICIPATED_QUESTIONS):
+                raise ValueError(
+                    f"expected {len(ANTICIPATED_QUESTIONS)} answers, got {len(answers)}"
+                )
+
+            embeddings = await self._embed_texts(list(ANTICIPATED_QUESTIONS))
+        except Exception as e:
+            # Reason: prewarming is an optimization; live queries still work
+            logger.warning(f"Prewarming follow-ups failed for story {story_id}: {e}")
+            _prewarmed_stories.pop(story_id, None)
+            return
+
+        for embedding, answer in zip(embeddings, answers, strict=True):
+            if isinstance(answer, str) and answer.strip():
+                _response_cache.store(story_id, embedding, answer.strip())
+        logger.info(
+            "Prewarmed %d follow-up answers for story %s", len(answers), story_id
+        )
+
+    def _log_prompt_cache_usage(self, response) -> None:
+        """
+        Log how many prompt tokens were served from OpenAI's prefix cache.
+
+        Args:
+            response: Chat completion response
+        """
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is not None:
+            logger.debug(
+                "Prompt cache: %s/%s prompt tokens cached",
+                cached_tokens,
+                usage.prompt_tokens,
             )
 
-            return response.choices[0].message.content.strip()
+    async def _get_ai_response(
+        self, story_context: str, user_query: str, story_id: str | None = None
+    ) -> str:
+        """
+        Get AI response using OpenAI API.
+
+        When a story ID is given, answers to semantically similar questions
+        about the same story are served from the response cache.
+
+        Args:
+            story_context: Full story context
+            user_query: User's question
+            story_id: ID of the story the question is about
+
+        Returns:
+            AI-generated response
+        """
+        embedding = await self._embed_query(user_query) if story_id else None
+        if embedding is not None:
+            cached_response = _response_cache.lookup(story_id, embedding)
+            if cached_response is not None:
+                logger.info("Semantic cache hit for story %s", story_id)
+                return cached_response
+
+        try:
+            # Reason: live queries from all sessions share one rate budget
+            async with get_openai_coordinator().slot():
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",  # Use cost-effective model for quick responses
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {
+                            "role": "system",
+                            "content": f"Story Context:\n{story_context}",
+                        },
+                        {"role": "user", "content": user_query},
+                    ],
+                    max_tokens=120,  # 1-3 spoken sentences; fewer tokens, less wall time
+                    temperature=0.7,  # Balanced creativity and consistency
+                )
+
+            self._log_prompt_cache_usage(response)
+
+            ai_response = response.choices[0].message.content.strip()
+            # Only successful answers are cached; fallback messages below are not
+            if embedding is not None:
+                _response_cache.store(story_id, embedding, ai_response)
+            return ai_response
 
         except openai.RateLimitError:
             logger.warning("OpenAI rate limit exceeded")
@@ -6,15 +6,136 @@ and other metadata when users ask questions like "what newsletter is this from?"
 """
 
 import logging
+import re
 from datetime import datetime
-
-from backend.config import get_database_session
-from backend.services.session_manager import BriefingSessionManager
+from functools import lru_cache
 
 from .base_briefing_action import BaseBriefingAction, BriefingActionInput
 
 logger = logging.getLogger(__name__)
 
+# Query keyword -> metadata intent
+INTENT_MAP = {
+    "newsletter": "source",
+    "newsletters": "source",
+    "source": "source",
+    "sources": "source",
+    "from": "source",
+    "when": "date",
+    "date": "date",
+    "published": "date",
+    "headline": "title",
+    "title": "title",
+    "subject": "subject",
+    "issue": "subject",
+}
+
+# When a query mentions several intents, the earliest listed wins
+_INTENT_PRIORITY = ("source", "date", "title", "subject")
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def _detect_intent(user_query: str | None) -> str:
+    """
+    Classify a metadata question by its keywords.
+
+    Args:
+        user_query: User's question, if any
+
+    Returns:
+        One of "source", "date", "title", "subject" or "general"
+    """
+    intents = {
+        INTENT_MAP[word]
+        for word in _WORD.findall((user_query or "").lower())
+        if word in INTENT_MAP
+    }
+    for intent in _INTENT_PRIORITY:
+        if intent in intents:
+            return intent
+    return "general"
+
+
+@lru_cache(maxsize=1024)
+def _format_issue_date(issue_date: str) -> str:
+    """
+    Format an ISO issue date for speech, e.g. "March 05, 2025".
+
+    Memoized since a briefing asks about the same few issue dates repeatedly.
+
+    Args:
+        issue_date: ISO-8601 date string
+
+    Returns:
+        Spoken date, or the raw string if it can't be parsed
+    """
+    try:
+        date_obj = datetime.fromisoformat(issue_date.replace("Z", "+00:00"))
+        return date_obj.strftime("%B %d, %Y")
+    except ValueError:
+        return issue_date
+
+
+# Renderers per intent. Precomputed phrasings from get_story_metadata are used
+# when present; the formatting fallbacks cover metadata produced without them
+def _render_source(metadata: dict) -> str:
+    """Describe which newsletter the story is from."""
+    if metadata.get("source_line"):
+        return f"{metadata['source_line']}."
+
+    response = f"This story is from {metadata['newsletter_name']}"
+    if metadata.get("publisher"):
+        response += f", published by {metadata['publisher']}"
+    return response + "."
+
+
+def _render_date(metadata: dict) -> str:
+    """Describe when the story was published."""
+    formatted_date = metadata.get("formatted_date")
+    if not formatted_date and metadata.get("issue_date"):
+        formatted_date = _format_issue_date(metadata["issue_date"])
+
+    if formatted_date:
+        return f"This story was published on {formatted_date}."
+    return "I don't have the publication date for this story."
+
+
+def _render_title(metadata: dict) -> str:
+    """Read out the story headline."""
+    return f"The headline is: {metadata['headline']}"
+
+
+def _render_subject(metadata: dict) -> str:
+    """Describe the issue the story came from."""
+    if metadata.get("issue_subject"):
+        return f"This is from the issue titled: {metadata['issue_subject']}"
+    return "I don't have the issue subject information."
+
+
+def _render_general(metadata: dict) -> str:
+    """Give all available metadata in one sentence."""
+    if metadata.get("summary_line"):
+        return metadata["summary_line"]
+
+    response = f"This story is from {metadata['newsletter_name']}"
+    if metadata.get("publisher"):
+        response += f", published by {metadata['publisher']}"
+    if metadata.get("issue_date"):
+        response += f", from {_format_issue_date(metadata['issue_date'])}"
+    if metadata.get("issue_subject"):
+        response += f". The issue was titled: {metadata['issue_subject']}"
+    return response + "."
+
+
+_INTENT_RENDERERS = {
+    "source": _render_source,
+    "date": _render_date,
+    "title": _render_title,
+    "subject": _render_subject,
+    "general": _render_general,
+}
+
 
 class MetadataAction(BaseBriefingAction):
     """
@@ -45,13 +166,11 @@ class MetadataAction(BaseBriefingAction):
         try:
             session_id = self._extract_session_id(action_input)
             self._log_action(
-                "story_metadata", str(session_id), f"Query: {action_input.user_query}"
+                "story_metadata", session_id, "Query: %s", action_input.user_query
             )
 
-            # Get session manager with fresh database connection
-            async with get_database_session() as db_session:
-                session_manager = BriefingSessionManager(db_session)
-
+            # Get session manager with a fresh read-only database connection
+            async with self.session_manager(readonly=True) as session_manager:
                 # Get story metadata
                 metadata = await session_manager.get_story_metadata(session_id)
                 if not metadata:
@@ -59,67 +178,11 @@ class MetadataAction(BaseBriefingAction):
                     return "I don't have metadata information for the current story. Let me continue with your briefing."
 
                 # Format the response based on what was asked
-                user_query = (action_input.user_query or "").lower()
-
-                if any(word in user_query for word in ["newsletter", "source", "from"]):
-                    # User asked about the newsletter source
-                    response = f"This story is from {metadata['newsletter_name']}"
-                    if metadata.get("publisher"):
-                        response += f", published by {metadata['publisher']}"
-                    response += "."
-
-                elif any(word in user_query for word in ["when", "date", "published"]):
-                    # User asked about publication date
-                    if metadata.get("issue_date"):
-                        try:
-                            date_obj = datetime.fromisoformat(
-                                metadata["issue_date"].replace("Z", "+00:00")
-                            )
-                            formatted_date = date_obj.strftime("%B %d, %Y")
-                            response = f"This story was published on {formatted_date}."
-                        except ValueError:
-                            response = (
-                                f"This story was published on {metadata['issue_date']}."
-                            )
-                    else:
-                        response = "I don't have the publication date for this story."
-
-                elif any(word in user_query for word in ["headline", "title"]):
-                    # User asked about the headline
-                    response = f"The headline is: {metadata['headline']}"
-
-                elif any(word in user_query for word in ["subject", "issue"]):
-                    # User asked about the issue subject
-                    if metadata.get("issue_subject"):
-                        response = f"This is from the issue titled: {metadata['issue_subject']}"
-                    else:
-                        response = "I don't have the issue subject information."
-
-                else:
-                    # General metadata request - provide comprehensive info
-                    response = f"This story is from {metadata['newsletter_name']}"
-
-                    if metadata.get("publisher"):
-                        response += f", published by {metadata['publisher']}"
-
-                    if metadata.get("issue_date"):
-                        try:
-                            date_obj = datetime.fromisoformat(
-                                metadata["issue_date"].replace("Z", "+00:00")
-                            )
-                            formatted_date = date_obj.strftime("%B %d, %Y")
-                            response += f", from {formatted_date}"
-                        except ValueError:
-                            response += f", from {metadata['issue_date']}"
-
-                    if metadata.get("issue_subject"):
-                        response += (
-                            f". The issue was titled: {metadata['issue_subject']}"
-                        )
-
-                    response += "."
-
-                logger.info(f"Provided metadata for story in session {session_id}")
+                response = _INTENT_RENDERERS[_detect_intent(action_input.user_query)](
+                    metadata
+                )
+
+                logger.info("Provided metadata for story in session %s", session_id)
                 return response
 
         except Exception as e:
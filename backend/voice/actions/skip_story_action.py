@@ -7,9 +7,6 @@ using natural voice commands like "skip", "next", or "move on".
 
 import logging
 
-from backend.config import get_database_session
-from backend.services.session_manager import BriefingSessionManager
-
 from .base_briefing_action import BaseBriefingAction, BriefingActionInput
 
 logger = logging.getLogger(__name__)
@@ -43,12 +40,10 @@ class SkipStoryAction(BaseBriefingAction):
         """
         try:
             session_id = self._extract_session_id(action_input)
-            self._log_action("skip_story", str(session_id))
+            self._log_action("skip_story", session_id)
 
             # Get session manager with fresh database connection
-            async with get_database_session() as db_session:
-                session_manager = BriefingSessionManager(db_session)
-
+            async with self.session_manager() as session_manager:
                 # Advance to next story
                 next_story = await session_manager.advance_story(session_id)
 
@@ -64,12 +59,14 @@ class SkipStoryAction(BaseBriefingAction):
                         response += f" That's {remaining} more stories after this one."
 
                     logger.info(
-                        f"Session {session_id} skipped to story: {next_story.headline}"
+                        "Session %s skipped to story: %s",
+                        session_id,
+                        next_story.headline,
                     )
                     return response
                 else:
                     # End of briefing
-                    logger.info(f"Session {session_id} completed - no more stories")
+                    logger.info("Session %s completed - no more stories", session_id)
                     return "That was the last story in your briefing. Hope you have a great day! Your newsletter briefing is complete."
 
         except Exception as e:
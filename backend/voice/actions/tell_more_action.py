@@ -7,9 +7,6 @@ more information using phrases like "tell me more", "go deeper", etc.
 
 import logging
 
-from backend.config import get_database_session
-from backend.services.session_manager import BriefingSessionManager
-
 from .base_briefing_action import BaseBriefingAction, BriefingActionInput
 
 logger = logging.getLogger(__name__)
@@ -43,12 +40,10 @@ class TellMeMoreAction(BaseBriefingAction):
         """
         try:
             session_id = self._extract_session_id(action_input)
-            self._log_action("tell_me_more", str(session_id))
-
-            # Get session manager with fresh database connection
-            async with get_database_session() as db_session:
-                session_manager = BriefingSessionManager(db_session)
+            self._log_action("tell_me_more", session_id)
 
+            # Get session manager with a fresh read-only database connection
+            async with self.session_manager(readonly=True) as session_manager:
                 # Get current story
                 current_story = await session_manager.get_current_story(session_id)
                 if not current_story:
@@ -70,7 +65,9 @@ class TellMeMoreAction(BaseBriefingAction):
                 response += " Would you like me to continue with the next story, or do you have any questions about this one?"
 
                 logger.info(
-                    f"Provided detailed summary for story {current_story.id} in session {session_id}"
+                    "Provided detailed summary for story %s in session %s",
+                    current_story.id,
+                    session_id,
                 )
                 return response
 
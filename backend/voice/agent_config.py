@@ -6,6 +6,7 @@ interruptions during newsletter briefings.
 """
 
 import logging
+import re
 
 from vocode.streaming.models.actions import (
     ActionConfig,
@@ -53,100 +54,105 @@ class ConversationalQueryActionConfig(
     pass
 
 
-def create_briefing_agent_config(session_id: str) -> ChatGPTAgentConfig:
-    """
-    Create Vocode ChatGPT agent configuration with all briefing actions.
+# Trigger phrases per action type, matched as case-insensitive substrings
+SKIP_PHRASES = ("skip", "next", "move on", "skip this", "next story")
+TELL_MORE_PHRASES = ("tell me more", "go deeper", "full story", "more details", "expand")
+METADATA_PHRASES = (
+    "what newsletter",
+    "when published",
+    "what source",
+    "where is this from",
+    "publication date",
+)
 
-    Args:
-        session_id: ID of the active briefing session
+PHRASE_ACTIONS = {
+    "action_skip_story": SKIP_PHRASES,
+    "action_tell_more": TELL_MORE_PHRASES,
+    "action_metadata": METADATA_PHRASES,
+}
 
-    Returns:
-        Configured ChatGPT agent with phrase-triggered actions
-    """
 
-    # Define phrase triggers for skip story action
-    skip_triggers = PhraseBasedActionTrigger(
+def _build_phrase_trigger(phrases: tuple[str, ...]) -> PhraseBasedActionTrigger:
+    """Build a Vocode trigger firing when any phrase appears in the transcript."""
+    return PhraseBasedActionTrigger(
         type="action_trigger_phrase_based",
         config=PhraseBasedActionTriggerConfig(
             phrase_triggers=[
                 PhraseTrigger(
-                    phrase="skip", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="next", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="move on", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="skip this", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="next story", condition="phrase_condition_type_contains"
-                ),
+                    phrase=phrase, conditions=["phrase_condition_type_contains"]
+                )
+                for phrase in phrases
             ]
         ),
     )
 
-    # Define phrase triggers for tell me more action
-    tell_more_triggers = PhraseBasedActionTrigger(
-        type="action_trigger_phrase_based",
-        config=PhraseBasedActionTriggerConfig(
-            phrase_triggers=[
-                PhraseTrigger(
-                    phrase="tell me more", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="go deeper", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="full story", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="more details", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="expand", condition="phrase_condition_type_contains"
-                ),
-            ]
-        ),
-    )
 
-    # Define phrase triggers for metadata action
-    metadata_triggers = PhraseBasedActionTrigger(
-        type="action_trigger_phrase_based",
-        config=PhraseBasedActionTriggerConfig(
-            phrase_triggers=[
-                PhraseTrigger(
-                    phrase="what newsletter", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="when published", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="what source", condition="phrase_condition_type_contains"
-                ),
-                PhraseTrigger(
-                    phrase="where is this from",
-                    condition="phrase_condition_type_contains",
-                ),
-                PhraseTrigger(
-                    phrase="publication date",
-                    condition="phrase_condition_type_contains",
-                ),
-            ]
-        ),
+# Reason: trigger configs are identical for every session, so build them once
+# at import instead of ~15 pydantic models per conversation
+_SKIP_TRIGGERS = _build_phrase_trigger(SKIP_PHRASES)
+_TELL_MORE_TRIGGERS = _build_phrase_trigger(TELL_MORE_PHRASES)
+_METADATA_TRIGGERS = _build_phrase_trigger(METADATA_PHRASES)
+
+# Every phrase in one alternation (longest first), so a transcript is
+# scanned once no matter how many phrases are configured; the lookahead
+# lets matches overlap so one phrase never hides another
+_PHRASE_ACTION_LOOKUP = {
+    phrase: action_type
+    for action_type, phrases in PHRASE_ACTIONS.items()
+    for phrase in phrases
+}
+_PHRASE_PATTERN = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(phrase)
+            for phrase in sorted(_PHRASE_ACTION_LOOKUP, key=len, reverse=True)
+        )
     )
+)
 
-    # System prompt for the briefing agent
-    system_prompt = f"""You are a voice assistant delivering daily newsletter briefings. Your role is to:
+
+def match_phrase_actions(transcript: str) -> set[str]:
+    """
+    Find the actions whose trigger phrases appear in a transcript.
+
+    Args:
+        transcript: User utterance text
+
+    Returns:
+        Action types (e.g. "action_skip_story") with a matching phrase
+    """
+    return {
+        _PHRASE_ACTION_LOOKUP[match.group(1)]
+        for match in _PHRASE_PATTERN.finditer(transcript.lower())
+    }
+
+
+def match_skip_phrases(transcript: str) -> bool:
+    """Check whether a transcript contains a skip trigger phrase."""
+    return "action_skip_story" in match_phrase_actions(transcript)
+
+
+def match_tell_more_phrases(transcript: str) -> bool:
+    """Check whether a transcript contains a tell-me-more trigger phrase."""
+    return "action_tell_more" in match_phrase_actions(transcript)
+
+
+def match_metadata_phrases(transcript: str) -> bool:
+    """Check whether a transcript contains a metadata trigger phrase."""
+    return "action_metadata" in match_phrase_actions(transcript)
+
+
+# Briefing agent system prompt, split around the session ID so each session
+# start is a plain concatenation of two constant strings
+_AGENT_PROMPT_PREFIX = """You are a voice assistant delivering daily newsletter briefings. Your role is to:
 
 1. Present newsletter stories clearly and engagingly
 2. Handle user interruptions naturally and helpfully
 3. Keep users engaged with conversational transitions
 4. Provide context when switching between stories
 
-Current session: {session_id}
+Current session: """
+_AGENT_PROMPT_SUFFIX = """
 
 When delivering a story:
 - Start with a clear headline
@@ -160,6 +166,21 @@ When users ask questions not covered by your actions:
 
 Remember: This is a voice conversation, so speak naturally and conversationally."""
 
+
+def create_briefing_agent_config(session_id: str) -> ChatGPTAgentConfig:
+    """
+    Create Vocode ChatGPT agent configuration with all briefing actions.
+
+    Args:
+        session_id: ID of the active briefing session
+
+    Returns:
+        Configured ChatGPT agent with phrase-triggered actions
+    """
+
+    # System prompt for the briefing agent
+    system_prompt = _AGENT_PROMPT_PREFIX + session_id + _AGENT_PROMPT_SUFFIX
+
     # Create agent configuration
     agent_config = ChatGPTAgentConfig(
         system_message=system_prompt,
@@ -167,12 +188,12 @@ Remember: This is a voice conversation, so speak naturally and conversationally.
         temperature=0.7,  # Balanced creativity and consistency
         max_tokens=150,  # Keep responses concise for voice
         actions=[
-            SkipStoryActionConfig(session_id=session_id, action_trigger=skip_triggers),
+            SkipStoryActionConfig(session_id=session_id, action_trigger=_SKIP_TRIGGERS),
             TellMoreActionConfig(
-                session_id=session_id, action_trigger=tell_more_triggers
+                session_id=session_id, action_trigger=_TELL_MORE_TRIGGERS
             ),
             MetadataActionConfig(
-                session_id=session_id, action_trigger=metadata_triggers
+                session_id=session_id, action_trigger=_METADATA_TRIGGERS
             ),
             # Note: Conversational queries don't need phrase triggers
             # as they handle general questions
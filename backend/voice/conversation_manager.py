@@ -5,34 +5,256 @@ Handles the setup and lifecycle of voice conversations during daily
 newsletter briefings, including agent configuration and action coordination.
 """
 
+import asyncio
+import importlib
 import logging
-from typing import Any
+from collections import deque
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from vocode.streaming.action.abstract_factory import AbstractActionFactory
 from vocode.streaming.models.actions import ActionConfig
-from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
-from vocode.streaming.models.transcriber import DeepgramTranscriberConfig
-from vocode.streaming.streaming_conversation import StreamingConversation
 
 from backend.config import settings
-from backend.voice.actions.conversational_query_action import ConversationalQueryAction
-from backend.voice.actions.metadata_action import MetadataAction
-from backend.voice.actions.skip_story_action import SkipStoryAction
-from backend.voice.actions.tell_more_action import TellMeMoreAction
-from backend.voice.agent_config import (
-    create_briefing_agent_config,
-)
+
+if TYPE_CHECKING:
+    from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+    from vocode.streaming.models.transcriber import DeepgramTranscriberConfig
+    from vocode.streaming.streaming_conversation import StreamingConversation
+
+    from backend.voice.actions.base_briefing_action import BaseBriefingAction
+else:
+    # Imported on first use by _get_streaming_conversation_class(); it pulls
+    # in Vocode's transcriber, synthesizer and agent stacks, which processes
+    # that never start a conversation don't need
+    StreamingConversation = None
 
 logger = logging.getLogger(__name__)
 
 
+# Briefing action (module, class) by action config type, imported on first use
+_ACTION_CLASSES = {
+    "action_skip_story": ("backend.voice.actions.skip_story_action", "SkipStoryAction"),
+    "action_tell_more": ("backend.voice.actions.tell_more_action", "TellMeMoreAction"),
+    "action_metadata": ("backend.voice.actions.metadata_action", "MetadataAction"),
+    "action_conversational_query": (
+        "backend.voice.actions.conversational_query_action",
+        "ConversationalQueryAction",
+    ),
+}
+
+
+def _get_streaming_conversation_class() -> type["StreamingConversation"]:
+    """Import Vocode's StreamingConversation on first use."""
+    global StreamingConversation
+    if StreamingConversation is None:
+        from vocode.streaming.streaming_conversation import (
+            StreamingConversation as conversation_class,
+        )
+
+        StreamingConversation = conversation_class
+    return StreamingConversation
+
+
+@cache
+def _get_synthesizer_config() -> "ElevenLabsSynthesizerConfig":
+    """Build the shared ElevenLabs TTS config, tuned for streaming."""
+    from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+
+    return ElevenLabsSynthesizerConfig(
+        api_key=settings.elevenlabs_api_key,
+        voice_id=settings.default_voice_id,
+        model_id=settings.default_voice_model,
+        optimize_streaming_latency=settings.audio_streaming_latency,
+        stability=0.5,  # Balance between consistency and expressiveness
+        similarity_boost=0.75,  # Enhance voice similarity
+        streaming_chunk_size=1024,  # Optimize for real-time streaming
+        # Reason: the stream-input WebSocket takes text as the LLM produces it,
+        # so speech starts before the full response exists
+        experimental_websocket=settings.elevenlabs_websocket,
+    )
+
+
+@cache
+def _get_transcriber_config() -> "DeepgramTranscriberConfig | None":
+    """Build the shared Deepgram STT config, or None for Vocode's default."""
+    if not settings.deepgram_api_key:
+        # Fallback to default transcriber if Deepgram key not available
+        logger.warning("Deepgram API key not provided, using default transcriber")
+        return None
+
+    from vocode.streaming.models.transcriber import DeepgramTranscriberConfig
+
+    return DeepgramTranscriberConfig(
+        api_key=settings.deepgram_api_key,
+        model="nova-2",  # Latest Deepgram model
+        language="en",
+        smart_format=True,  # Automatic punctuation and formatting
+        interim_results=True,  # Enable real-time transcription
+        endpointing=300,  # Milliseconds of silence before ending utterance
+    )
+
+
+# Outbound audio allowed to queue for a slow client before the oldest
+# chunks are dropped (about 2s of 16 kHz 16-bit mono PCM)
+MAX_PENDING_AUDIO_BYTES = 64 * 1024
+
+# Vocode's WebsocketOutputDevice sends audio as JSON text frames whose type
+# field comes first, so the prefix identifies them without parsing
+_AUDIO_MESSAGE_MARKER = '"websocket_audio"'
+
+
+def _is_audio_frame(data) -> bool:
+    """Whether an outbound frame carries audio (binary or a Vocode AudioMessage)."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return True
+    return isinstance(data, str) and _AUDIO_MESSAGE_MARKER in data[:64]
+
+
+class BackpressureWebSocket:
+    """
+    WebSocket wrapper that drops stale audio instead of queueing it without bound.
+
+    Vocode's output device awaits each send in turn, so a slow client backs
+    audio up in its unbounded queue. Sends through this wrapper return as
+    soon as the frame is queued; one writer task delivers frames in order.
+    When queued audio exceeds ``max_pending_bytes`` the oldest audio frames
+    are dropped, since by the time the client caught up they would be stale.
+    Non-audio frames are never dropped, and other attributes pass straight
+    through to the wrapped socket.
+    """
+
+    def __init__(self, websocket, max_pending_bytes: int = MAX_PENDING_AUDIO_BYTES):
+        """
+        Wrap a WebSocket.
+
+        Args:
+            websocket: WebSocket connection for audio streaming
+            max_pending_bytes: Audio bytes allowed to wait for the client
+        """
+        self._websocket = websocket
+        self.max_pending_bytes = max_pending_bytes
+        self.pending_bytes = 0
+        self.dropped_bytes = 0
+        # (send method name, payload, audio bytes) in delivery order
+        self._frames: deque[tuple[str, Any, int]] = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    def __getattr__(self, name: str):
+        return getattr(self._websocket, name)
+
+    async def send(self, data) -> None:
+        """Queue a frame for ``websocket.send``."""
+        self._enqueue("send", data)
+
+    async def send_text(self, data: str) -> None:
+        """Queue a text frame, e.g. a Vocode AudioMessage."""
+        self._enqueue("send_text", data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        """Queue a binary frame."""
+        self._enqueue("send_bytes", data)
+
+    def _enqueue(self, method: str, data) -> None:
+        """
+        Queue a frame, dropping the oldest audio while the backlog is too big.
+
+        Args:
+            method: Name of the wrapped socket's send method
+            data: Frame payload
+
+        Raises:
+            Exception: The error that stopped delivery, once the socket failed
+        """
+        if self._error is not None:
+            raise self._error
+
+        size = len(data) if _is_audio_frame(data) else 0
+        self._frames.append((method, data, size))
+        self.pending_bytes += size
+
+        if self.pending_bytes > self.max_pending_bytes:
+            self._drop_stale_audio()
+
+        self._idle.clear()
+        self._ready.set()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_frames())
+
+    def _drop_stale_audio(self) -> None:
+        """Drop the oldest queued audio until the backlog fits (keeping the newest)."""
+        kept: deque[tuple[str, Any, int]] = deque()
+        while self._frames and self.pending_bytes > self.max_pending_bytes:
+            frame = self._frames.popleft()
+            size = frame[2]
+            if size and self._frames:
+                self.pending_bytes -= size
+                self.dropped_bytes += size
+            else:
+                kept.append(frame)
+        kept.extend(self._frames)
+        self._frames = kept
+        logger.debug(
+            "Audio backlog over %d bytes for a slow client; %d bytes dropped so far",
+            self.max_pending_bytes,
+            self.dropped_bytes,
+        )
+
+    async def _write_frames(self) -> None:
+        """Deliver queued frames in order until stopped or the socket fails."""
+        try:
+            while True:
+                while self._frames:
+                    method, data, size = self._frames.popleft()
+                    self.pending_bytes -= size
+                    await getattr(self._websocket, method)(data)
+                self._ready.clear()
+                self._idle.set()
+                await self._ready.wait()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Reason: surface the failure to the next sender instead of
+            # silently discarding everything queued after it
+            self._error = e
+            self._idle.set()
+            logger.debug("Stopped audio delivery to client: %s", e)
+
+    async def drain(self) -> None:
+        """Wait until every queued frame has been sent (or delivery failed)."""
+        await self._idle.wait()
+
+    async def stop(self) -> None:
+        """Stop the writer task and discard anything still queued."""
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        self._frames.clear()
+        self.pending_bytes = 0
+        self._idle.set()
+
+
 class BriefingActionFactory(AbstractActionFactory):
     """
     Custom action factory for briefing actions.
 
     Creates instances of briefing-specific actions based on their configuration.
+    Each conversation gets its own factory, and each factory creates at most
+    one instance per action type.
     """
 
+    def __init__(self):
+        """Initialize the factory with no actions created yet."""
+        self._actions: dict[str, BaseBriefingAction] = {}
+
     def create_action(self, action_config: ActionConfig):
         """
         Create action instances based on configuration.
@@ -43,18 +265,24 @@ class BriefingActionFactory(AbstractActionFactory):
         Returns:
             Action instance
         """
-        if action_config.type == "action_skip_story":
-            return SkipStoryAction()
-        elif action_config.type == "action_tell_more":
-            return TellMeMoreAction()
-        elif action_config.type == "action_metadata":
-            return MetadataAction()
-        elif action_config.type == "action_conversational_query":
-            return ConversationalQueryAction()
-        else:
+        action = self._actions.get(action_config.type)
+        if action is not None:
+            return action
+
+        action_path = _ACTION_CLASSES.get(action_config.type)
+        if action_path is None:
             logger.warning(f"Unknown action type: {action_config.type}")
             return None
 
+        module_name, class_name = action_path
+        action_class = getattr(importlib.import_module(module_name), class_name)
+
+        # Reason: Vocode attaches the conversation's state manager to an
+        # action before each run, so instances are reused within this
+        # conversation only, never shared across conversations
+        action = self._actions[action_config.type] = action_class()
+        return action
+
 
 class ConversationManager:
     """
@@ -72,7 +300,9 @@ class ConversationManager:
             session_id: ID of the briefing session
         """
         self.session_id = session_id
+        self._conversation_id = f"briefing_{session_id}"
         self.conversation: StreamingConversation | None = None
+        self._websocket: BackpressureWebSocket | None = None
         self.action_factory = BriefingActionFactory()
 
         # Configure speech services
@@ -80,34 +310,12 @@ class ConversationManager:
 
     def _setup_speech_configs(self):
         """Setup speech-to-text and text-to-speech configurations."""
+        # Reason: both configs depend only on settings, so every session
+        # shares the same instances instead of rebuilding them
+        self.synthesizer_config = _get_synthesizer_config()
+        self.transcriber_config = _get_transcriber_config()
 
-        # Configure ElevenLabs TTS with streaming optimization
-        self.synthesizer_config = ElevenLabsSynthesizerConfig(
-            api_key=settings.elevenlabs_api_key,
-            voice_id=settings.default_voice_id,
-            model_id=settings.default_voice_model,
-            optimize_streaming_latency=settings.audio_streaming_latency,
-            stability=0.5,  # Balance between consistency and expressiveness
-            similarity_boost=0.75,  # Enhance voice similarity
-            streaming_chunk_size=1024,  # Optimize for real-time streaming
-        )
-
-        # Configure Deepgram STT for voice recognition
-        if settings.deepgram_api_key:
-            self.transcriber_config = DeepgramTranscriberConfig(
-                api_key=settings.deepgram_api_key,
-                model="nova-2",  # Latest Deepgram model
-                language="en",
-                smart_format=True,  # Automatic punctuation and formatting
-                interim_results=True,  # Enable real-time transcription
-                endpointing=300,  # Milliseconds of silence before ending utterance
-            )
-        else:
-            # Fallback to default transcriber if Deepgram key not available
-            logger.warning("Deepgram API key not provided, using default transcriber")
-            self.transcriber_config = None  # Will use Vocode's default
-
-    async def create_conversation(self) -> StreamingConversation:
+    async def create_conversation(self) -> "StreamingConversation":
         """
         Create and configure a new streaming conversation.
 
@@ -116,15 +324,17 @@ class ConversationManager:
         """
 
         # Get agent configuration with actions
+        from backend.voice.agent_config import create_briefing_agent_config
+
         agent_config = create_briefing_agent_config(self.session_id)
 
         # Create conversation with all components
-        conversation = StreamingConversation(
+        conversation = _get_streaming_conversation_class()(
             agent_config=agent_config,
             transcriber_config=self.transcriber_config,
             synthesizer_config=self.synthesizer_config,
             action_factory=self.action_factory,
-            conversation_id=f"briefing_{self.session_id}",
+            conversation_id=self._conversation_id,
             # Additional conversation settings
             logger=logger,
         )
@@ -144,8 +354,10 @@ class ConversationManager:
             await self.create_conversation()
 
         try:
-            # Start the conversation with WebSocket
-            await self.conversation.start(websocket)
+            # Start the conversation with WebSocket; audio for a client that
+            # has fallen behind is dropped rather than buffered
+            self._websocket = BackpressureWebSocket(websocket)
+            await self.conversation.start(self._websocket)
             logger.info(f"Started conversation for session {self.session_id}")
 
         except Exception as e:
@@ -164,6 +376,9 @@ class ConversationManager:
                 logger.error(f"Error ending conversation: {e}")
             finally:
                 self.conversation = None
+        if self._websocket is not None:
+            await self._websocket.stop()
+            self._websocket = None
 
     def get_conversation_status(self) -> dict[str, Any]:
         """
@@ -175,7 +390,7 @@ class ConversationManager:
         return {
             "session_id": self.session_id,
             "conversation_active": self.conversation is not None,
-            "conversation_id": f"briefing_{self.session_id}",
+            "conversation_id": self._conversation_id,
         }
 
 
@@ -200,11 +415,15 @@ class ConversationPool:
         Returns:
             ConversationManager instance
         """
-        if session_id not in self._conversations:
-            self._conversations[session_id] = ConversationManager(session_id)
+        # Reason: there is no await between the lookup and the insert, so the
+        # get-or-create runs atomically on the event loop and concurrent calls
+        # for one session can't build duplicate managers; no lock is needed
+        manager = self._conversations.get(session_id)
+        if manager is None:
+            manager = self._conversations[session_id] = ConversationManager(session_id)
             logger.info(f"Created new conversation manager for session {session_id}")
 
-        return self._conversations[session_id]
+        return manager
 
     async def remove_conversation(self, session_id: str) -> None:
         """
@@ -213,10 +432,11 @@ class ConversationPool:
         Args:
             session_id: ID of the session to cleanup
         """
-        if session_id in self._conversations:
-            manager = self._conversations[session_id]
+        # Reason: unregister before awaiting the shutdown, so a concurrent
+        # remove for the same session finds nothing instead of ending twice
+        manager = self._conversations.pop(session_id, None)
+        if manager is not None:
             await manager.end_conversation()
-            del self._conversations[session_id]
             logger.info(f"Removed conversation for session {session_id}")
 
     async def cleanup_all(self) -> None:
@@ -0,0 +1,41 @@
+"""
+Shared OpenAI client for voice actions.
+
+Voice actions may be instantiated per conversation turn; sharing one
+client keeps a single pooled HTTP connection set (and its TLS sessions)
+alive across all of them instead of building a new pool per instance.
+"""
+
+import httpx
+from openai import AsyncOpenAI
+
+from backend.config import settings
+
+_client: AsyncOpenAI | None = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+
+    Returns:
+        Shared AsyncOpenAI client backed by a pooled HTTP client
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            ),
+        )
+    return _client
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,87 @@
+"""
+Shared admission control for live OpenAI requests.
+
+Concurrent briefing sessions all issue completions against the same
+account limits. Routing them through one coordinator caps in-flight
+requests and paces them with a token bucket, so a burst of sessions queues
+briefly instead of tripping 429s that each fall back to an apology.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from backend.config import settings
+
+
+class AsyncBatchCoordinator:
+    """
+    Concurrency limit plus token-bucket rate limiter for API requests.
+
+    The bucket holds up to one minute's worth of requests and refills
+    continuously, so short bursts go straight through while sustained
+    load is held to ``requests_per_minute``.
+    """
+
+    def __init__(self, max_concurrency: int = 16, requests_per_minute: int = 500):
+        """
+        Initialize the coordinator.
+
+        Args:
+            max_concurrency: Maximum requests in flight at once
+            requests_per_minute: Sustained request rate to allow
+        """
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_lock = asyncio.Lock()
+        self._capacity = float(requests_per_minute)
+        self._tokens = self._capacity
+        self._refill_per_second = requests_per_minute / 60
+        self._updated_at = time.monotonic()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Wait for a rate-limit token and a concurrency slot.
+
+        The concurrency slot is held for the whole ``async with`` block.
+        """
+        await self._take_token()
+        async with self._semaphore:
+            yield
+
+    async def _take_token(self) -> None:
+        """Take one token from the bucket, sleeping until one is available."""
+        async with self._rate_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._refill_per_second,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
+
+_coordinator: AsyncBatchCoordinator | None = None
+
+
+def get_openai_coordinator() -> AsyncBatchCoordinator:
+    """
+    Get the process-wide coordinator for live OpenAI requests.
+
+    Returns:
+        Shared AsyncBatchCoordinator sized from settings
+    """
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = AsyncBatchCoordinator(
+            max_concurrency=settings.openai_max_concurrency,
+            requests_per_minute=settings.openai_rate_limit,
+        )
+    return _coordinator
@@ -0,0 +1,155 @@
+"""
+Semantic response cache for conversational queries.
+
+Stores LLM answers per story alongside the embedding of the question that
+produced them, so a paraphrased follow-up about the same story can be
+answered from memory instead of another chat completion round-trip.
+"""
+
+import math
+import time
+from collections import OrderedDict
+
+# numpy is optional; similarity falls back to pure Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def normalize(vector: list[float]) -> list[float]:
+    """
+    L2-normalize an embedding so a dot product equals cosine similarity.
+
+    Args:
+        vector: Raw embedding values
+
+    Returns:
+        Unit-length copy of the vector (unchanged if all zeros)
+    """
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return list(vector)
+    return [value / norm for value in vector]
+
+
+class _StoryEntries:
+    """Cached (embedding, response, expiry) rows for one story."""
+
+    __slots__ = ("vectors", "responses", "expires_at")
+
+    def __init__(self):
+        self.vectors: list[list[float]] = []
+        self.responses: list[str] = []
+        self.expires_at: list[float] = []
+
+    def drop_expired(self, now: float) -> None:
+        """Remove rows whose TTL has passed."""
+        keep = [i for i, expiry in enumerate(self.expires_at) if expiry > now]
+        if len(keep) != len(self.expires_at):
+            self.vectors = [self.vectors[i] for i in keep]
+            self.responses = [self.responses[i] for i in keep]
+            self.expires_at = [self.expires_at[i] for i in keep]
+
+    def drop_oldest(self) -> None:
+        """Remove the oldest row."""
+        del self.vectors[0]
+        del self.responses[0]
+        del self.expires_at[0]
+
+
+class SemanticQueryCache:
+    """
+    Per-story LRU cache of LLM responses matched by cosine similarity.
+
+    Entries expire after ``ttl_seconds``; each story keeps at most
+    ``max_entries_per_story`` responses and at most ``max_stories`` stories
+    are tracked (least recently used stories are evicted first).
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 3600,
+        max_entries_per_story: int = 64,
+        max_stories: int = 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Lifetime of a cached response
+            max_entries_per_story: Cap on responses kept per story
+            max_stories: Cap on stories tracked at once
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_story = max_entries_per_story
+        self.max_stories = max_stories
+        self._stories: OrderedDict[str, _StoryEntries] = OrderedDict()
+
+    def lookup(self, story_id: str, embedding: list[float]) -> str | None:
+        """
+        Find a cached response for a semantically similar question.
+
+        Args:
+            story_id: Story the question is about
+            embedding: L2-normalized embedding of the question
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        entries = self._stories.get(story_id)
+        if entries is None:
+            return None
+
+        entries.drop_expired(time.monotonic())
+        if not entries.vectors:
+            del self._stories[story_id]
+            return None
+
+        self._stories.move_to_end(story_id)
+
+        if np is not None:
+            similarities = np.asarray(entries.vectors) @ np.asarray(embedding)
+            best = int(similarities.argmax())
+            best_score = float(similarities[best])
+        else:
+            best, best_score = -1, -1.0
+            for i, vector in enumerate(entries.vectors):
+                score = sum(a * b for a, b in zip(vector, embedding, strict=True))
+                if score > best_score:
+                    best, best_score = i, score
+
+        if best_score >= self.similarity_threshold:
+            return entries.responses[best]
+        return None
+
+    def store(self, story_id: str, embedding: list[float], response: str) -> None:
+        """
+        Cache a response for a question about a story.
+
+        Args:
+            story_id: Story the question is about
+            embedding: L2-normalized embedding of the question
+            response: LLM response to reuse for similar questions
+        """
+        entries = self._stories.get(story_id)
+        if entries is None:
+            entries = self._stories[story_id] = _StoryEntries()
+            while len(self._stories) > self.max_stories:
+                self._stories.popitem(last=False)
+        else:
+            self._stories.move_to_end(story_id)
+
+        while len(entries.vectors) >= self.max_entries_per_story:
+            entries.drop_oldest()
+
+        entries.vectors.append(embedding)
+        entries.responses.append(response)
+        entries.expires_at.append(time.monotonic() + self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._stories.clear()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared asyncpg connection pool for the database scripts.
+
+run_migration.py and populate_newsletters.py borrow connections from this
+pool, so running both in one process connects to the database only once.
+"""
+
+import os
+
+import asyncpg
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+_pool: asyncpg.Pool | None = None
+
+
+async def get_pool() -> asyncpg.Pool:
+    """
+    Get the shared connection pool, creating it on first use.
+
+    Returns:
+        Connection pool for DATABASE_URL
+    """
+    global _pool
+    if _pool is None:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL not found in environment variables")
+        # Two connections cover the seed script's concurrent inserts
+        _pool = await asyncpg.create_pool(database_url, min_size=2, max_size=4)
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the shared connection pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -2,23 +2,43 @@
 """
 Script to populate the database with test newsletter data.
 Run this to have sample data for testing the briefing feature.
+Pass --migrate to apply the schema migration first, on the same pool.
 """
 
+import argparse
 import asyncio
-import os
 import uuid
 from datetime import datetime, timedelta
 import asyncpg
 from dotenv import load_dotenv
 
+from db import close_pool, get_pool
+from run_migration import run_migration
+
 # Load environment variables
 load_dotenv()
 
-async def populate_test_data():
-    """Populate database with test newsletter data."""
-    
-    database_url = os.getenv("DATABASE_URL")
-    conn = await asyncpg.connect(database_url)
+STORY_COLUMNS = [
+    "id", "issue_id", "headline", "one_sentence_summary", "full_text_summary", "url"
+]
+INSERT_STORY_SQL = """
+    INSERT INTO stories (
+        id, issue_id, headline, one_sentence_summary, 
+        full_text_summary, url
+    )
+    VALUES ($1, $2, $3, $4, $5, $6)
+"""
+
+async def populate_test_data(pool: asyncpg.Pool | None = None):
+    """
+    Populate database with test newsletter data.
+
+    Args:
+        pool: Pool to use; defaults to the shared pool
+    """
+    if pool is None:
+        pool = await get_pool()
+    conn = await pool.acquire()
     
     try:
         # Get the first user
@@ -42,21 +62,27 @@ async def populate_test_data():
         
         print(f"Created newsletter: TechCrunch Daily")
         
-        # Create user subscription
-        await conn.execute("""
-            INSERT INTO user_subscriptions (user_id, newsletter_id)
-            VALUES ($1, $2)
-            ON CONFLICT DO NOTHING
-        """, user_id, newsletter_id)
+        async def insert_subscription():
+            # Create user subscription
+            async with pool.acquire() as sub_conn:
+                await sub_conn.execute("""
+                    INSERT INTO user_subscriptions (user_id, newsletter_id)
+                    VALUES ($1, $2)
+                    ON CONFLICT DO NOTHING
+                """, user_id, newsletter_id)
         
-        # Create an issue for today
+        async def insert_issue():
+            # Create an issue for today
+            await conn.execute("""
+                INSERT INTO issues (id, newsletter_id, date, subject, raw_content)
+                VALUES ($1, $2, $3, $4, $5)
+            """, issue_id, newsletter_id, datetime.now(), 
+                "Today's Tech Headlines", 
+                "<html><body>Newsletter content here</body></html>")
+        
+        # Both depend only on the newsletter, not on each other
         issue_id = uuid.uuid4()
-        await conn.execute("""
-            INSERT INTO issues (id, newsletter_id, date, subject, raw_content)
-            VALUES ($1, $2, $3, $4, $5)
-        """, issue_id, newsletter_id, datetime.now(), 
-            "Today's Tech Headlines", 
-            "<html><body>Newsletter content here</body></html>")
+        await asyncio.gather(insert_subscription(), insert_issue())
         
         print(f"Created issue for today")
         
@@ -82,19 +108,28 @@ async def populate_test_data():
             }
         ]
         
-        for story in stories:
-            story_id = uuid.uuid4()
-            await conn.execute("""
-                INSERT INTO stories (
-                    id, issue_id, headline, one_sentence_summary, 
-                    full_text_summary, url
-                )
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """, story_id, issue_id, 
-                story["headline"], 
+        # Insert all stories in one round-trip with COPY, falling back to a
+        # batched INSERT where the role lacks COPY privileges
+        records = [
+            (
+                uuid.uuid4(),
+                issue_id,
+                story["headline"],
                 story["summary"],
                 story["full_summary"],
-                story["url"])
+                story["url"],
+            )
+            for story in stories
+        ]
+        try:
+            await conn.copy_records_to_table(
+                "stories", records=records, columns=STORY_COLUMNS
+            )
+        except asyncpg.exceptions.InsufficientPrivilegeError:
+            insert_story = await conn.prepare(INSERT_STORY_SQL)
+            await insert_story.executemany(records)
+
+        for story in stories:
             print(f"  - Added story: {story['headline']}")
         
         print("\n✅ Successfully populated test newsletter data!")
@@ -103,7 +138,31 @@ async def populate_test_data():
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        await conn.close()
+        await pool.release(conn)
+
+
+async def setup_test_db():
+    """Migrate and seed the database over the shared pool and one event loop."""
+    try:
+        await run_migration()
+        await populate_test_data()
+    finally:
+        await close_pool()
+
+
+async def main():
+    """Seed the database, then release the shared pool."""
+    try:
+        await populate_test_data()
+    finally:
+        await close_pool()
 
 if __name__ == "__main__":
-    asyncio.run(populate_test_data())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Populate test newsletter data")
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="run the schema migration before seeding",
+    )
+    args = parser.parse_args()
+    asyncio.run(setup_test_db() if args.migrate else main())
\ No newline at end of file
@@ -4,46 +4,98 @@ Script to run database migration for MyNewsletters app.
 """
 
 import asyncio
-import os
+import re
 from pathlib import Path
 
 import asyncpg
 from dotenv import load_dotenv
 
+from db import close_pool, get_pool
+
 # Load environment variables
 load_dotenv()
 
-async def run_migration():
-    """Run the database migration."""
-    # Get database URL from environment
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL not found in environment variables")
-    
+# Comments, quoted strings and dollar-quoted bodies (skipped whole, so a
+# semicolon inside them doesn't end a statement), or a statement terminator
+_SQL_TOKEN = re.compile(
+    r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|(\$\w*\$).*?\1|;",
+    re.DOTALL,
+)
+
+
+def split_sql_statements(sql: str) -> list[str]:
+    """
+    Split a SQL script into individual statements.
+
+    Args:
+        sql: SQL script text
+
+    Returns:
+        Non-empty statements, without their terminating semicolons
+    """
+    statements = []
+    start = 0
+    for match in _SQL_TOKEN.finditer(sql):
+        if match.group() == ";":
+            statements.append(sql[start:match.start()])
+            start = match.end()
+    statements.append(sql[start:])
+
+    # Drop fragments that are only whitespace or comments
+    return [
+        statement.strip()
+        for statement in statements
+        if _SQL_TOKEN.sub("", statement).strip()
+    ]
+
+async def run_migration(conn: asyncpg.Connection | None = None):
+    """
+    Run the database migration.
+
+    Args:
+        conn: Existing connection to run on; one is borrowed from the
+            shared pool when omitted
+    """
+    if conn is None:
+        print("Connecting to database...")
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            await run_migration(conn)
+        return
+
     # Read migration SQL
     migration_path = Path(__file__).parent / "backend" / "migrations" / "004_correct_schema.sql"
     with open(migration_path, "r") as f:
         migration_sql = f.read()
     
-    print("Connecting to database...")
-    
-    # Connect to database
-    conn = await asyncpg.connect(database_url)
-    
     try:
         print("Running migration...")
-        # Run migration
-        await conn.execute(migration_sql)
+        # Run statement by statement, so the server parses one at a time and
+        # a failure names the statement; the transaction keeps it atomic
+        statements = split_sql_statements(migration_sql)
+        async with conn.transaction():
+            for number, statement in enumerate(statements, 1):
+                try:
+                    await conn.execute(statement)
+                except Exception as e:
+                    first_line = next(
+                        (line for line in statement.splitlines() if not line.startswith("--")),
+                        statement,
+                    )
+                    raise RuntimeError(
+                        f"Statement {number}/{len(statements)} failed ({first_line}): {e}"
+                    ) from e
+
+            # Verify tables were created, on the same transaction so the
+            # listing reflects exactly what is about to be committed
+            tables = await conn.fetch("""
+                SELECT tablename 
+                FROM pg_tables 
+                WHERE schemaname = 'public' 
+                ORDER BY tablename
+            """)
         print("Migration completed successfully!")
         
-        # Verify tables were created
-        tables = await conn.fetch("""
-            SELECT tablename 
-            FROM pg_tables 
-            WHERE schemaname = 'public' 
-            ORDER BY tablename
-        """)
-        
         print("\nCreated tables:")
         for table in tables:
             print(f"  - {table['tablename']}")
@@ -51,8 +103,14 @@ async def run_migration():
     except Exception as e:
         print(f"Error running migration: {e}")
         raise
+
+
+async def main():
+    """Run the migration, then release the shared pool."""
+    try:
+        await run_migration()
     finally:
-        await conn.close()
+        await close_pool()
 
 if __name__ == "__main__":
-    asyncio.run(run_migration())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
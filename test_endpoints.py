@@ -7,17 +7,45 @@ Tests that all 24 missing endpoints are now properly implemented and responding.
 import asyncio
 import json
 import sys
+from dataclasses import dataclass
 from typing import Dict, List
 
 import httpx
 
 
+@dataclass(slots=True)
+class EndpointResult:
+    """Outcome of a single endpoint probe."""
+
+    method: str
+    endpoint: str
+    expected_status: int
+    actual_status: int | str
+    success: bool
+    description: str
+    response: str
+
+
 class EndpointTester:
     """Test suite for verifying API endpoint implementation."""
     
     def __init__(self, base_url: str = "http://localhost:5001"):
         self.base_url = base_url
-        self.results: List[Dict] = []
+        self.results: List[EndpointResult] = []
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self):
+        """Open one HTTP client so every probe reuses its connections."""
+        self._client = httpx.AsyncClient()
+        # Bound in-flight probes so concurrent sections don't flood the server
+        self._semaphore = asyncio.Semaphore(10)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
+        self._client = None
         
     async def test_endpoint(self, method: str, endpoint: str, expected_status: int, 
                           headers: Dict = None, json_data: Dict = None, 
@@ -26,8 +54,9 @@ class EndpointTester:
         url = f"{self.base_url}{endpoint}"
         headers = headers or {}
         
-        async with httpx.AsyncClient() as client:
-            try:
+        client = self._client
+        try:
+            async with self._semaphore:
                 if method.upper() == "GET":
                     response = await client.get(url, headers=headers)
                 elif method.upper() == "POST":
@@ -36,204 +65,215 @@ class EndpointTester:
                     response = await client.patch(url, headers=headers, json=json_data)
                 else:
                     response = await client.request(method, url, headers=headers, json=json_data)
-                
-                success = response.status_code == expected_status
-                
-                self.results.append({
-                    "method": method.upper(),
-                    "endpoint": endpoint,
-                    "expected_status": expected_status,
-                    "actual_status": response.status_code,
-                    "success": success,
-                    "description": description,
-                    "response": response.text[:200] if response.text else ""
-                })
-                
-                status_icon = "✅" if success else "❌"
-                print(f"{status_icon} {method.upper()} {endpoint} -> {response.status_code} (expected {expected_status})")
-                
-                return success
-                
-            except Exception as e:
-                self.results.append({
-                    "method": method.upper(),
-                    "endpoint": endpoint,
-                    "expected_status": expected_status,
-                    "actual_status": "ERROR",
-                    "success": False,
-                    "description": description,
-                    "response": str(e)
-                })
-                print(f"❌ {method.upper()} {endpoint} -> ERROR: {e}")
-                return False
+            
+            success = response.status_code == expected_status
+            
+            self.results.append(EndpointResult(
+                method=method.upper(),
+                endpoint=endpoint,
+                expected_status=expected_status,
+                actual_status=response.status_code,
+                success=success,
+                description=description,
+                response=response.text[:200] if response.text else ""
+            ))
+            
+            status_icon = "✅" if success else "❌"
+            print(f"{status_icon} {method.upper()} {endpoint} -> {response.status_code} (expected {expected_status})")
+            
+            return success
+            
+        except Exception as e:
+            self.results.append(EndpointResult(
+                method=method.upper(),
+                endpoint=endpoint,
+                expected_status=expected_status,
+                actual_status="ERROR",
+                success=False,
+                description=description,
+                response=str(e)
+            ))
+            print(f"❌ {method.upper()} {endpoint} -> ERROR: {e}")
+            return False
     
     async def run_tests(self):
         """Run all endpoint tests."""
-        print("=" * 80)
-        print("🧪 TESTING PHASE 1 API ENDPOINT IMPLEMENTATIONS")
-        print("=" * 80)
-        
-        # Test infrastructure and basic endpoints
-        print("\n📍 Infrastructure Tests:")
-        await self.test_endpoint("GET", "/health", 200, description="Health check")
-        await self.test_endpoint("GET", "/invalid-endpoint", 404, description="404 handling")
-        
-        # Test authentication endpoints
-        print("\n🔐 Authentication Endpoints:")
-        await self.test_endpoint(
-            "POST", "/auth/gmail-oauth", 200, 
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Gmail OAuth init"
-        )
-        await self.test_endpoint(
-            "GET", "/auth/google/callback", 400,
-            description="OAuth callback without code"
-        )
-        await self.test_endpoint(
-            "GET", "/auth/user", 401,
-            description="User info without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/auth/validate", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Token validation without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/auth/refresh", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Token refresh without token"
-        )
-        await self.test_endpoint(
-            "POST", "/auth/logout", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Logout without auth"
-        )
-        await self.test_endpoint(
-            "PUT", "/auth/profile", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Profile update without auth"
-        )
-        
-        # Test newsletter endpoints  
-        print("\n📰 Newsletter Management Endpoints:")
-        await self.test_endpoint(
-            "POST", "/newsletters/fetch", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Newsletter fetch without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/newsletters/parse", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Newsletter parse without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/newsletters/save", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Newsletter save without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/newsletters", 401,
-            description="Newsletter list without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/newsletters/test-id", 401,
-            description="Newsletter details without auth"
-        )
-        await self.test_endpoint(
-            "PATCH", "/newsletters/test-id/status", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={"status": "completed"},
-            description="Newsletter status update without auth"
-        )
-        
-        # Test briefing session endpoints
-        print("\n🎤 Briefing Session Endpoints:")
-        await self.test_endpoint(
-            "POST", "/briefing/start", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Briefing start without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/briefing/session/test-session-id", 401,
-            description="Session state without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/session/test-session-id/pause", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Session pause without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/session/test-session-id/resume", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Session resume without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/session/test-session-id/stop", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Session stop without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/session/test-session-id/next", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Next story without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/session/test-session-id/previous", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Previous story without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/briefing/session/test-session-id/metadata", 401,
-            description="Session metadata without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/briefing/cleanup", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Session cleanup without auth"
-        )
-        
-        # Test audio processing endpoints
-        print("\n🔊 Audio Processing Endpoints:")
-        await self.test_endpoint(
-            "POST", "/audio/generate", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Audio generation without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/audio/upload", 401,
-            description="Audio upload without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/audio/test-story-id", 401,
-            description="Audio retrieval without auth"
-        )
-        await self.test_endpoint(
-            "GET", "/audio/queue/status", 401,
-            description="Audio queue status without auth"
-        )
-        await self.test_endpoint(
-            "POST", "/audio/batch", 401,
-            headers={"Content-Type": "application/json"},
-            json_data={},
-            description="Audio batch processing without auth"
-        )
+        async with self:
+            print("=" * 80)
+            print("🧪 TESTING PHASE 1 API ENDPOINT IMPLEMENTATIONS")
+            print("=" * 80)
         
+            # Test infrastructure and basic endpoints
+            print("\n📍 Infrastructure Tests:")
+            await asyncio.gather(
+                self.test_endpoint("GET", "/health", 200, description="Health check"),
+                self.test_endpoint("GET", "/invalid-endpoint", 404, description="404 handling"),
+            )
+
+            # Test authentication endpoints
+            print("\n🔐 Authentication Endpoints:")
+            await asyncio.gather(
+                self.test_endpoint(
+                    "POST", "/auth/gmail-oauth", 200, 
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Gmail OAuth init"
+                ),
+                self.test_endpoint(
+                    "GET", "/auth/google/callback", 400,
+                    description="OAuth callback without code"
+                ),
+                self.test_endpoint(
+                    "GET", "/auth/user", 401,
+                    description="User info without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/auth/validate", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Token validation without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/auth/refresh", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Token refresh without token"
+                ),
+                self.test_endpoint(
+                    "POST", "/auth/logout", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Logout without auth"
+                ),
+                self.test_endpoint(
+                    "PUT", "/auth/profile", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Profile update without auth"
+                ),
+            )
+
+            # Test newsletter endpoints  
+            print("\n📰 Newsletter Management Endpoints:")
+            await asyncio.gather(
+                self.test_endpoint(
+                    "POST", "/newsletters/fetch", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Newsletter fetch without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/newsletters/parse", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Newsletter parse without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/newsletters/save", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Newsletter save without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/newsletters", 401,
+                    description="Newsletter list without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/newsletters/test-id", 401,
+                    description="Newsletter details without auth"
+                ),
+                self.test_endpoint(
+                    "PATCH", "/newsletters/test-id/status", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={"status": "completed"},
+                    description="Newsletter status update without auth"
+                ),
+            )
+
+            # Test briefing session endpoints
+            print("\n🎤 Briefing Session Endpoints:")
+            await asyncio.gather(
+                self.test_endpoint(
+                    "POST", "/briefing/start", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Briefing start without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/briefing/session/test-session-id", 401,
+                    description="Session state without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/session/test-session-id/pause", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Session pause without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/session/test-session-id/resume", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Session resume without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/session/test-session-id/stop", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Session stop without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/session/test-session-id/next", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Next story without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/session/test-session-id/previous", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Previous story without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/briefing/session/test-session-id/metadata", 401,
+                    description="Session metadata without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/briefing/cleanup", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Session cleanup without auth"
+                ),
+            )
+
+            # Test audio processing endpoints
+            print("\n🔊 Audio Processing Endpoints:")
+            await asyncio.gather(
+                self.test_endpoint(
+                    "POST", "/audio/generate", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Audio generation without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/audio/upload", 401,
+                    description="Audio upload without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/audio/test-story-id", 401,
+                    description="Audio retrieval without auth"
+                ),
+                self.test_endpoint(
+                    "GET", "/audio/queue/status", 401,
+                    description="Audio queue status without auth"
+                ),
+                self.test_endpoint(
+                    "POST", "/audio/batch", 401,
+                    headers={"Content-Type": "application/json"},
+                    json_data={},
+                    description="Audio batch processing without auth"
+                ),
+            )
+
         # Generate summary
         self.print_summary()
     
@@ -244,7 +284,7 @@ class EndpointTester:
         print("=" * 80)
         
         total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r["success"])
+        passed_tests = sum(1 for r in self.results if r.success)
         failed_tests = total_tests - passed_tests
         
         print(f"Total Tests: {total_tests}")
@@ -255,10 +295,10 @@ class EndpointTester:
         if failed_tests > 0:
             print("\n🔍 Failed Tests:")
             for result in self.results:
-                if not result["success"]:
-                    print(f"  ❌ {result['method']} {result['endpoint']} -> {result['actual_status']} (expected {result['expected_status']})")
-                    if result.get('response'):
-                        print(f"     Response: {result['response'][:100]}...")
+                if not result.success:
+                    print(f"  ❌ {result.method} {result.endpoint} -> {result.actual_status} (expected {result.expected_status})")
+                    if result.response:
+                        print(f"     Response: {result.response[:100]}...")
         
         print("\n" + "=" * 80)
         if failed_tests == 0:
@@ -284,7 +324,7 @@ async def main():
     await tester.run_tests()
     
     # Return exit code based on results
-    failed_tests = sum(1 for r in tester.results if not r["success"])
+    failed_tests = sum(1 for r in tester.results if not r.success)
     return 0 if failed_tests == 0 else 1
 
 
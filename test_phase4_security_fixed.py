@@ -5,13 +5,17 @@ Tests authentication, API security, and data protection mechanisms
 Adapted to work with Gmail OAuth implementation
 """
 
+import argparse
 import asyncio
-import json
+import re
 import time
 import base64
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
 import aiohttp
+import orjson
 import sys
 import os
 from pathlib import Path
@@ -22,14 +26,173 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+# uvloop is optional (dev extra, not on Windows); when installed it runs the
+# socket-heavy probe bursts with less per-operation overhead
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configuration
 BASE_URL = "http://localhost:5001"
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Too Many Requests: the probe never reached the check it was meant to test
+RATE_LIMITED = 429
+
+# Probe tables are built once at import rather than on every test call
+_INPUT_VALIDATION_CASES = (
+    # SQL injection attempts
+    {"endpoint": "/newsletters/parse", "method": "POST",
+     "data": {"html_content": "'; DROP TABLE users; --"}},
+    # XSS attempts
+    {"endpoint": "/newsletters/parse", "method": "POST",
+     "data": {"html_content": "<script>alert('XSS')</script>"}},
+    # Invalid data types
+    {"endpoint": "/briefing/not_a_number/pause", "method": "POST",
+     "data": {}},
+    # Missing required fields
+    {"endpoint": "/newsletters/fetch", "method": "POST",
+     "data": {}},  # Missing user_id
+    # Invalid JSON
+    {"endpoint": "/briefing/start", "method": "POST",
+     "data": {"newsletter_ids": "not_an_array"}},
+)
+
+_SQL_PAYLOADS = (
+    "'; DROP TABLE users; --",
+    "1' OR '1'='1",
+    "admin'--",
+    "1; SELECT * FROM users",
+    "' UNION SELECT * FROM users--",
+)
+
+_XSS_PAYLOADS = (
+    "<script>alert('XSS')</script>",
+    "<img src=x onerror=alert('XSS')>",
+    "<svg onload=alert('XSS')>",
+    "javascript:alert('XSS')",
+    "<iframe src='javascript:alert(\"XSS\")'>",
+)
+
+# Request bodies for the bulk probes, encoded once with orjson
+_INPUT_VALIDATION_BODIES = tuple(
+    (test, orjson.dumps(test["data"])) for test in _INPUT_VALIDATION_CASES
+)
+_XSS_BODIES = tuple(
+    (payload, orjson.dumps({"html_content": payload})) for payload in _XSS_PAYLOADS
+)
+
+_ERROR_ENDPOINTS = (
+    "/newsletters/999999",
+    "/briefing/session/invalid",
+    "/audio/999999",
+    "/nonexistent",
+)
+
+# Unauthenticated data endpoints and audio IDs that must not be readable
+_PRIVATE_ENDPOINTS = (
+    "/users/1/newsletters",
+    "/users/999/preferences",
+    "/briefing/999/state",
+)
+_AUDIO_IDS = (1, 999, "invalid")
+
+# (header, value) auth bypass attempts, with their request headers built once
+_AUTH_BYPASS_ATTEMPTS = tuple(
+    (header, value, {header: value})
+    for header, value in (
+        # Try with Authorization header variations
+        ("Authorization", "Bearer "),
+        ("Authorization", "Bearer null"),
+        ("Authorization", "Bearer undefined"),
+        ("X-User-Id", "1"),  # Try to spoof user ID
+    )
+)
+
+# (origin, should be allowed) pairs for the CORS preflight checks
+_CORS_ORIGINS = (
+    ("http://evil.com", False),  # Should be blocked
+    ("http://localhost:3000", True),  # Should be allowed for dev
+    ("http://localhost:19006", True),  # React Native dev
+)
+# Origin used to check that credentials are never paired with a wildcard
+_CORS_CREDENTIALS_ORIGIN = "http://localhost:3000"
+
+# Sensitive info that error pages must not expose, matched in one pass
+_SENSITIVE_PATTERNS = re.compile(
+    r'traceback|file "|line |psycopg|sqlalchemy|asyncpg|secret|api_key|password',
+    re.IGNORECASE,
+)
+
+# Script content that must not be echoed back by the newsletter parser
+_XSS_MARKERS = re.compile(rb"<script>|alert\(")
+
+# API key markers (OpenAI, ElevenLabs, JSON key names) and provider names
+# that must not appear in responses, matched in one pass
+_KEY_RE = re.compile(
+    r'sk-|xi-|"api_key"|"apiKey"|"API_KEY"|"secret"|supabase|openai|elevenlabs'
+)
+# Provider names are fine when they only report service status
+_SERVICE_NAMES = frozenset(("supabase", "openai", "elevenlabs"))
+_HEALTHY_SERVICE_RE = re.compile(r'"(supabase|openai|elevenlabs)": ?"healthy"')
+
+# Database internals that error pages must not expose
+_DB_PATTERNS = re.compile(
+    r"postgres|psycopg|sqlalchemy|asyncpg|database|connection|syntax error|query",
+    re.IGNORECASE,
+)
+
+# Methods whose probe responses may be shared between tests in one run
+_CACHEABLE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+# Trailing characters carried into the next chunk so a match split across
+# a chunk boundary is still found (longer than any pattern above)
+_CHUNK_OVERLAP = 64
+
+async def _body_search(resp: aiohttp.ClientResponse, regex: re.Pattern) -> Optional[str]:
+    """Stream a response body and return the first regex match, stopping early"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    tail = ""
+    async for chunk in resp.content.iter_chunked(4096):
+        window = tail + decoder.decode(chunk)
+        match = regex.search(window)
+        if match:
+            return match.group()
+        tail = window[-_CHUNK_OVERLAP:]
+    return None
+
+def _reflects_script(body: bytes) -> bool:
+    """Whether a parse response echoes script content back"""
+    # Round-trip through orjson rather than scanning the raw body, so markers
+    # sent back \u-escaped (e.g. \u003cscript>) are still caught
+    try:
+        response = orjson.dumps(orjson.loads(body))
+    except orjson.JSONDecodeError:
+        return False
+    return _XSS_MARKERS.search(response) is not None
+
+def _find_exposed_key(body: bytes) -> Optional[str]:
+    """First API key marker in a response body, ignoring healthy service names"""
+    text = body.decode("utf-8", "ignore")
+    healthy = set(_HEALTHY_SERVICE_RE.findall(text))
+    for match in _KEY_RE.finditer(text):
+        pattern = match.group()
+        # Check if it's actually a key or just a service name
+        if pattern in _SERVICE_NAMES and pattern in healthy:
+            continue
+        return pattern
+    return None
+
 class SecurityTestSuite:
     """Security testing framework for the My Newsletters application"""
     
-    def __init__(self):
+    def __init__(self, workers: int = 0):
         self.base_url = BASE_URL
+        # Threads for CPU-bound response checks; 0 runs them on the event loop
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.session: Optional[aiohttp.ClientSession] = None
         self.mock_token: Optional[str] = None
         self.test_results: Dict[str, List[Dict]] = {
@@ -41,10 +204,25 @@ class SecurityTestSuite:
         self.passed_tests = 0
         self.failed_tests = 0
         self.skipped_tests = 0
+        # In-flight or finished safe-method probes, shared across tests
+        self._response_cache: Dict[Tuple, asyncio.Future] = {}
         
     async def setup(self):
         """Initialize test session"""
-        self.session = aiohttp.ClientSession()
+        # Keep-alive pool sized for the concurrent probe bursts; base_url lets
+        # probes pass just the path
+        connector = aiohttp.TCPConnector(
+            limit=256, limit_per_host=256, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        self.session = aiohttp.ClientSession(
+            base_url=self.base_url,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10, connect=2),
+        )
+        if self.workers:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="security-scan"
+            )
         print("\n" + "="*80)
         print("PHASE 4: SECURITY TESTING (FIXED)")
         print("="*80)
@@ -60,44 +238,119 @@ class SecurityTestSuite:
         """Clean up test session"""
         if self.session:
             await self.session.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            
+    async def run_test(self, test_func) -> Tuple[Optional[Dict], Optional[Exception]]:
+        """Execute a single test, returning its result or the exception it raised"""
+        try:
+            return await test_func(), None
+        except Exception as e:
+            return None, e
+            
+    async def run_category(self, category: str, tests: List[Tuple[str, Callable]]):
+        """Execute a category's tests concurrently, then record results in order"""
+        outcomes = await asyncio.gather(*(self.run_test(test_func) for _, test_func in tests))
+        for (test_name, _), (result, error) in zip(tests, outcomes, strict=True):
+            self.record_result(category, test_name, result, error)
             
-    async def run_test(self, category: str, test_name: str, test_func):
-        """Execute a single test and record results"""
+    def record_result(self, category: str, test_name: str, result: Optional[Dict], error: Optional[Exception]):
+        """Print and record the outcome of a single test"""
         self.total_tests += 1
         print(f"\n[{self.total_tests}] Testing: {test_name}")
         print("-" * 60)
         
-        try:
-            result = await test_func()
-            if result["status"] == "PASS":
-                self.passed_tests += 1
-                print(f"✅ PASSED: {result.get('message', 'Test successful')}")
-            elif result["status"] == "SKIP":
-                self.skipped_tests += 1
-                print(f"⏭️  SKIPPED: {result.get('message', 'Test skipped')}")
-            elif result["status"] == "WARN":
-                self.passed_tests += 1  # Count warnings as passes with caveats
-                print(f"⚠️  WARNING: {result.get('message', 'Test passed with warnings')}")
-            else:
-                self.failed_tests += 1
-                print(f"❌ FAILED: {result.get('message', 'Test failed')}")
-                if "error" in result:
-                    print(f"   Error: {result['error']}")
-                    
-            self.test_results[category].append({
-                "test": test_name,
-                "status": result["status"],
-                "message": result.get("message", ""),
-                "details": result.get("details", {})
-            })
-        except Exception as e:
+        if error is not None:
             self.failed_tests += 1
-            print(f"❌ ERROR: {str(e)}")
+            print(f"❌ ERROR: {str(error)}")
             self.test_results[category].append({
                 "test": test_name,
                 "status": "ERROR",
-                "message": str(e)
+                "message": str(error)
             })
+            return
+            
+        if result["status"] == "PASS":
+            self.passed_tests += 1
+            print(f"✅ PASSED: {result.get('message', 'Test successful')}")
+        elif result["status"] == "SKIP":
+            self.skipped_tests += 1
+            print(f"⏭️  SKIPPED: {result.get('message', 'Test skipped')}")
+        elif result["status"] == "WARN":
+            self.passed_tests += 1  # Count warnings as passes with caveats
+            print(f"⚠️  WARNING: {result.get('message', 'Test passed with warnings')}")
+        else:
+            self.failed_tests += 1
+            print(f"❌ FAILED: {result.get('message', 'Test failed')}")
+            if "error" in result:
+                print(f"   Error: {result['error']}")
+                
+        self.test_results[category].append({
+            "test": test_name,
+            "status": result["status"],
+            "message": result.get("message", ""),
+            "details": result.get("details", {})
+        })
+            
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Union[Dict, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, bytes, Mapping[str, str]]:
+        """Send a request and return (status, body, headers)
+
+        A dict payload is encoded with orjson; bytes are sent as already
+        encoded JSON. GET/HEAD/OPTIONS probes are memoized for the suite run
+        (nothing here mutates server state), so tests probing the same URL
+        share a single round-trip; concurrent callers await the same
+        in-flight request.
+        """
+        if isinstance(payload, dict):
+            payload = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        if payload is not None:
+            headers = {**_JSON_HEADERS, **(headers or {})}
+            
+        async def send() -> Tuple[int, bytes, Mapping[str, str]]:
+            async with self.session.request(method, path, data=payload, headers=headers) as resp:
+                return resp.status, await resp.read(), resp.headers
+                
+        if method not in _CACHEABLE_METHODS:
+            return await send()
+            
+        key = (method, path, payload, tuple(sorted((headers or {}).items())))
+        future = self._response_cache.get(key)
+        if future is None:
+            future = self._response_cache[key] = asyncio.ensure_future(send())
+        result = await future
+        if result[0] == RATE_LIMITED and self._response_cache.get(key) is future:
+            # A throttled answer says nothing about the endpoint; let the next
+            # probe ask again rather than reuse it
+            del self._response_cache[key]
+        return result
+            
+    async def _scan(self, check: Callable, *args):
+        """Run a CPU-bound response check, on the worker threads if configured"""
+        if self._executor is None:
+            return check(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, check, *args)
+            
+    async def _burst_statuses(self, path: str, count: int, concurrency: int = 50) -> List[Optional[int]]:
+        """GET a path count times concurrently; None marks a failed request"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def one() -> Optional[int]:
+            try:
+                async with semaphore, self.session.get(path) as resp:
+                    # Drain the (small) body: aiohttp closes rather than pools a
+                    # connection whose payload wasn't fully read on release
+                    await resp.read()
+                    return resp.status
+            except Exception:
+                return None
+                
+        return await asyncio.gather(*(one() for _ in range(count)))
             
     # ==================== AUTHENTICATION SECURITY TESTS ====================
     
@@ -105,39 +358,32 @@ class SecurityTestSuite:
         """Test JWT token validation mechanisms"""
         try:
             # Test token validation endpoint with invalid token
-            async with self.session.post(
-                f"{self.base_url}/auth/validate",
-                json={"token": "invalid.jwt.token"}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Invalid token accepted"}
-                elif resp.status != 401:
-                    return {"status": "WARN", "message": f"Unexpected status for invalid token: {resp.status}"}
-                    
+            status, _, _ = await self._request(
+                "POST", "/auth/validate", {"token": "invalid.jwt.token"}
+            )
+            if status == 200:
+                return {"status": "FAIL", "message": "Invalid token accepted"}
+            elif status != 401:
+                return {"status": "WARN", "message": f"Unexpected status for invalid token: {status}"}
+                
             # Test with malformed token
-            async with self.session.post(
-                f"{self.base_url}/auth/validate",
-                json={"token": "not-even-a-jwt"}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Malformed token accepted"}
-                    
+            status, _, _ = await self._request(
+                "POST", "/auth/validate", {"token": "not-even-a-jwt"}
+            )
+            if status == 200:
+                return {"status": "FAIL", "message": "Malformed token accepted"}
+                
             # Test with missing token
-            async with self.session.post(
-                f"{self.base_url}/auth/validate",
-                json={}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Missing token accepted"}
-                    
+            status, _, _ = await self._request("POST", "/auth/validate", {})
+            if status == 200:
+                return {"status": "FAIL", "message": "Missing token accepted"}
+                
             # Test protected endpoint without auth
-            async with self.session.get(
-                f"{self.base_url}/auth/user"
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Protected endpoint accessible without auth"}
-                elif resp.status != 401:
-                    pass  # Could be 403 or other auth error
+            status, _, _ = await self._request("GET", "/auth/user")
+            if status == 200:
+                return {"status": "FAIL", "message": "Protected endpoint accessible without auth"}
+            elif status != 401:
+                pass  # Could be 403 or other auth error
                     
             return {"status": "PASS", "message": "JWT token validation working properly"}
             
@@ -148,22 +394,18 @@ class SecurityTestSuite:
         """Test token expiration handling"""
         try:
             # Test refresh endpoint without valid refresh token
-            async with self.session.post(
-                f"{self.base_url}/auth/refresh",
-                json={"refresh_token": "expired_or_invalid_token"}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Invalid refresh token accepted"}
-                elif resp.status != 401:
-                    pass  # Different error code is acceptable
-                    
+            status, _, _ = await self._request(
+                "POST", "/auth/refresh", {"refresh_token": "expired_or_invalid_token"}
+            )
+            if status == 200:
+                return {"status": "FAIL", "message": "Invalid refresh token accepted"}
+            elif status != 401:
+                pass  # Different error code is acceptable
+                
             # Test with missing refresh token
-            async with self.session.post(
-                f"{self.base_url}/auth/refresh",
-                json={}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Missing refresh token accepted"}
+            status, _, _ = await self._request("POST", "/auth/refresh", {})
+            if status == 200:
+                return {"status": "FAIL", "message": "Missing refresh token accepted"}
                     
             return {"status": "PASS", "message": "Token expiration properly handled"}
             
@@ -174,17 +416,16 @@ class SecurityTestSuite:
         """Test refresh token security mechanisms"""
         try:
             # Since we can't do full OAuth flow in test, we check the endpoint behavior
-            async with self.session.post(
-                f"{self.base_url}/auth/refresh",
-                json={"refresh_token": "test_refresh_token"}
-            ) as resp:
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Test token shouldn't be valid"}
-                elif resp.status == 401:
-                    # Proper rejection of invalid token
-                    return {"status": "PASS", "message": "Refresh tokens properly validated"}
-                else:
-                    return {"status": "WARN", "message": f"Unexpected status: {resp.status}"}
+            status, _, _ = await self._request(
+                "POST", "/auth/refresh", {"refresh_token": "test_refresh_token"}
+            )
+            if status == 200:
+                return {"status": "FAIL", "message": "Test token shouldn't be valid"}
+            elif status == 401:
+                # Proper rejection of invalid token
+                return {"status": "PASS", "message": "Refresh tokens properly validated"}
+            else:
+                return {"status": "WARN", "message": f"Unexpected status: {status}"}
                     
         except Exception as e:
             return {"status": "ERROR", "message": str(e)}
@@ -193,28 +434,28 @@ class SecurityTestSuite:
         """Test Gmail OAuth flow security"""
         try:
             # Test OAuth initialization endpoint
-            async with self.session.post(f"{self.base_url}/auth/gmail-oauth") as resp:
-                if resp.status != 200:
-                    return {"status": "WARN", "message": f"OAuth init returned: {resp.status}"}
-                data = await resp.json()
+            status, body, _ = await self._request("POST", "/auth/gmail-oauth")
+            if status != 200:
+                return {"status": "WARN", "message": f"OAuth init returned: {status}"}
+            data = orjson.loads(body)
+            
+            # Check for required OAuth fields
+            auth_url = data.get("auth_url") or data.get("authorization_url")
+            if not auth_url:
+                return {"status": "FAIL", "message": "No auth URL in OAuth response"}
+                
+            # Verify it's a proper Google OAuth URL
+            if "accounts.google.com" not in auth_url:
+                return {"status": "FAIL", "message": "Invalid OAuth provider URL"}
+                
+            # Check for state parameter (CSRF protection)
+            if "state=" not in auth_url:
+                return {"status": "FAIL", "message": "No state parameter (CSRF vulnerability)"}
+                
+            # Check for proper scopes
+            if "gmail" not in auth_url.lower():
+                return {"status": "WARN", "message": "Gmail scope may be missing"}
                 
-                # Check for required OAuth fields
-                auth_url = data.get("auth_url") or data.get("authorization_url")
-                if not auth_url:
-                    return {"status": "FAIL", "message": "No auth URL in OAuth response"}
-                    
-                # Verify it's a proper Google OAuth URL
-                if "accounts.google.com" not in auth_url:
-                    return {"status": "FAIL", "message": "Invalid OAuth provider URL"}
-                    
-                # Check for state parameter (CSRF protection)
-                if "state=" not in auth_url:
-                    return {"status": "FAIL", "message": "No state parameter (CSRF vulnerability)"}
-                    
-                # Check for proper scopes
-                if "gmail" not in auth_url.lower():
-                    return {"status": "WARN", "message": "Gmail scope may be missing"}
-                    
             return {"status": "PASS", "message": "OAuth flow properly configured"}
             
         except Exception as e:
@@ -224,21 +465,17 @@ class SecurityTestSuite:
         """Test session isolation and management"""
         try:
             # Test logout endpoint
-            async with self.session.post(
-                f"{self.base_url}/auth/logout"
-            ) as resp:
-                # Should require authentication
-                if resp.status == 200:
-                    return {"status": "FAIL", "message": "Logout worked without auth"}
-                elif resp.status == 401:
-                    pass  # Expected - requires auth
-                    
+            status, _, _ = await self._request("POST", "/auth/logout")
+            # Should require authentication
+            if status == 200:
+                return {"status": "FAIL", "message": "Logout worked without auth"}
+            elif status == 401:
+                pass  # Expected - requires auth
+                
             # Test session endpoints
-            async with self.session.get(
-                f"{self.base_url}/sessions/active"
-            ) as resp:
-                if resp.status != 200:
-                    return {"status": "WARN", "message": "Sessions endpoint not accessible"}
+            status, _, _ = await self._request("GET", "/sessions/active")
+            if status != 200:
+                return {"status": "WARN", "message": "Sessions endpoint not accessible"}
                     
             return {"status": "PASS", "message": "Session management working"}
             
@@ -255,35 +492,19 @@ class SecurityTestSuite:
     async def test_input_validation(self) -> Dict:
         """Test that all API inputs are properly validated"""
         try:
-            test_cases = [
-                # SQL injection attempts
-                {"endpoint": "/newsletters/parse", "method": "POST",
-                 "data": {"html_content": "'; DROP TABLE users; --"}},
-                # XSS attempts
-                {"endpoint": "/newsletters/parse", "method": "POST",
-                 "data": {"html_content": "<script>alert('XSS')</script>"}},
-                # Invalid data types
-                {"endpoint": "/briefing/not_a_number/pause", "method": "POST", 
-                 "data": {}},
-                # Missing required fields
-                {"endpoint": "/newsletters/fetch", "method": "POST", 
-                 "data": {}},  # Missing user_id
-                # Invalid JSON
-                {"endpoint": "/briefing/start", "method": "POST",
-                 "data": {"newsletter_ids": "not_an_array"}},
-            ]
-            
-            failures = []
-            for test in test_cases:
-                if test["method"] == "POST":
-                    async with self.session.post(
-                        f"{self.base_url}{test['endpoint']}",
-                        json=test["data"]
-                    ) as resp:
-                        if resp.status == 200:
-                            failures.append(f"Accepted invalid input: {test['endpoint']}")
-                        elif resp.status >= 500:
-                            failures.append(f"Server error on bad input: {test['endpoint']}")
+            async def probe(test: Dict, body: bytes) -> Optional[str]:
+                if test["method"] != "POST":
+                    return None
+                status, _, _ = await self._request("POST", test['endpoint'], body)
+                if status == 200:
+                    return f"Accepted invalid input: {test['endpoint']}"
+                elif status >= 500:
+                    return f"Server error on bad input: {test['endpoint']}"
+                return None
+            
+            # Probes are independent, so send them all at once
+            outcomes = await asyncio.gather(*(probe(test, body) for test, body in _INPUT_VALIDATION_BODIES))
+            failures = [failure for failure in outcomes if failure]
                             
             if failures:
                 return {"status": "FAIL", "message": f"Validation issues: {'; '.join(failures)}"}
@@ -296,34 +517,32 @@ class SecurityTestSuite:
     async def test_sql_injection_prevention(self) -> Dict:
         """Test SQL injection attack prevention"""
         try:
-            sql_payloads = [
-                "'; DROP TABLE users; --",
-                "1' OR '1'='1",
-                "admin'--",
-                "1; SELECT * FROM users",
-                "' UNION SELECT * FROM users--"
-            ]
-            
-            vulnerabilities = []
-            
-            for payload in sql_payloads:
-                # Try SQL injection in various endpoints
-                endpoints = [
+            async def probe_sql(endpoint: str) -> Optional[str]:
+                async with self.session.get(endpoint) as resp:
+                    if resp.status == 200:
+                        return f"Potential SQL injection: {endpoint}"
+                    elif resp.status >= 500:
+                        text = await resp.text()
+                        if "sql" in text.lower() or "query" in text.lower():
+                            return f"SQL error exposed: {endpoint}"
+                return None
+            
+            # Try SQL injection in various endpoints, all probes at once
+            endpoints = [
+                endpoint
+                for payload in _SQL_PAYLOADS
+                for endpoint in (
                     f"/users/{payload}/newsletters",
                     f"/users/{payload}/preferences",
-                ]
-                
-                for endpoint in endpoints:
-                    try:
-                        async with self.session.get(f"{self.base_url}{endpoint}") as resp:
-                            if resp.status == 200:
-                                vulnerabilities.append(f"Potential SQL injection: {endpoint}")
-                            elif resp.status >= 500:
-                                text = await resp.text()
-                                if "sql" in text.lower() or "query" in text.lower():
-                                    vulnerabilities.append(f"SQL error exposed: {endpoint}")
-                    except:
-                        pass  # Ignore connection errors
+                )
+            ]
+            outcomes = await asyncio.gather(
+                *(probe_sql(endpoint) for endpoint in endpoints),
+                return_exceptions=True,  # Ignore connection errors
+            )
+            vulnerabilities = [
+                outcome for outcome in outcomes if isinstance(outcome, str)
+            ]
                         
             if vulnerabilities:
                 return {"status": "FAIL", "message": f"SQL injection found: {'; '.join(vulnerabilities)}"}
@@ -336,31 +555,16 @@ class SecurityTestSuite:
     async def test_xss_prevention(self) -> Dict:
         """Test XSS attack prevention"""
         try:
-            xss_payloads = [
-                "<script>alert('XSS')</script>",
-                "<img src=x onerror=alert('XSS')>",
-                "<svg onload=alert('XSS')>",
-                "javascript:alert('XSS')",
-                "<iframe src='javascript:alert(\"XSS\")'>"
-            ]
-            
-            vulnerabilities = []
-            
-            for payload in xss_payloads:
+            async def probe_xss(payload: str, request_body: bytes) -> Optional[str]:
                 # Try XSS in newsletter parsing
-                async with self.session.post(
-                    f"{self.base_url}/newsletters/parse",
-                    json={"html_content": payload}
-                ) as resp:
-                    if resp.status == 200:
-                        try:
-                            data = await resp.json()
-                            # Check if script tags are in response
-                            response_str = json.dumps(data)
-                            if "<script>" in response_str or "alert(" in response_str:
-                                vulnerabilities.append(f"XSS in parse: {payload[:30]}")
-                        except:
-                            pass
+                status, body, _ = await self._request("POST", "/newsletters/parse", request_body)
+                # Check if script tags are in response
+                if status == 200 and await self._scan(_reflects_script, body):
+                    return f"XSS in parse: {payload[:30]}"
+                return None
+            
+            outcomes = await asyncio.gather(*(probe_xss(payload, body) for payload, body in _XSS_BODIES))
+            vulnerabilities = [outcome for outcome in outcomes if outcome]
                             
             if vulnerabilities:
                 return {"status": "FAIL", "message": f"XSS vulnerabilities: {'; '.join(vulnerabilities)}"}
@@ -374,18 +578,13 @@ class SecurityTestSuite:
         """Test API rate limiting"""
         try:
             # Make rapid requests to test rate limiting
-            endpoint = f"{self.base_url}/health"
-            rate_limited = False
-            server_errors = 0
+            endpoint = "/health"
             
-            # Make 100 rapid requests
-            for i in range(100):
-                async with self.session.get(endpoint) as resp:
-                    if resp.status == 429:  # Too Many Requests
-                        rate_limited = True
-                        break
-                    elif resp.status >= 500:
-                        server_errors += 1
+            # Make 100 requests as a concurrent burst, so the server actually
+            # sees a high request rate rather than one request at a time
+            statuses = await self._burst_statuses(endpoint, 100)
+            rate_limited = 429 in statuses  # Too Many Requests
+            server_errors = sum(status is None or status >= 500 for status in statuses)
                     
             if server_errors > 10:
                 return {"status": "FAIL", "message": f"Server errors under load: {server_errors}"}
@@ -402,42 +601,38 @@ class SecurityTestSuite:
     async def test_cors_configuration(self) -> Dict:
         """Test CORS configuration"""
         try:
-            # Test CORS headers
-            test_origins = [
-                ("http://evil.com", False),  # Should be blocked
-                ("http://localhost:3000", True),  # Should be allowed for dev
-                ("http://localhost:19006", True),  # React Native dev
-            ]
+            # Test CORS headers; every preflight (including the credentials
+            # check) is sent at once, then the rules run over the results
+            test_origins = _CORS_ORIGINS + ((_CORS_CREDENTIALS_ORIGIN, True),)
+            responses = await asyncio.gather(*(
+                self._request("OPTIONS", "/health", headers={"Origin": origin})
+                for origin, _ in test_origins
+            ))
             
             issues = []
             
-            for origin, should_allow in test_origins:
-                async with self.session.options(
-                    f"{self.base_url}/health",
-                    headers={"Origin": origin}
-                ) as resp:
-                    cors_header = resp.headers.get("Access-Control-Allow-Origin")
+            for (origin, should_allow), (_, _, headers) in zip(
+                _CORS_ORIGINS, responses[:len(_CORS_ORIGINS)], strict=True
+            ):
+                cors_header = headers.get("Access-Control-Allow-Origin")
+                
+                if cors_header == "*":
+                    if not should_allow:
+                        issues.append("CORS allows all origins (security risk)")
+                elif cors_header == origin:
+                    if not should_allow:
+                        issues.append(f"CORS allows untrusted origin: {origin}")
+                elif should_allow and cors_header != origin and cors_header != "*":
+                    # This is OK - more restrictive than expected
+                    pass
                     
-                    if cors_header == "*":
-                        if not should_allow:
-                            issues.append("CORS allows all origins (security risk)")
-                    elif cors_header == origin:
-                        if not should_allow:
-                            issues.append(f"CORS allows untrusted origin: {origin}")
-                    elif should_allow and cors_header != origin and cors_header != "*":
-                        # This is OK - more restrictive than expected
-                        pass
-                        
             # Check for credentials with wildcard
-            async with self.session.options(
-                f"{self.base_url}/health",
-                headers={"Origin": "http://localhost:3000"}
-            ) as resp:
-                allow_origin = resp.headers.get("Access-Control-Allow-Origin")
-                allow_creds = resp.headers.get("Access-Control-Allow-Credentials")
-                
-                if allow_origin == "*" and allow_creds == "true":
-                    issues.append("CORS allows credentials with wildcard origin (critical)")
+            _, _, headers = responses[-1]
+            allow_origin = headers.get("Access-Control-Allow-Origin")
+            allow_creds = headers.get("Access-Control-Allow-Credentials")
+            
+            if allow_origin == "*" and allow_creds == "true":
+                issues.append("CORS allows credentials with wildcard origin (critical)")
                     
             if issues:
                 return {"status": "FAIL", "message": f"CORS issues: {'; '.join(issues)}"}
@@ -453,30 +648,14 @@ class SecurityTestSuite:
             leaks = []
             
             # Test various error scenarios
-            test_cases = [
-                {"endpoint": "/newsletters/999999", "method": "GET"},
-                {"endpoint": "/briefing/session/invalid", "method": "GET"},
-                {"endpoint": "/audio/999999", "method": "GET"},
-                {"endpoint": "/nonexistent", "method": "GET"},
-            ]
-            
-            for test in test_cases:
-                async with self.session.get(
-                    f"{self.base_url}{test['endpoint']}"
-                ) as resp:
+            for endpoint in _ERROR_ENDPOINTS:
+                async with self.session.get(endpoint) as resp:
                     if resp.status >= 400:
                         try:
-                            error_text = await resp.text()
                             # Check for sensitive info in errors
-                            sensitive_patterns = [
-                                "traceback", "file \"", "line ", 
-                                "psycopg", "sqlalchemy", "asyncpg",
-                                "secret", "api_key", "password"
-                            ]
-                            for pattern in sensitive_patterns:
-                                if pattern in error_text.lower():
-                                    leaks.append(f"{test['endpoint']}: May expose {pattern}")
-                                    break
+                            exposed = await _body_search(resp, _SENSITIVE_PATTERNS)
+                            if exposed:
+                                leaks.append(f"{endpoint}: May expose {exposed.lower()}")
                         except:
                             pass
                             
@@ -496,17 +675,18 @@ class SecurityTestSuite:
             issues = []
             
             # Check security headers
-            async with self.session.get(f"{self.base_url}/health") as resp:
-                headers = resp.headers
-                
-                # Check for security headers
-                if not headers.get("X-Content-Type-Options"):
-                    issues.append("Missing X-Content-Type-Options header")
-                if not headers.get("X-Frame-Options"):
-                    issues.append("Missing X-Frame-Options header")
-                if not headers.get("Strict-Transport-Security"):
-                    # OK for local dev, but should be present in production
-                    issues.append("No HSTS header (configure in production)")
+            status, _, headers = await self._request("GET", "/health")
+            if status == RATE_LIMITED:
+                return {"status": "WARN", "message": "Inconclusive: /health was rate limited"}
+            
+            # Check for security headers
+            if not headers.get("X-Content-Type-Options"):
+                issues.append("Missing X-Content-Type-Options header")
+            if not headers.get("X-Frame-Options"):
+                issues.append("Missing X-Frame-Options header")
+            if not headers.get("Strict-Transport-Security"):
+                # OK for local dev, but should be present in production
+                issues.append("No HSTS header (configure in production)")
                     
             if len(issues) > 2:
                 return {"status": "FAIL", "message": f"Security headers missing: {'; '.join(issues)}"}
@@ -527,35 +707,22 @@ class SecurityTestSuite:
             ]
             
             exposed_keys = []
+            rate_limited = []
             
             for endpoint in endpoints_to_check:
-                async with self.session.get(f"{self.base_url}{endpoint}") as resp:
-                    if resp.status == 200:
-                        text = await resp.text()
-                        # Check for common API key patterns
-                        dangerous_patterns = [
-                            "sk-",  # OpenAI
-                            "xi-",  # ElevenLabs  
-                            "\"api_key\"",
-                            "\"apiKey\"",
-                            "\"API_KEY\"",
-                            "\"secret\"",
-                            "supabase",
-                            "openai",
-                            "elevenlabs"
-                        ]
-                        for pattern in dangerous_patterns:
-                            if pattern in text:
-                                # Check if it's actually a key or just a service name
-                                if pattern in ["openai", "elevenlabs", "supabase"]:
-                                    # These are OK if just service status
-                                    if f'"{pattern}": "healthy"' in text or f'"{pattern}":"healthy"' in text:
-                                        continue
-                                exposed_keys.append(f"{endpoint}: {pattern}")
-                                break
+                status, body, _ = await self._request("GET", endpoint)
+                if status == RATE_LIMITED:
+                    rate_limited.append(endpoint)
+                elif status == 200:
+                    # Check for common API key patterns
+                    pattern = await self._scan(_find_exposed_key, body)
+                    if pattern:
+                        exposed_keys.append(f"{endpoint}: {pattern}")
                             
             if exposed_keys:
                 return {"status": "FAIL", "message": f"Potential API key exposure: {', '.join(exposed_keys)}"}
+            if rate_limited:
+                return {"status": "WARN", "message": f"Inconclusive, rate limited: {', '.join(rate_limited)}"}
                 
             return {"status": "PASS", "message": "API keys properly secured"}
             
@@ -565,25 +732,27 @@ class SecurityTestSuite:
     async def test_user_data_privacy(self) -> Dict:
         """Test user data protection"""
         try:
-            # Test unauthorized access attempts
-            test_cases = [
-                "/users/1/newsletters",
-                "/users/999/preferences",
-                "/briefing/999/state",
-            ]
+            # Test unauthorized access attempts, all at once
+            responses = await asyncio.gather(*(
+                self._request("GET", endpoint) for endpoint in _PRIVATE_ENDPOINTS
+            ))
             
             issues = []
-            
-            for endpoint in test_cases:
-                async with self.session.get(f"{self.base_url}{endpoint}") as resp:
-                    # These should require auth or return 404
-                    if resp.status == 200:
-                        issues.append(f"Unauthorized access to: {endpoint}")
-                    elif resp.status >= 500:
-                        issues.append(f"Server error on: {endpoint}")
+            rate_limited = []
+            
+            for endpoint, (status, _, _) in zip(_PRIVATE_ENDPOINTS, responses, strict=True):
+                # These should require auth or return 404
+                if status == 200:
+                    issues.append(f"Unauthorized access to: {endpoint}")
+                elif status >= 500:
+                    issues.append(f"Server error on: {endpoint}")
+                elif status == RATE_LIMITED:
+                    rate_limited.append(endpoint)
                         
             if issues:
                 return {"status": "FAIL", "message": f"Privacy issues: {'; '.join(issues)}"}
+            if rate_limited:
+                return {"status": "WARN", "message": f"Inconclusive, rate limited: {'; '.join(rate_limited)}"}
                 
             return {"status": "PASS", "message": "User data properly protected"}
             
@@ -594,18 +763,24 @@ class SecurityTestSuite:
         """Test that audio files are access-controlled"""
         try:
             # Try to access audio without authentication
-            test_ids = [1, 999, "invalid"]
+            responses = await asyncio.gather(*(
+                self._request("GET", f"/audio/{audio_id}") for audio_id in _AUDIO_IDS
+            ))
             
             issues = []
-            
-            for audio_id in test_ids:
-                async with self.session.get(f"{self.base_url}/audio/{audio_id}") as resp:
-                    if resp.status == 200:
-                        issues.append(f"Audio {audio_id} accessible without auth")
-                    # 401 or 404 are both acceptable
+            rate_limited = []
+            
+            for audio_id, (status, _, _) in zip(_AUDIO_IDS, responses, strict=True):
+                if status == 200:
+                    issues.append(f"Audio {audio_id} accessible without auth")
+                elif status == RATE_LIMITED:
+                    rate_limited.append(f"audio {audio_id}")
+                # 401 or 404 are both acceptable
                         
             if issues:
                 return {"status": "FAIL", "message": f"Audio access issues: {'; '.join(issues)}"}
+            if rate_limited:
+                return {"status": "WARN", "message": f"Inconclusive, rate limited: {'; '.join(rate_limited)}"}
                 
             return {"status": "PASS", "message": "Audio files properly access-controlled"}
             
@@ -625,31 +800,17 @@ class SecurityTestSuite:
             db_leaks = []
             
             for endpoint in test_endpoints:
-                async with self.session.get(f"{self.base_url}{endpoint}") as resp:
+                async with self.session.get(endpoint) as resp:
                     if resp.status >= 400:
                         try:
-                            error_text = await resp.text()
-                            db_patterns = [
-                                "postgres", "psycopg", "sqlalchemy", 
-                                "asyncpg", "database", "connection",
-                                "syntax error", "query"
-                            ]
-                            for pattern in db_patterns:
-                                if pattern in error_text.lower():
-                                    db_leaks.append(f"DB info in: {endpoint}")
-                                    break
+                            if await _body_search(resp, _DB_PATTERNS):
+                                db_leaks.append(f"DB info in: {endpoint}")
                         except:
                             pass
                             
             # Test for connection pool exhaustion (reduced load)
-            errors = 0
-            for _ in range(50):  # Reduced from 100
-                try:
-                    async with self.session.get(f"{self.base_url}/health") as resp:
-                        if resp.status >= 500:
-                            errors += 1
-                except Exception:
-                    errors += 1
+            statuses = await self._burst_statuses("/health", 50)  # Reduced from 100
+            errors = sum(status is None or status >= 500 for status in statuses)
             
             if errors > 5:
                 db_leaks.append(f"Connection pool issues ({errors} errors)")
@@ -665,27 +826,25 @@ class SecurityTestSuite:
     async def test_authentication_bypass(self) -> Dict:
         """Test for authentication bypass vulnerabilities"""
         try:
-            # Additional test for auth bypass attempts
-            bypass_attempts = [
-                # Try with Authorization header variations
-                {"header": "Authorization", "value": "Bearer "},
-                {"header": "Authorization", "value": "Bearer null"},
-                {"header": "Authorization", "value": "Bearer undefined"},
-                {"header": "X-User-Id", "value": "1"},  # Try to spoof user ID
-            ]
+            # Additional test for auth bypass attempts, all at once
+            responses = await asyncio.gather(*(
+                self._request("GET", "/auth/user", headers=headers)
+                for _, _, headers in _AUTH_BYPASS_ATTEMPTS
+            ))
             
             issues = []
+            rate_limited = []
             
-            for attempt in bypass_attempts:
-                async with self.session.get(
-                    f"{self.base_url}/auth/user",
-                    headers={attempt["header"]: attempt["value"]}
-                ) as resp:
-                    if resp.status == 200:
-                        issues.append(f"Auth bypass with: {attempt['header']}={attempt['value']}")
+            for (header, value, _), (status, _, _) in zip(_AUTH_BYPASS_ATTEMPTS, responses, strict=True):
+                if status == 200:
+                    issues.append(f"Auth bypass with: {header}={value}")
+                elif status == RATE_LIMITED:
+                    rate_limited.append(f"{header}={value}")
                         
             if issues:
                 return {"status": "FAIL", "message": f"Auth bypass found: {'; '.join(issues)}"}
+            if rate_limited:
+                return {"status": "WARN", "message": f"Inconclusive, rate limited: {'; '.join(rate_limited)}"}
                 
             return {"status": "PASS", "message": "No authentication bypass vulnerabilities"}
             
@@ -697,65 +856,47 @@ class SecurityTestSuite:
     async def run_all_tests(self):
         """Execute all security tests"""
         
+        # Tests within a category are independent and run concurrently;
+        # results are printed in the listed order once the category finishes.
+        # The load tests run last, one at a time: their bursts can trip the
+        # rate limiter, and a 429 answering another test's access probe
+        # would otherwise read as "access denied"
+        
         # Authentication Security Tests (6 tests)
-        await self.run_test("authentication_security", 
-                           "JWT Token Security", 
-                           self.test_jwt_token_security)
-        await self.run_test("authentication_security", 
-                           "Token Expiration", 
-                           self.test_token_expiration)
-        await self.run_test("authentication_security", 
-                           "Refresh Token Security", 
-                           self.test_refresh_token_security)
-        await self.run_test("authentication_security", 
-                           "OAuth Security", 
-                           self.test_oauth_security)
-        await self.run_test("authentication_security", 
-                           "Session Management", 
-                           self.test_session_management)
-        await self.run_test("authentication_security", 
-                           "Password Security", 
-                           self.test_password_security)
+        await self.run_category("authentication_security", [
+            ("JWT Token Security", self.test_jwt_token_security),
+            ("Token Expiration", self.test_token_expiration),
+            ("Refresh Token Security", self.test_refresh_token_security),
+            ("OAuth Security", self.test_oauth_security),
+            ("Session Management", self.test_session_management),
+            ("Password Security", self.test_password_security),
+        ])
+        
+        # API Security Tests (5 tests + Rate Limiting below)
+        await self.run_category("api_security", [
+            ("Input Validation", self.test_input_validation),
+            ("SQL Injection Prevention", self.test_sql_injection_prevention),
+            ("XSS Prevention", self.test_xss_prevention),
+            ("CORS Configuration", self.test_cors_configuration),
+            ("Error Message Security", self.test_error_message_security),
+        ])
         
-        # API Security Tests (6 tests)
-        await self.run_test("api_security", 
-                           "Input Validation", 
-                           self.test_input_validation)
-        await self.run_test("api_security", 
-                           "SQL Injection Prevention", 
-                           self.test_sql_injection_prevention)
-        await self.run_test("api_security", 
-                           "XSS Prevention", 
-                           self.test_xss_prevention)
-        await self.run_test("api_security", 
-                           "Rate Limiting", 
-                           self.test_rate_limiting)
-        await self.run_test("api_security", 
-                           "CORS Configuration", 
-                           self.test_cors_configuration)
-        await self.run_test("api_security", 
-                           "Error Message Security", 
-                           self.test_error_message_security)
+        # Data Security Tests (5 tests + Database Security below)
+        await self.run_category("data_security", [
+            ("Data Encryption", self.test_data_encryption),
+            ("API Key Security", self.test_api_key_security),
+            ("User Data Privacy", self.test_user_data_privacy),
+            ("Audio File Security", self.test_audio_file_security),
+            ("Authentication Bypass", self.test_authentication_bypass),
+        ])
         
-        # Data Security Tests (6 tests)
-        await self.run_test("data_security", 
-                           "Data Encryption", 
-                           self.test_data_encryption)
-        await self.run_test("data_security", 
-                           "API Key Security", 
-                           self.test_api_key_security)
-        await self.run_test("data_security", 
-                           "User Data Privacy", 
-                           self.test_user_data_privacy)
-        await self.run_test("data_security", 
-                           "Audio File Security", 
-                           self.test_audio_file_security)
-        await self.run_test("data_security", 
-                           "Database Security", 
-                           self.test_database_security)
-        await self.run_test("data_security",
-                           "Authentication Bypass",
-                           self.test_authentication_bypass)
+        # Load tests, after every other probe has finished
+        await self.run_category("api_security", [
+            ("Rate Limiting", self.test_rate_limiting),
+        ])
+        await self.run_category("data_security", [
+            ("Database Security", self.test_database_security),
+        ])
         
         self.print_results()
         
@@ -820,9 +961,9 @@ class SecurityTestSuite:
             
         print("="*80)
         
-async def main():
+async def main(workers: int = 0):
     """Main test runner"""
-    suite = SecurityTestSuite()
+    suite = SecurityTestSuite(workers=workers)
     await suite.setup()
     
     try:
@@ -831,4 +972,15 @@ async def main():
         await suite.teardown()
         
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Phase 4 security tests")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="threads for CPU-bound response checks (default: run them on the event loop)",
+    )
+    args = parser.parse_args()
+    
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main(args.workers))
\ No newline at end of file
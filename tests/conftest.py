@@ -45,6 +45,19 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_in_process_caches():
+    """Reset in-process caches so tests don't see each other's users or stories."""
+    from backend.services import session_manager
+    from backend.utils import auth
+
+    auth._payload_cache.clear()
+    auth._user_cache.clear()
+    auth._user_cache_locks.clear()
+    session_manager._story_cache.clear()
+    yield
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create test database engine."""
@@ -3,7 +3,7 @@ Tests for authentication and OAuth flow functionality.
 """
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 from datetime import datetime, timezone, timedelta
 
 from backend.utils.auth import (
@@ -55,11 +55,84 @@ class TestJWTTokens:
         with pytest.raises(AuthError, match="Invalid token type"):
             verify_token(access_token, "refresh")
 
+    def test_verify_token_rejects_wrong_type_before_verifying(self):
+        """Test a wrong-type token is rejected without a signature check."""
+        from backend.utils import auth
+
+        refresh_token = create_refresh_token({"sub": "user-wrong-type"})
+
+        with patch.object(
+            auth._jwt_decoder, "decode", wraps=auth._jwt_decoder.decode
+        ) as mock_decode:
+            with pytest.raises(AuthError, match="Invalid token type"):
+                verify_token(refresh_token, "access")
+
+        mock_decode.assert_not_called()
+
     def test_verify_token_invalid_token(self):
         """Test token verification with invalid token."""
         with pytest.raises(AuthError, match="Invalid token"):
             verify_token("invalid.token.here", "access")
 
+    def test_verify_token_uses_payload_cache(self, test_user):
+        """Test repeated verification is served from the payload cache."""
+        token_data = {"sub": str(test_user.id), "email": test_user.email}
+        token = create_access_token(token_data)
+
+        first = verify_token(token, "access")
+        with patch("backend.utils.auth._jwt_decoder.decode") as mock_decode:
+            second = verify_token(token, "access")
+
+        mock_decode.assert_not_called()
+        assert second == first
+
+    def test_verify_token_decodes_uncached_token_once(self):
+        """Test an uncached token is verified with a single decode."""
+        from backend.utils import auth
+
+        token = create_access_token({"sub": "user-decode-once"})
+
+        with patch.object(
+            auth._jwt_decoder, "decode", wraps=auth._jwt_decoder.decode
+        ) as mock_decode:
+            payload = verify_token(token, "access")
+
+        mock_decode.assert_called_once()
+        assert payload["sub"] == "user-decode-once"
+
+    def test_verify_token_rejects_other_algorithms(self):
+        """Test a token signed with the right key but another alg is rejected."""
+        import jwt
+
+        from backend.utils import auth
+
+        token = jwt.encode(
+            {"sub": "user-1", "type": "access"}, auth._JWT_KEY, algorithm="HS512"
+        )
+
+        with pytest.raises(AuthError, match="Invalid token"):
+            verify_token(token, "access")
+
+    def test_verify_token_returns_independent_copies(self):
+        """Test modifying a returned payload never changes the cached one."""
+        token = create_access_token({"sub": "user-1"})
+
+        first = verify_token(token, "access")
+        first["sub"] = "tampered"
+        second = verify_token(token, "access")
+
+        assert second["sub"] != "tampered"
+        assert second is not first
+
+    def test_verify_token_cached_payload_checks_type(self, test_user):
+        """Test cached payloads still enforce the expected token type."""
+        token_data = {"sub": str(test_user.id), "email": test_user.email}
+        access_token = create_access_token(token_data)
+        verify_token(access_token, "access")
+
+        with pytest.raises(AuthError, match="Invalid token type"):
+            verify_token(access_token, "refresh")
+
     def test_generate_state_token(self):
         """Test OAuth state token generation."""
         token1 = generate_state_token()
@@ -237,6 +310,58 @@ class TestAuthRoutes:
             assert data["name"] == "Updated Name"
 
 
+class TestUserCache:
+    """Test the in-process authenticated user cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_user_is_read_only_snapshot(self, test_user):
+        """Test the cache hands out an immutable copy, not the ORM object."""
+        import dataclasses
+        from contextlib import asynccontextmanager
+
+        from backend.utils.auth import get_user_by_id_cached
+
+        @asynccontextmanager
+        async def fake_session():
+            yield Mock()
+
+        with (
+            patch("backend.utils.auth.get_async_session", fake_session),
+            patch(
+                "backend.utils.auth.get_user_by_id", AsyncMock(return_value=test_user)
+            ),
+        ):
+            cached = await get_user_by_id_cached(str(test_user.id))
+
+        assert cached is not test_user
+        assert cached.id == test_user.id
+        assert cached.name == test_user.name
+
+        test_user.name = "Unsaved Name"
+        assert cached.name != "Unsaved Name"
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cached.name = "Changed"
+
+    def test_expired_entry_drops_its_lock(self, test_user):
+        """Test an expired cache entry takes its load lock with it."""
+        import asyncio
+        import time
+
+        from backend.utils import auth
+
+        user_id = str(test_user.id)
+        auth._user_cache[user_id] = (
+            auth.CachedUser.from_user(test_user),
+            time.monotonic() - 1,
+        )
+        auth._user_cache_locks[user_id] = asyncio.Lock()
+
+        assert auth._get_cached_user(user_id) is None
+        assert user_id not in auth._user_cache
+        assert user_id not in auth._user_cache_locks
+
+
 class TestAuthMiddleware:
     """Test authentication middleware functionality."""
 
@@ -292,28 +417,33 @@ class TestAuthMiddleware:
 class TestGoogleOAuthIntegration:
     """Test Google OAuth integration functions."""
 
-    @patch("backend.utils.auth.build")
-    def test_get_google_user_info(self, mock_build):
+    @pytest.mark.asyncio
+    @patch("backend.utils.auth._get_http_client")
+    async def test_get_google_user_info(self, mock_get_client):
         """Test getting user info from Google API."""
-        from backend.utils.auth import get_google_user_info
+        from backend.utils.auth import GOOGLE_USERINFO_URL, get_google_user_info
 
         # Setup mock
-        mock_service = Mock()
-        mock_userinfo = Mock()
-        mock_userinfo.get.return_value.execute.return_value = {
+        mock_response = Mock()
+        mock_response.json.return_value = {
             "email": "test@example.com",
             "name": "Test User",
             "id": "12345",
         }
-        mock_service.userinfo.return_value = mock_userinfo
-        mock_build.return_value = mock_service
+        mock_client = Mock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
 
         mock_credentials = Mock()
-        result = get_google_user_info(mock_credentials)
+        mock_credentials.token = "test-access-token"
+        result = await get_google_user_info(mock_credentials)
 
         assert result["email"] == "test@example.com"
         assert result["name"] == "Test User"
-        mock_build.assert_called_once_with("oauth2", "v2", credentials=mock_credentials)
+        mock_client.get.assert_awaited_once_with(
+            GOOGLE_USERINFO_URL,
+            headers={"Authorization": "Bearer test-access-token"},
+        )
 
     @patch("backend.utils.auth.Flow.from_client_config")
     def test_create_oauth_flow(self, mock_flow_class):
@@ -0,0 +1,56 @@
+"""
+Tests for structured logging configuration.
+"""
+
+import json
+
+
+class TestQueuedJSONLogging:
+    """Test JSON file logging through the background queue listener."""
+
+    def test_logged_exception_keeps_exception_field(self, tmp_path):
+        """Test a logged exception is written to its own "exception" key."""
+        from backend.utils import logging_config
+
+        log_file = tmp_path / "app.log"
+        logger = logging_config.setup_logging(
+            app_name="test-json-exception",
+            log_level="INFO",
+            log_file=str(log_file),
+            enable_console=False,
+            enable_json=True,
+        )
+
+        try:
+            raise ZeroDivisionError("division by zero")
+        except ZeroDivisionError:
+            logger.exception("Failed to %s", "divide")
+
+        # Stopping the listener drains the queue and flushes the file
+        logging_config._queue_listeners.pop("test-json-exception").stop()
+
+        record = json.loads(log_file.read_text().splitlines()[-1])
+        assert record["message"] == "Failed to divide"
+        assert "ZeroDivisionError" in record["exception"]
+
+
+class TestFastRotatingFileHandler:
+    """Test in-memory size tracking for log rotation."""
+
+    def test_size_counts_encoded_bytes(self, tmp_path):
+        """Test non-ASCII records are counted in bytes, matching the file size."""
+        import logging
+
+        from backend.utils.logging_config import FastRotatingFileHandler
+
+        log_file = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(
+            str(log_file), maxBytes=1000, backupCount=1, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        for message in ("ascii line", "café " * 20, "日本語のログ"):
+            handler.emit(logging.makeLogRecord({"msg": message}))
+        handler.close()
+
+        assert handler._size == log_file.stat().st_size
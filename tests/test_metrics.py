@@ -0,0 +1,130 @@
+"""
+Tests for in-process metrics collection.
+"""
+
+from backend.utils.metrics import ApplicationMetrics, MetricsCollector
+
+
+class TestMetricsCollectorStorage:
+    """Test the array-backed counter, gauge and timer storage."""
+
+    def test_snapshot_pairs_keys_with_values_after_new_keys(self):
+        """Test snapshots keep keys and values aligned as keys are added."""
+        collector = MetricsCollector()
+        collector.increment("requests")
+        collector.increment("requests", 2, tags={"endpoint": "/a"})
+        first = dict(collector.counters.snapshot())
+
+        collector.increment("errors", 5)
+        collector.increment("requests")
+        second = dict(collector.counters.snapshot())
+
+        assert first == {
+            ("requests", None): 1,
+            ("requests", frozenset({("endpoint", "/a")})): 2,
+        }
+        assert second == {
+            ("requests", None): 2,
+            ("requests", frozenset({("endpoint", "/a")})): 2,
+            ("errors", None): 5,
+        }
+
+    def test_exported_keys_use_name_and_sorted_tags(self):
+        """Test metric keys render as "name,k=v" with tags sorted by name."""
+        collector = MetricsCollector()
+        collector.increment(
+            "api.requests.total", tags={"method": "GET", "endpoint": "/health"}
+        )
+        collector.gauge("websocket.active", 3)
+
+        metrics = collector.get_metrics()
+
+        assert metrics["counters"] == {
+            "api.requests.total,endpoint=/health,method=GET": 1
+        }
+        assert metrics["gauges"] == {"websocket.active": 3}
+
+    def test_timer_trimming_keeps_newest_samples(self):
+        """Test timers drop their oldest samples once past the cap."""
+        collector = MetricsCollector(max_timer_samples=8)
+        for i in range(100):
+            collector.record_duration("job", float(i))
+
+        samples = list(collector.timers[("job", None)])
+        stats = collector.get_metrics()["timers"]["job"]
+
+        assert 8 <= len(samples) <= collector._timer_trim_threshold
+        assert samples == [float(i) for i in range(100 - len(samples), 100)]
+        assert stats["count"] == len(samples)
+        assert stats["max"] == 99.0
+
+
+class TestApplicationMetrics:
+    """Test application-level metric tracking."""
+
+    def test_cached_api_handles_match_direct_increments(self):
+        """Test repeat API tracking through cached handles counts like increment()."""
+        requests = [
+            ("/health", "GET", 200, 0.01),
+            ("/health", "GET", 200, 0.02),
+            ("/briefing", "POST", 404, 0.03),
+            ("/briefing", "POST", 503, 0.04),
+            ("/health", "GET", 200, 0.05),
+        ]
+
+        app_metrics = ApplicationMetrics()
+        direct = MetricsCollector()
+        for endpoint, method, status_code, duration in requests:
+            app_metrics.track_api_request(endpoint, method, status_code, duration)
+
+            direct.increment(
+                "api.requests.total", tags={"endpoint": endpoint, "method": method}
+            )
+            direct.increment(f"api.requests.status.{status_code}")
+            if status_code >= 500:
+                direct.increment("api.errors.5xx", tags={"endpoint": endpoint})
+            elif status_code >= 400:
+                direct.increment("api.errors.4xx", tags={"endpoint": endpoint})
+            direct.record_duration(
+                "api.request.duration", duration, tags={"endpoint": endpoint}
+            )
+
+        tracked = app_metrics.collector.get_metrics()
+        expected = direct.get_metrics()
+
+        assert tracked["counters"] == expected["counters"]
+        assert tracked["timers"] == expected["timers"]
+
+    def test_health_report_error_rate_sums_tagged_counters(self):
+        """Test the error rate counts tagged request and error counters."""
+        app_metrics = ApplicationMetrics()
+        for _ in range(18):
+            app_metrics.track_api_request("/health", "GET", 200, 0.01)
+        app_metrics.track_api_request("/briefing", "POST", 404, 0.01)
+        app_metrics.track_api_request("/briefing", "POST", 503, 0.01)
+
+        report = app_metrics.get_health_report()
+
+        assert report["error_rate"] == 10.0
+        assert report["status"] == "unhealthy"
+
+        app_metrics.track_api_request("/health", "GET", 200, 0.01)
+        assert app_metrics.get_health_report()["status"] == "degraded"
+
+    def test_health_report_services_follow_gauges_after_reset(self):
+        """Test service flags come from the health gauges, including after reset."""
+        app_metrics = ApplicationMetrics()
+        app_metrics.update_health_status("database", True)
+        app_metrics.update_health_status("gmail", True)
+
+        services = app_metrics.get_health_report()["services"]
+        assert services == {
+            "database": True,
+            "redis": False,
+            "elevenlabs": False,
+            "gmail": True,
+        }
+
+        app_metrics.collector.reset()
+
+        assert not any(app_metrics.get_health_report()["services"].values())
@@ -4,7 +4,7 @@ Unit tests for service layer components without database dependencies.
 
 import pytest
 import uuid
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, create_autospec, patch
 from datetime import datetime, timezone
 
 
@@ -236,6 +236,394 @@ class TestStorageServiceLogic:
                 
             assert content_type == expected_type
 
+    @pytest.mark.asyncio
+    async def test_listing_lock_released_after_load(self):
+        """Test concurrent listing misses share one call and leave no lock behind."""
+        import asyncio
+
+        from storage3._async.file_api import AsyncBucketProxy
+
+        from backend.services.storage_service import StorageService
+
+        service = StorageService()
+        bucket = create_autospec(AsyncBucketProxy, instance=True)
+        bucket.list.return_value = [{"name": "a.mp3"}]
+        service.supabase_client = Mock()
+        service.supabase_client.storage.from_.return_value = bucket
+
+        first, second = await asyncio.gather(
+            service._list_directory("stories", 100, "name"),
+            service._list_directory("stories", 100, "name"),
+        )
+
+        assert first == second == {"a.mp3": {"name": "a.mp3"}}
+        bucket.list.assert_awaited_once_with(
+            "stories",
+            {"limit": 100, "offset": 0, "sortBy": {"column": "name", "order": "asc"}},
+        )
+        assert service._listing_locks == {}
+
+
+
+class TestStorageServiceUploads:
+    """Test streamed audio uploads against a mocked storage endpoint."""
+
+    @staticmethod
+    def _make_service(handler):
+        """Build a storage service whose HTTP client is served by handler."""
+        import httpx
+
+        from backend.services.storage_service import StorageService
+
+        service = StorageService()
+        service.supabase_client = Mock()
+        service.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service.upload_chunk_size = 4
+        return service
+
+    @pytest.mark.asyncio
+    async def test_streamed_upload_sends_body_and_headers(self):
+        """Test the chunked POST carries the payload, auth and metadata headers."""
+        import base64
+        import json
+
+        import httpx
+
+        from backend.config import get_config
+
+        requests = []
+
+        async def handler(request):
+            await request.aread()
+            requests.append(request)
+            return httpx.Response(200, json={"Key": "ok"})
+
+        service = self._make_service(handler)
+        story_id = uuid.uuid4()
+
+        public_url = await service.upload_audio_file(
+            b"0123456789", story_id, "mp3", metadata={"voice": "test"}
+        )
+
+        (request,) = requests
+        file_path = public_url.removeprefix(service.base_url)
+        assert request.method == "POST"
+        assert str(request.url) == (
+            f"{get_config().supabase_url}/storage/v1/object/"
+            f"{service.bucket_name}/{file_path}"
+        )
+        assert request.content == b"0123456789"
+        assert request.headers["content-type"] == "audio/mp3"
+        assert request.headers["x-upsert"] == "true"
+        assert request.headers["authorization"].startswith("Bearer ")
+        assert request.headers["apikey"]
+
+        metadata = json.loads(base64.b64decode(request.headers["x-metadata"]))
+        assert metadata["story_id"] == str(story_id)
+        assert metadata["file_size"] == 10
+        assert metadata["voice"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_each_source_type_streams_the_same_body(self):
+        """Test bytes, file objects and chunk factories upload identical bodies."""
+        import io
+
+        import httpx
+
+        bodies = []
+
+        async def handler(request):
+            bodies.append(await request.aread())
+            return httpx.Response(200)
+
+        async def chunks():
+            yield b"01234"
+            yield b"56789"
+
+        service = self._make_service(handler)
+        for source in (b"0123456789", io.BytesIO(b"0123456789"), chunks):
+            await service.upload_audio_file(source, uuid.uuid4())
+
+        assert bodies == [b"0123456789"] * 3
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_rejected_for_every_source_type(self):
+        """Test max_file_size is enforced for bytes, file objects and factories."""
+        import io
+
+        import httpx
+
+        completed = []
+
+        async def handler(request):
+            await request.aread()
+            completed.append(request)
+            return httpx.Response(200)
+
+        async def chunks():
+            yield b"01234"
+            yield b"56789"
+
+        service = self._make_service(handler)
+        service.max_file_size = 8
+
+        for source in (b"0123456789", io.BytesIO(b"0123456789"), chunks):
+            with pytest.raises(ValueError, match="exceeds maximum"):
+                await service.upload_audio_file(source, uuid.uuid4())
+
+            # The streaming check applies even when the size wasn't known up front
+            with pytest.raises(ValueError, match="exceeds maximum"):
+                async for _ in service._iter_upload_chunks(source):
+                    pass
+
+        assert completed == []
+
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """Test a 4xx response fails the upload after a single attempt."""
+        import httpx
+
+        from backend.services.storage_service import StorageService
+
+        attempts = []
+
+        async def handler(request):
+            await request.aread()
+            attempts.append(request)
+            return httpx.Response(403)
+
+        service = self._make_service(handler)
+        with patch.object(StorageService, "_compute_backoff", return_value=0):
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.upload_audio_file(b"audio", uuid.uuid4())
+
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_retried_up_to_the_limit(self):
+        """Test 5xx responses are retried until max_retries attempts fail."""
+        import httpx
+
+        from backend.services.storage_service import StorageService
+
+        attempts = []
+
+        async def handler(request):
+            await request.aread()
+            attempts.append(request)
+            return httpx.Response(503)
+
+        service = self._make_service(handler)
+        with patch.object(
+            StorageService, "_compute_backoff", return_value=0
+        ) as backoff:
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.upload_audio_file(b"audio", uuid.uuid4())
+
+        assert len(attempts) == service.max_retries
+        # One backoff between attempts, none after the last
+        assert [call.args[0] for call in backoff.call_args_list] == list(
+            range(service.max_retries - 1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_retried_up_to_the_limit(self):
+        """Test timeouts are retried until max_retries attempts fail."""
+        import httpx
+
+        from backend.services.storage_service import StorageService
+
+        attempts = []
+
+        async def handler(request):
+            await request.aread()
+            attempts.append(request)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        service = self._make_service(handler)
+        with patch.object(StorageService, "_compute_backoff", return_value=0):
+            with pytest.raises(httpx.ReadTimeout):
+                await service.upload_audio_file(b"audio", uuid.uuid4())
+
+        assert len(attempts) == service.max_retries
+
+    @pytest.mark.asyncio
+    async def test_upload_succeeds_after_a_transient_error(self):
+        """Test an upload that fails once with a 5xx succeeds on retry."""
+        import httpx
+
+        from backend.services.storage_service import StorageService
+
+        statuses = iter([500, 200])
+
+        async def handler(request):
+            await request.aread()
+            return httpx.Response(next(statuses))
+
+        service = self._make_service(handler)
+        with patch.object(StorageService, "_compute_backoff", return_value=0):
+            public_url = await service.upload_audio_file(b"audio", uuid.uuid4())
+
+        assert public_url.startswith(service.base_url)
+
+    def test_backoff_delay_stays_within_bounds(self):
+        """Test full-jitter delays stay within [0, min(max, base * 2**attempt)]."""
+        from backend.services.storage_service import StorageService
+
+        service = StorageService()
+        for attempt in range(10):
+            ceiling = min(
+                service.retry_max_delay, service.retry_base_delay * 2**attempt
+            )
+            for _ in range(50):
+                assert 0 <= service._compute_backoff(attempt) <= ceiling
+
+        with patch("backend.services.storage_service.random.uniform") as uniform:
+            uniform.side_effect = lambda low, high: high
+            assert service._compute_backoff(0) == service.retry_base_delay
+            assert service._compute_backoff(20) == service.retry_max_delay
+
+
+    def test_locally_signed_url_round_trips(self):
+        """Test local signing quotes the URL and sets the claims Storage verifies."""
+        import httpx
+        import jwt
+
+        from backend.services import storage_service as storage_module
+
+        service = storage_module.StorageService()
+        file_path = "stories/2025/01/story 1#take 2.mp3"
+        secret = "test-storage-jwt-secret-32-bytes-long"
+
+        with patch.object(storage_module.config, "supabase_jwt_secret", secret):
+            signed_url = service._sign_url_locally(file_path, expires_in=600)
+
+        url = httpx.URL(signed_url)
+        object_path = f"{service.bucket_name}/{file_path}"
+        assert url.fragment == ""
+        assert url.path == f"/storage/v1/object/sign/{object_path}"
+        assert "%20" in signed_url and "%23" in signed_url
+
+        claims = jwt.decode(url.params["token"], secret, algorithms=["HS256"])
+        assert claims["url"] == object_path
+        assert claims["exp"] - claims["iat"] == 600
+
+
+
+class TestStorageServiceListings:
+    """Test paginated storage listings used by cleanup and usage stats."""
+
+    @staticmethod
+    def _make_service(entries):
+        """Build a storage service whose bucket lists entries page by page."""
+        from storage3._async.file_api import AsyncBucketProxy
+
+        from backend.services.storage_service import StorageService
+
+        offsets = []
+
+        async def list_page(path=None, options=None):
+            offset, limit = options["offset"], options["limit"]
+            offsets.append(offset)
+            return entries[offset : offset + limit]
+
+        # Reason: autospec against storage3 so a call shape the real client
+        # rejects fails here instead of being swallowed by the service
+        bucket = create_autospec(AsyncBucketProxy, instance=True)
+        bucket.list.side_effect = list_page
+        bucket.remove.side_effect = lambda paths: paths
+
+        service = StorageService()
+        service.supabase_client = Mock()
+        service.supabase_client.storage.from_.return_value = bucket
+        service.list_page_size = 50
+        return service, bucket, offsets
+
+    @staticmethod
+    def _entries(count, created_at, prefix="old"):
+        """Build storage listing entries of 10 bytes each."""
+        return [
+            {
+                "name": f"{prefix}-{i}.mp3",
+                "created_at": created_at,
+                "metadata": {"size": 10},
+            }
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_listing_pages_use_storage3_options(self):
+        """Test listing pages pass limit, offset and ascending sort as options."""
+        entries = self._entries(60, "2024-01-01T00:00:00")
+        service, bucket, _ = self._make_service(entries)
+
+        pages = [page async for page in service._iter_list_pages("", "created_at")]
+
+        assert [len(page) for page in pages] == [50, 10]
+        assert bucket.list.await_args_list[1].args == (
+            "",
+            {
+                "limit": 50,
+                "offset": 50,
+                "sortBy": {"column": "created_at", "order": "asc"},
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_usage_stats_page_through_listing(self):
+        """Test usage stats count files on every page of a listing."""
+        entries = self._entries(120, "2024-01-01T00:00:00")
+        entries.append({"name": "folder", "created_at": None, "metadata": None})
+        service, _, offsets = self._make_service(entries)
+
+        usage = await service.get_storage_usage()
+
+        assert offsets == [0, 50, 100]
+        assert usage["total_files"] == 120
+        assert usage["total_size_bytes"] == 1200
+        assert usage["average_file_size_bytes"] == 10
+
+    @pytest.mark.asyncio
+    async def test_cleanup_pages_until_cutoff(self):
+        """Test cleanup pages oldest-first and stops at the first recent file."""
+        recent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        entries = self._entries(70, "2020-01-01T00:00:00") + self._entries(
+            200, recent, prefix="new"
+        )
+        service, bucket, offsets = self._make_service(entries)
+
+        deleted = await service.cleanup_old_files(days_old=30)
+
+        assert deleted == 70
+        assert offsets == [0, 50]
+        removed = [
+            name for call in bucket.remove.await_args_list for name in call.args[0]
+        ]
+        assert removed == [f"old-{i}.mp3" for i in range(70)]
+
+
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_in_batches_and_survives_partial_failure(self):
+        """Test 250 old files go out in batches of 100 and a failed batch is skipped."""
+        entries = self._entries(250, "2020-01-01T00:00:00")
+        service, bucket, offsets = self._make_service(entries)
+
+        async def remove(paths):
+            if "old-100.mp3" in paths:
+                raise RuntimeError("storage unavailable")
+            return paths
+
+        bucket.remove = AsyncMock(side_effect=remove)
+
+        deleted = await service.cleanup_old_files(days_old=30)
+
+        assert offsets == [0, 50, 100, 150, 200, 250]
+        batch_sizes = sorted(len(call.args[0]) for call in bucket.remove.await_args_list)
+        assert batch_sizes == [50, 100, 100]
+        # The second batch (old-100 .. old-199) failed; the others still count
+        assert deleted == 150
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
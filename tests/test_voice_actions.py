@@ -207,6 +207,63 @@ class TestConversationalQueryAction:
             or "don't have context" in result.lower()
         )
 
+    def test_bare_trigger_phrases_route_to_local_actions(self):
+        """Test a bare trigger phrase, with filler words, skips the LLM."""
+        from backend.voice.actions.conversational_query_action import (
+            ConversationalQueryAction,
+        )
+
+        with patch.object(
+            ConversationalQueryAction,
+            "_shared_local_action",
+            side_effect=lambda action_type: action_type,
+        ):
+            assert (
+                ConversationalQueryAction._get_local_action(
+                    "Can you tell me more about it, please?"
+                )
+                == "action_tell_more"
+            )
+            assert (
+                ConversationalQueryAction._get_local_action("expand on that")
+                == "action_tell_more"
+            )
+            assert (
+                ConversationalQueryAction._get_local_action("Where is this from?")
+                == "action_metadata"
+            )
+
+    def test_specific_questions_reach_the_llm(self):
+        """Test questions that only mention a trigger phrase are not routed."""
+        from backend.voice.actions.conversational_query_action import (
+            ConversationalQueryAction,
+        )
+
+        specific_questions = [
+            "tell me more about the CEO's background",
+            "expand on the funding round",
+            "what's the full story with the layoffs",
+            "how does the expansion affect jobs",
+            "next story please, and tell me more",
+        ]
+
+        for question in specific_questions:
+            assert ConversationalQueryAction._get_local_action(question) is None
+
+    def test_trigger_free_queries_skip_per_action_patterns(self):
+        """Test a query with no trigger phrase never runs the per-action scans."""
+        from backend.voice.actions import conversational_query_action as module
+
+        patterns = {action_type: Mock() for action_type in module._LOCAL_PHRASE_PATTERNS}
+        with patch.dict(module._LOCAL_PHRASE_PATTERNS, patterns):
+            local_action = module.ConversationalQueryAction._get_local_action(
+                "Why did the central bank hold rates?"
+            )
+
+        assert local_action is None
+        for pattern in patterns.values():
+            pattern.subn.assert_not_called()
+
 
 class TestBaseBriefingAction:
     """Test BaseBriefingAction functionality."""
@@ -436,6 +493,24 @@ class TestSessionManager:
             assert story == test_story
             assert story.headline == test_story.headline
 
+    @pytest.mark.asyncio
+    async def test_cached_story_is_detached(self, db_session, test_session, test_story):
+        """Test stories shared through the cache are detached with their issue loaded."""
+        from sqlalchemy import inspect
+
+        from backend.services.session_manager import (
+            BriefingSessionManager,
+            _get_cached_story,
+        )
+
+        session_manager = BriefingSessionManager(db_session)
+        story = await session_manager.get_current_story(test_session.id)
+
+        assert _get_cached_story(test_story.id) is story
+        assert inspect(story).detached
+        assert inspect(story.issue).detached
+        assert story.issue.newsletter.name == "Test Newsletter"
+
     @pytest.mark.asyncio
     async def test_advance_story(self, db_session, test_session):
         """Test advancing to next story."""
@@ -527,6 +602,20 @@ class TestVoiceActionErrorHandling:
 class TestPhraseMatching:
     """Test phrase matching for voice commands."""
 
+    def test_agent_config_builds_phrase_triggers(self):
+        """Test the module imports and builds one trigger per configured phrase."""
+        from backend.voice import agent_config
+
+        triggers = agent_config._SKIP_TRIGGERS.config.phrase_triggers
+
+        assert [trigger.phrase for trigger in triggers] == list(
+            agent_config.SKIP_PHRASES
+        )
+        assert all(
+            trigger.conditions == ["phrase_condition_type_contains"]
+            for trigger in triggers
+        )
+
     def test_skip_phrase_matching(self):
         """Test skip command phrase matching."""
         from backend.voice.agent_config import match_skip_phrases
@@ -571,3 +660,111 @@ class TestPhraseMatching:
 
         for phrase in test_phrases:
             assert match_metadata_phrases(phrase) == True
+
+
+class TestSemanticQueryCache:
+    """Test semantic response cache for conversational queries."""
+
+    def test_similar_query_hits_cache(self):
+        """Test a near-identical embedding returns the cached response."""
+        from backend.voice.semantic_cache import SemanticQueryCache, normalize
+
+        cache = SemanticQueryCache(similarity_threshold=0.92)
+        cache.store("story-1", normalize([1.0, 0.0, 0.0]), "cached answer")
+
+        assert cache.lookup("story-1", normalize([0.99, 0.05, 0.0])) == "cached answer"
+
+    def test_dissimilar_query_or_other_story_misses(self):
+        """Test misses for unrelated questions and other stories."""
+        from backend.voice.semantic_cache import SemanticQueryCache, normalize
+
+        cache = SemanticQueryCache(similarity_threshold=0.92)
+        cache.store("story-1", normalize([1.0, 0.0, 0.0]), "cached answer")
+
+        assert cache.lookup("story-1", normalize([0.0, 1.0, 0.0])) is None
+        assert cache.lookup("story-2", normalize([1.0, 0.0, 0.0])) is None
+
+    def test_expired_entries_are_ignored(self):
+        """Test entries past their TTL are not returned."""
+        from backend.voice.semantic_cache import SemanticQueryCache, normalize
+
+        cache = SemanticQueryCache(ttl_seconds=10)
+        with patch("backend.voice.semantic_cache.time.monotonic", return_value=100.0):
+            cache.store("story-1", normalize([1.0, 0.0]), "cached answer")
+        with patch("backend.voice.semantic_cache.time.monotonic", return_value=111.0):
+            assert cache.lookup("story-1", normalize([1.0, 0.0])) is None
+
+    def test_entries_per_story_are_capped(self):
+        """Test the oldest response is evicted once a story is full."""
+        from backend.voice.semantic_cache import SemanticQueryCache, normalize
+
+        cache = SemanticQueryCache(max_entries_per_story=2)
+        cache.store("story-1", normalize([1.0, 0.0, 0.0]), "first")
+        cache.store("story-1", normalize([0.0, 1.0, 0.0]), "second")
+        cache.store("story-1", normalize([0.0, 0.0, 1.0]), "third")
+
+        assert cache.lookup("story-1", normalize([1.0, 0.0, 0.0])) is None
+        assert cache.lookup("story-1", normalize([0.0, 0.0, 1.0])) == "third"
+
+
+class TestBriefingActionFactory:
+    """Test action instance reuse in BriefingActionFactory."""
+
+    def test_actions_are_reused_per_factory_only(self):
+        """Test a factory reuses its actions but never shares them."""
+        from backend.voice import conversation_manager
+
+        action_config = Mock(type="action_test")
+        with patch.dict(
+            conversation_manager._ACTION_CLASSES,
+            {"action_test": ("unittest.mock", "Mock")},
+        ):
+            first = conversation_manager.BriefingActionFactory()
+            second = conversation_manager.BriefingActionFactory()
+
+            action = first.create_action(action_config)
+
+            assert first.create_action(action_config) is action
+            assert second.create_action(action_config) is not action
+
+
+class TestBackpressureWebSocket:
+    """Test stale audio dropping on the voice WebSocket."""
+
+    @pytest.mark.asyncio
+    async def test_stale_audio_dropped_for_slow_client(self):
+        """Test sequential sends queue without blocking and drop the oldest audio."""
+        import asyncio
+
+        from backend.voice.conversation_manager import BackpressureWebSocket
+
+        release = asyncio.Event()
+        sent = []
+
+        async def slow_send_text(data):
+            await release.wait()
+            sent.append(data)
+
+        audio = [f'{{"type": "websocket_audio", "data": "{i:040d}"}}' for i in range(5)]
+        transcript = '{"type": "websocket_transcript", "text": "hello"}'
+        websocket = BackpressureWebSocket(
+            Mock(send_text=slow_send_text), max_pending_bytes=len(audio[0]) + 10
+        )
+
+        # Sent one after another, as Vocode's output device does; none of
+        # them may wait on the slow client
+        await asyncio.wait_for(websocket.send_text(audio[0]), timeout=1)
+        await asyncio.sleep(0)  # writer picks up the first chunk and blocks
+        for message in (audio[1], transcript, audio[2], audio[3], audio[4]):
+            await asyncio.wait_for(websocket.send_text(message), timeout=1)
+
+        assert websocket.pending_bytes <= websocket.max_pending_bytes
+
+        release.set()
+        await asyncio.wait_for(websocket.drain(), timeout=1)
+
+        assert sent == [audio[0], transcript, audio[4]]
+        assert websocket.dropped_bytes == 3 * len(audio[0])
+        assert websocket.pending_bytes == 0
+
+        await websocket.stop()